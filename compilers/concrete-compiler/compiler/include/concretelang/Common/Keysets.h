@@ -50,6 +50,19 @@ struct ServerKeyset {
   Message<concreteprotocol::ServerKeyset> toProto() const;
 };
 
+/// @brief Options of the generation of a keyset from seeds.
+struct KeysetGenerationOptions {
+  /// Number of threads generating evaluation keys concurrently, 0 to use all
+  /// the hardware threads. With a single thread, evaluation keys are generated
+  /// sequentially from a single CSPRNG, as with the constructor taking CSPRNGs.
+  size_t threads = 1;
+
+  /// Called once a key is generated, with the number of generated keys and
+  /// the total number of keys. Calls are never concurrent, but they can happen
+  /// from any of the generating threads.
+  std::function<void(size_t, size_t)> progress = nullptr;
+};
+
 struct Keyset {
   ServerKeyset server;
   ClientKeyset client;
@@ -72,6 +85,27 @@ struct Keyset {
          std::map<uint32_t, LweSecretKey> lweSecretKeys =
              std::map<uint32_t, LweSecretKey>());
 
+  /// @brief Generates a keyset from infos and seeds, with independent keys
+  /// generated concurrently.
+  ///
+  /// Secret keys are generated in order from `secretSeed`, as with the
+  /// constructor taking CSPRNGs. With a single thread, evaluation keys are
+  /// generated in order from `encryptionSeed` as well, so the keyset is the
+  /// same as with the constructor taking CSPRNGs. With more threads, each
+  /// evaluation key is encrypted with its own CSPRNG, seeded from
+  /// `encryptionSeed` and the position of the key, so the keyset only depends
+  /// on the seeds, and not on the number of threads.
+  ///
+  /// @param info
+  /// @param secretSeed seed of the secret keys, 0 for a random seed
+  /// @param encryptionSeed seed of the evaluation keys, 0 for a random seed
+  /// @param lweSecretKeys secret keys to initialize the keyset with
+  /// @param options
+  Keyset(const Message<concreteprotocol::KeysetInfo> &info,
+         __uint128_t secretSeed, __uint128_t encryptionSeed,
+         std::map<uint32_t, LweSecretKey> lweSecretKeys,
+         const KeysetGenerationOptions &options);
+
   Keyset(ServerKeyset server, ClientKeyset client)
       : server(server), client(client) {}
 
@@ -91,7 +125,8 @@ public:
   getKeyset(const Message<concreteprotocol::KeysetInfo> &keysetInfo,
             __uint128_t secret_seed, __uint128_t encryption_seed,
             std::map<uint32_t, LweSecretKey> lweSecretKeys =
-                std::map<uint32_t, LweSecretKey>());
+                std::map<uint32_t, LweSecretKey>(),
+            const KeysetGenerationOptions &options = KeysetGenerationOptions());
 
 private:
   KeysetCache() = default;
@@ -185,6 +185,27 @@ template <typename MessageType> struct Message {
     return outcome::success();
   }
 
+  /// Returns the size of the binary representation of the message in bytes.
+  size_t binarySize() const {
+    return capnp::computeSerializedSizeInWords(*regionBuilder) *
+           sizeof(capnp::word);
+  }
+
+  /// Writes the binary representation of the message to a buffer, which must
+  /// be at least `binarySize()` bytes long.
+  Result<void> writeBinaryToArray(kj::ArrayPtr<kj::byte> output) const {
+    try {
+      kj::ArrayOutputStream stream(output);
+      capnp::writeMessage(stream, *regionBuilder);
+      return outcome::success();
+    } catch (const kj::Exception &e) {
+      return StringError("Failed to write message to array: ")
+             << e.getDescription().cStr();
+    } catch (...) {
+      return StringError("Failed to write message to array.");
+    }
+  }
+
   Result<std::string> writeBinaryToString() const {
     auto ostream = std::ostringstream();
     OUTCOME_TRYV(this->writeBinaryToOstream(ostream));
@@ -242,6 +263,22 @@ template <typename MessageType> struct Message {
     return this->readBinaryFromIstream(istream, options);
   }
 
+  /// Reads the binary representation of the message from words, in place.
+  Result<void>
+  readBinaryFromWords(kj::ArrayPtr<const capnp::word> input,
+                      capnp::ReaderOptions options = capnp::ReaderOptions()) {
+    try {
+      capnp::FlatArrayMessageReader reader(input, options);
+      *this = reader.getRoot<MessageType>();
+      return outcome::success();
+    } catch (const kj::Exception &e) {
+      return StringError("Failed to read message from words: ")
+             << e.getDescription().cStr();
+    } catch (...) {
+      return StringError("Failed to read message from words.");
+    }
+  }
+
   Result<void> readJsonFromString(const std::string &input) {
     try {
       capnp::JsonCodec json;
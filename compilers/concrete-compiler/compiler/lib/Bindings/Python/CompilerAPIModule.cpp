@@ -116,6 +116,79 @@ bool checkCudaDeviceAvailable() {
   return mlir::concretelang::gpu_dfg::check_cuda_device_available();
 }
 
+/// View a buffer of serialized messages as words, so they can be read in
+/// place. Buffers which are not aligned are copied to `copy` first.
+kj::ArrayPtr<const capnp::word> asWords(const void *data, size_t size,
+                                        kj::Array<capnp::word> &copy) {
+  if (reinterpret_cast<uintptr_t>(data) % sizeof(capnp::word) == 0 &&
+      size % sizeof(capnp::word) == 0) {
+    return kj::ArrayPtr<const capnp::word>(
+        reinterpret_cast<const capnp::word *>(data),
+        size / sizeof(capnp::word));
+  }
+
+  copy = kj::heapArray<capnp::word>((size + sizeof(capnp::word) - 1) /
+                                    sizeof(capnp::word));
+  std::memset(copy.begin(), 0, copy.size() * sizeof(capnp::word));
+  std::memcpy(copy.begin(), data, size);
+  return copy.asPtr();
+}
+
+/// Request a buffer which is read or written as a flat array of bytes, which
+/// requires it to be contiguous (e.g., not a strided or a reversed memoryview).
+pybind11::buffer_info requestContiguousBuffer(const pybind11::buffer &buffer,
+                                              bool writable = false) {
+  auto info = buffer.request(writable);
+  auto expectedStride = info.itemsize;
+  for (auto dimension = info.ndim - 1; dimension >= 0; dimension--) {
+    if (info.shape[dimension] != 1 &&
+        info.strides[dimension] != expectedStride) {
+      throw std::invalid_argument("Expected a contiguous buffer");
+    }
+    expectedStride *= info.shape[dimension];
+  }
+  return info;
+}
+
+/// Deserialize a server keyset from serialized words, read in place.
+ServerKeyset deserializeServerKeyset(const void *data, size_t size) {
+  kj::Array<capnp::word> copy;
+  try {
+    capnp::FlatArrayMessageReader reader(
+        asWords(data, size, copy), mlir::concretelang::python::DESER_OPTIONS);
+    return ServerKeyset::fromProto(
+        reader.getRoot<concreteprotocol::ServerKeyset>());
+  } catch (const kj::Exception &e) {
+    throw std::runtime_error(
+        std::string("Failed to deserialize server keyset.") +
+        e.getDescription().cStr());
+  }
+}
+
+/// Deserialize a server keyset from a file, which is read at once into a
+/// buffer of words that is parsed in place.
+ServerKeyset deserializeServerKeysetFromFile(const std::string &path) {
+  std::ifstream ifs(path, std::ios::binary | std::ios::ate);
+  if (!ifs.good()) {
+    throw std::runtime_error("Failed to open server keyset file " + path);
+  }
+
+  size_t size = ifs.tellg();
+  if (size == 0) {
+    throw std::runtime_error("Failed to read server keyset file " + path);
+  }
+
+  auto words = kj::heapArray<capnp::word>((size + sizeof(capnp::word) - 1) /
+                                          sizeof(capnp::word));
+  std::memset(words.begin(), 0, words.size() * sizeof(capnp::word));
+  ifs.seekg(0);
+  if (!ifs.read(reinterpret_cast<char *>(words.begin()), size)) {
+    throw std::runtime_error("Failed to read server keyset file " + path);
+  }
+
+  return deserializeServerKeyset(words.begin(), size);
+}
+
 std::string roundTrip(const char *module) {
   std::shared_ptr<mlir::concretelang::CompilationContext> ccx =
       mlir::concretelang::CompilationContext::createShared();
@@ -1548,17 +1621,28 @@ void mlir::concretelang::python::populateCompilerAPISubmodule(
   pybind11::class_<ServerKeyset>(m, "ServerKeyset")
       .def_static(
           "deserialize",
-          [](const pybind11::bytes &buffer) {
-            auto serverKeysetProto = Message<concreteprotocol::ServerKeyset>();
-            auto maybeError = serverKeysetProto.readBinaryFromString(
-                buffer, mlir::concretelang::python::DESER_OPTIONS);
-            if (maybeError.has_failure()) {
-              throw std::runtime_error("Failed to deserialize server keyset." +
-                                       maybeError.as_failure().error().mesg);
+          [](const pybind11::buffer &buffer) {
+            // the buffer is released after the keyset is deserialized
+            auto info = requestContiguousBuffer(buffer);
+            ServerKeyset serverKeyset;
+            {
+              pybind11::gil_scoped_release release;
+              serverKeyset =
+                  deserializeServerKeyset(info.ptr, info.size * info.itemsize);
             }
-            return ServerKeyset::fromProto(serverKeysetProto.asReader());
+            return serverKeyset;
           },
-          "Deserialize a ServerKeyset from bytes.", arg("bytes"))
+          "Deserialize a ServerKeyset from bytes, or any object supporting "
+          "the buffer protocol, without copying them.",
+          arg("bytes"))
+      .def_static(
+          "deserialize_from_file",
+          [](const std::string path) {
+            pybind11::gil_scoped_release release;
+            return deserializeServerKeysetFromFile(path);
+          },
+          "Deserialize a ServerKeyset from a file, which is read in place.",
+          arg("path"))
       .def(
           "serialize",
           [](ServerKeyset &serverKeyset) {
@@ -1570,9 +1654,31 @@ void mlir::concretelang::python::populateCompilerAPISubmodule(
               }
               return maybeBuffer.value();
             };
-            return pybind11::bytes(serverKeysetSerialize(serverKeyset));
+            std::string buffer;
+            {
+              pybind11::gil_scoped_release release;
+              buffer = serverKeysetSerialize(serverKeyset);
+            }
+            return pybind11::bytes(buffer);
           },
           "Serialize a ServerKeyset to bytes.")
+      .def(
+          "serialize_to_file",
+          [](ServerKeyset &serverKeyset, const std::string path) {
+            pybind11::gil_scoped_release release;
+            std::ofstream ofs;
+            ofs.open(path, std::ios::binary);
+            if (!ofs.good()) {
+              throw std::runtime_error("Failed to open server keyset file " +
+                                       path);
+            }
+            auto serverKeysetProto = serverKeyset.toProto();
+            auto maybeError = serverKeysetProto.writeBinaryToOstream(ofs);
+            if (maybeError.has_failure()) {
+              throw std::runtime_error("Failed to serialize server keyset.");
+            }
+          },
+          "Serialize a ServerKeyset to a file.", arg("path"))
       .doc() = "Server-side / Evaluation keyset";
 
   // ------------------------------------------------------------------------------//
@@ -1592,9 +1698,23 @@ void mlir::concretelang::python::populateCompilerAPISubmodule(
                    uint64_t secretSeedMsb, uint64_t secretSeedLsb,
                    uint64_t encSeedMsb, uint64_t encSeedLsb,
                    std::optional<std::map<uint32_t, LweSecretKey>>
-                       initialLweSecretKeys) {
+                       initialLweSecretKeys,
+                   size_t threads, std::optional<pybind11::function> progress) {
              SignalGuard const signalGuard;
 
+             ::concretelang::keysets::KeysetGenerationOptions options;
+             options.threads = threads;
+             if (progress.has_value()) {
+               // `progress` outlives the generation, and it's only used with
+               // the GIL held
+               options.progress = [&progress](size_t generated, size_t total) {
+                 pybind11::gil_scoped_acquire acquire;
+                 progress.value()(generated, total);
+               };
+             }
+
+             pybind11::gil_scoped_release release;
+
              auto secretSeed =
                  (((__uint128_t)secretSeedMsb) << 64) | secretSeedLsb;
              auto encryptionSeed =
@@ -1610,23 +1730,22 @@ void mlir::concretelang::python::populateCompilerAPISubmodule(
                    (*cache).getKeyset(
                        (KeysetInfo)programInfo.programInfo.asReader()
                            .getKeyset(),
-                       secretSeed, encryptionSeed,
-                       initialLweSecretKeys.value()));
+                       secretSeed, encryptionSeed, initialLweSecretKeys.value(),
+                       options));
                return std::make_unique<Keyset>(std::move(keyset));
              } else {
-               ::concretelang::csprng::SecretCSPRNG secCsprng(secretSeed);
-               ::concretelang::csprng::EncryptionCSPRNG encCsprng(
-                   encryptionSeed);
                auto keyset = Keyset(
                    (KeysetInfo)programInfo.programInfo.asReader().getKeyset(),
-                   secCsprng, encCsprng, initialLweSecretKeys.value());
+                   secretSeed, encryptionSeed, initialLweSecretKeys.value(),
+                   options);
                return std::make_unique<Keyset>(std::move(keyset));
              }
            }),
            arg("program_info"), arg("keyset_cache"), arg("secret_seed_msb") = 0,
            arg("secret_seed_lsb") = 0, arg("encryption_seed_msb") = 0,
            arg("encryption_seed_lsb") = 0,
-           arg("initial_lwe_secret_keys") = std::nullopt)
+           arg("initial_lwe_secret_keys") = std::nullopt, arg("threads") = 1,
+           arg("progress") = std::nullopt)
       .def_static(
           "deserialize",
           [](const pybind11::bytes &buffer) {
@@ -1644,6 +1763,7 @@ void mlir::concretelang::python::populateCompilerAPISubmodule(
       .def_static(
           "deserialize_from_file",
           [](const std::string path) {
+            pybind11::gil_scoped_release release;
             std::ifstream ifs;
             ifs.open(path);
             if (!ifs.good()) {
@@ -1672,12 +1792,18 @@ void mlir::concretelang::python::populateCompilerAPISubmodule(
               }
               return maybeBuffer.value();
             };
-            return pybind11::bytes(keySetSerialize(keySet));
+            std::string buffer;
+            {
+              pybind11::gil_scoped_release release;
+              buffer = keySetSerialize(keySet);
+            }
+            return pybind11::bytes(buffer);
           },
           "Serialize a Keyset to bytes.")
       .def(
           "serialize_to_file",
           [](Keyset &keySet, const std::string path) {
+            pybind11::gil_scoped_release release;
             std::ofstream ofs;
             ofs.open(path);
             if (!ofs.good()) {
@@ -1853,30 +1979,73 @@ void mlir::concretelang::python::populateCompilerAPISubmodule(
   pybind11::class_<TransportValue>(m, "TransportValue")
       .def_static(
           "deserialize",
-          [](const pybind11::bytes &buffer) {
+          [](const pybind11::buffer &buffer) {
+            // the buffer is released after the value is deserialized
+            auto info = requestContiguousBuffer(buffer);
             auto inner = TransportValue();
-            if (inner
-                    .readBinaryFromString(
-                        buffer, mlir::concretelang::python::DESER_OPTIONS)
-                    .has_failure()) {
-              throw std::runtime_error("Failed to deserialize TransportValue");
+            {
+              pybind11::gil_scoped_release release;
+              kj::Array<capnp::word> copy;
+              auto words = asWords(info.ptr, info.size * info.itemsize, copy);
+              if (inner
+                      .readBinaryFromWords(
+                          words, mlir::concretelang::python::DESER_OPTIONS)
+                      .has_failure()) {
+                throw std::runtime_error(
+                    "Failed to deserialize TransportValue");
+              }
             }
-            return TransportValue{inner};
+            return inner;
           },
-          "Deserialize a TransportValue from bytes.", arg("bytes"))
+          "Deserialize a TransportValue from bytes, or any object supporting "
+          "the buffer protocol, without copying them.",
+          arg("bytes"))
       .def(
           "serialize",
           [](const TransportValue &value) {
-            auto valueSerialize = [](const TransportValue &value) {
-              auto maybeString = value.writeBinaryToString();
-              if (maybeString.has_failure()) {
+            auto size = value.binarySize();
+            // bytes are allocated uninitialized and the value is written in
+            // them directly
+            auto result = pybind11::reinterpret_steal<pybind11::bytes>(
+                PyBytes_FromStringAndSize(nullptr, size));
+            if (!result) {
+              throw pybind11::error_already_set();
+            }
+            auto output = kj::ArrayPtr<kj::byte>(
+                reinterpret_cast<kj::byte *>(PyBytes_AS_STRING(result.ptr())),
+                size);
+            if (value.writeBinaryToArray(output).has_failure()) {
+              throw std::runtime_error("Failed to serialize TransportValue");
+            }
+            return result;
+          },
+          "Serialize a TransportValue to bytes")
+      .def("serialized_size", &TransportValue::binarySize,
+           "Return the size of the serialized TransportValue in bytes.")
+      .def(
+          "serialize_into",
+          [](const TransportValue &value, const pybind11::buffer &buffer) {
+            auto info = requestContiguousBuffer(buffer, true);
+            auto size = value.binarySize();
+            if ((size_t)(info.size * info.itemsize) < size) {
+              throw std::runtime_error(
+                  "Failed to serialize TransportValue, buffer of " +
+                  std::to_string(info.size * info.itemsize) +
+                  " bytes is too small for " + std::to_string(size) + " bytes");
+            }
+            {
+              pybind11::gil_scoped_release release;
+              auto output = kj::ArrayPtr<kj::byte>(
+                  reinterpret_cast<kj::byte *>(info.ptr), size);
+              if (value.writeBinaryToArray(output).has_failure()) {
                 throw std::runtime_error("Failed to serialize TransportValue");
               }
-              return maybeString.value();
-            };
-            return pybind11::bytes(valueSerialize(value));
+            }
+            return size;
           },
-          "Serialize a TransportValue to bytes")
+          "Serialize a TransportValue into a writable buffer, and return the "
+          "number of bytes written.",
+          arg("buffer"))
       .doc() = "Public/Transportable value.";
 
   // ------------------------------------------------------------------------------//
@@ -2079,6 +2248,7 @@ void mlir::concretelang::python::populateCompilerAPISubmodule(
       .def(
           "prepare_input",
           [](ClientCircuit &circuit, Value arg, size_t pos) {
+            pybind11::gil_scoped_release release;
             if (pos > circuit.getCircuitInfo().asReader().getInputs().size()) {
               throw std::runtime_error("Unknown position.");
             }
@@ -2093,6 +2263,7 @@ void mlir::concretelang::python::populateCompilerAPISubmodule(
       .def(
           "process_output",
           [](ClientCircuit &circuit, TransportValue result, size_t pos) {
+            pybind11::gil_scoped_release release;
             GET_OR_THROW_RESULT(auto ok, circuit.processOutput(result, pos));
             return ok;
           },
@@ -2102,6 +2273,7 @@ void mlir::concretelang::python::populateCompilerAPISubmodule(
       .def(
           "simulate_prepare_input",
           [](ClientCircuit &circuit, Value arg, size_t pos) {
+            pybind11::gil_scoped_release release;
             if (pos > circuit.getCircuitInfo().asReader().getInputs().size()) {
               throw std::runtime_error("Unknown position.");
             }
@@ -2118,6 +2290,7 @@ void mlir::concretelang::python::populateCompilerAPISubmodule(
       .def(
           "simulate_process_output",
           [](ClientCircuit &circuit, TransportValue result, size_t pos) {
+            pybind11::gil_scoped_release release;
             GET_OR_THROW_RESULT(auto ok,
                                 circuit.simulateProcessOutput(result, pos));
             return ok;
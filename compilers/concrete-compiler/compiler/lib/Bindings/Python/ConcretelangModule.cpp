@@ -65,9 +65,19 @@ PYBIND11_MODULE(_concretelang, m) {
       },
       "Register Concretelang dialects on a PyMlirContext.");
 
-  py::module fhe = m.def_submodule("_fhe", "FHE API");
-  mlir::concretelang::python::populateDialectFHESubmodule(fhe);
-
   py::module api = m.def_submodule("_compiler", "Compiler API");
   mlir::concretelang::python::populateCompilerAPISubmodule(api);
+
+  // The types of the FHE dialect derive from the classes of `mlir.ir`, so the
+  // FHE submodule is only populated on first access, for processes which only
+  // use the client API not to load the MLIR python bindings.
+  m.def("__getattr__", [m](const std::string &name) -> py::object {
+    if (name != "_fhe") {
+      throw py::attribute_error("module '_concretelang' has no attribute '" +
+                                name + "'");
+    }
+    py::module fhe = m.def_submodule("_fhe", "FHE API");
+    mlir::concretelang::python::populateDialectFHESubmodule(fhe);
+    return fhe;
+  });
 }
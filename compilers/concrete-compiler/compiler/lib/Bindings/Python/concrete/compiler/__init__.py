@@ -46,7 +46,6 @@ from mlir._mlir_libs._concretelang._compiler import (
 
 from .utils import lookup_runtime_lib
 from .compilation_feedback import MoreCircuitCompilationFeedback
-from .compilation_context import CompilationContext
 
 from .tfhers_int import TfhersExporter
 
@@ -55,6 +54,21 @@ Parameter = Union[
 ]
 
 
+def __getattr__(name: str):
+    """Load the compilation context on first use.
+
+    The compilation context depends on the MLIR python bindings, which processes that only use the
+    client classes (e.g., to encrypt and decrypt) don't need to load."""
+    if name == "CompilationContext":
+        # pylint: disable=import-outside-toplevel
+        from .compilation_context import CompilationContext
+
+        # pylint: enable=import-outside-toplevel
+        globals()[name] = CompilationContext
+        return CompilationContext
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def init_dfr():
     """Initialize dataflow parallelization.
 
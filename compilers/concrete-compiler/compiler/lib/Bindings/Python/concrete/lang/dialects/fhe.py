@@ -3,4 +3,7 @@
 
 """FHE dialect module"""
 from ._FHE_ops_gen import *
+
+# `_fhe` is populated on first access, so it is accessed before importing from it
+from mlir._mlir_libs._concretelang import _fhe
 from mlir._mlir_libs._concretelang._fhe import *
@@ -17,11 +17,17 @@
 #include "llvm/ADT/ScopeExit.h"
 #include "llvm/Support/FileSystem.h"
 #include "llvm/Support/Path.h"
+#include <algorithm>
+#include <atomic>
 #include <errno.h>
+#include <exception>
 #include <fcntl.h>
 #include <iostream>
+#include <mutex>
+#include <optional>
 #include <stdlib.h>
 #include <string>
+#include <thread>
 #include <unistd.h>
 #include <utime.h>
 
@@ -151,6 +157,190 @@ Keyset::Keyset(const Message<concreteprotocol::KeysetInfo> &info,
   }
 }
 
+namespace {
+
+uint64_t splitMix64(uint64_t x) {
+  x += 0x9e3779b97f4a7c15;
+  x = (x ^ (x >> 30)) * 0xbf58476d1ce4e5b9;
+  x = (x ^ (x >> 27)) * 0x94d049bb133111eb;
+  return x ^ (x >> 31);
+}
+
+/// Derives the seed of the CSPRNG of the evaluation key at `position` from the
+/// encryption seed of the keyset, so keys can be generated in any order.
+__uint128_t deriveEncryptionSeed(__uint128_t encryptionSeed,
+                                 uint64_t position) {
+  if (encryptionSeed == 0) {
+    // a random seed is drawn by the CSPRNG
+    return 0;
+  }
+  uint64_t lsb = (uint64_t)encryptionSeed;
+  uint64_t msb = (uint64_t)(encryptionSeed >> 64);
+  uint64_t derivedLsb = splitMix64(lsb ^ splitMix64(msb ^ (2 * position)));
+  uint64_t derivedMsb = splitMix64(msb ^ splitMix64(lsb ^ (2 * position + 1)));
+  __uint128_t derived = (((__uint128_t)derivedMsb) << 64) | derivedLsb;
+  // 0 would mean a random seed
+  return derived != 0 ? derived : 1;
+}
+
+} // namespace
+
+Keyset::Keyset(const Message<concreteprotocol::KeysetInfo> &info,
+               __uint128_t secretSeed, __uint128_t encryptionSeed,
+               std::map<uint32_t, LweSecretKey> lweSecretKeys,
+               const KeysetGenerationOptions &options) {
+  auto infoReader = info.asReader();
+  auto bootstrapKeyInfos = infoReader.getLweBootstrapKeys();
+  auto keyswitchKeyInfos = infoReader.getLweKeyswitchKeys();
+  auto packingKeyswitchKeyInfos = infoReader.getPackingKeyswitchKeys();
+
+  size_t secretKeyCount = infoReader.getLweSecretKeys().size();
+  size_t evaluationKeyCount = bootstrapKeyInfos.size() +
+                              keyswitchKeyInfos.size() +
+                              packingKeyswitchKeyInfos.size();
+  size_t total = secretKeyCount + evaluationKeyCount;
+
+  std::mutex progressMutex;
+  size_t generated = 0;
+  auto reportProgress = [&]() {
+    if (options.progress) {
+      std::lock_guard<std::mutex> guard(progressMutex);
+      options.progress(++generated, total);
+    }
+  };
+
+  // secret keys are cheap to generate, and they are generated in order from a
+  // single CSPRNG so they stay the same as with the sequential constructor
+  SecretCSPRNG secretCsprng(secretSeed);
+  for (auto keyInfo : infoReader.getLweSecretKeys()) {
+    if (lweSecretKeys.count(keyInfo.getId())) {
+      // use provided key
+      auto lweSk = lweSecretKeys.at(keyInfo.getId());
+      assert(keyInfo.toString().flatten() ==
+                 lweSk.getInfo().asReader().toString().flatten() &&
+             "provided key info doesn't match expected ones");
+      client.lweSecretKeys.push_back(lweSk);
+    } else {
+      // generate new key
+      client.lweSecretKeys.push_back(LweSecretKey(
+          (Message<concreteprotocol::LweSecretKeyInfo>)keyInfo, secretCsprng));
+    }
+    reportProgress();
+  }
+
+  std::vector<std::optional<LweBootstrapKey>> bootstrapKeys(
+      bootstrapKeyInfos.size());
+  std::vector<std::optional<LweKeyswitchKey>> keyswitchKeys(
+      keyswitchKeyInfos.size());
+  std::vector<std::optional<PackingKeyswitchKey>> packingKeyswitchKeys(
+      packingKeyswitchKeyInfos.size());
+
+  auto generateEvaluationKey = [&](size_t position,
+                                   EncryptionCSPRNG &encryptionCsprng) {
+    size_t index = position;
+    if (index < bootstrapKeyInfos.size()) {
+      auto keyInfo = bootstrapKeyInfos[index];
+      bootstrapKeys[index].emplace(
+          (Message<concreteprotocol::LweBootstrapKeyInfo>)keyInfo,
+          client.lweSecretKeys[keyInfo.getInputId()],
+          client.lweSecretKeys[keyInfo.getOutputId()], encryptionCsprng);
+      return;
+    }
+
+    index -= bootstrapKeyInfos.size();
+    if (index < keyswitchKeyInfos.size()) {
+      auto keyInfo = keyswitchKeyInfos[index];
+      keyswitchKeys[index].emplace(
+          (Message<concreteprotocol::LweKeyswitchKeyInfo>)keyInfo,
+          client.lweSecretKeys[keyInfo.getInputId()],
+          client.lweSecretKeys[keyInfo.getOutputId()], encryptionCsprng);
+      return;
+    }
+
+    index -= keyswitchKeyInfos.size();
+    auto keyInfo = packingKeyswitchKeyInfos[index];
+    packingKeyswitchKeys[index].emplace(
+        (Message<concreteprotocol::PackingKeyswitchKeyInfo>)keyInfo,
+        client.lweSecretKeys[keyInfo.getInputId()],
+        client.lweSecretKeys[keyInfo.getOutputId()], encryptionCsprng);
+  };
+
+  auto moveEvaluationKeys = [&]() {
+    for (auto &key : bootstrapKeys) {
+      server.lweBootstrapKeys.push_back(std::move(*key));
+    }
+    for (auto &key : keyswitchKeys) {
+      server.lweKeyswitchKeys.push_back(std::move(*key));
+    }
+    for (auto &key : packingKeyswitchKeys) {
+      server.packingKeyswitchKeys.push_back(std::move(*key));
+    }
+  };
+
+  if (options.threads == 1) {
+    // keys are encrypted in order from a single CSPRNG, so they are the same as
+    // with the constructor taking CSPRNGs (e.g., as in keysets cached on disk)
+    EncryptionCSPRNG encryptionCsprng(encryptionSeed);
+    for (size_t position = 0; position < evaluationKeyCount; position++) {
+      generateEvaluationKey(position, encryptionCsprng);
+      reportProgress();
+    }
+    moveEvaluationKeys();
+    return;
+  }
+
+  size_t threads = options.threads;
+  if (threads == 0) {
+    threads = std::max(1u, std::thread::hardware_concurrency());
+  }
+  threads = std::min(threads, evaluationKeyCount);
+
+  // each thread takes the next key to generate until all keys are generated,
+  // the first error stops the generation and it's rethrown by the caller
+  std::atomic<size_t> nextPosition(0);
+  std::exception_ptr error = nullptr;
+  std::mutex errorMutex;
+  auto work = [&]() {
+    while (true) {
+      size_t position = nextPosition.fetch_add(1);
+      if (position >= evaluationKeyCount) {
+        return;
+      }
+      try {
+        EncryptionCSPRNG encryptionCsprng(
+            deriveEncryptionSeed(encryptionSeed, position));
+        generateEvaluationKey(position, encryptionCsprng);
+        reportProgress();
+      } catch (...) {
+        std::lock_guard<std::mutex> guard(errorMutex);
+        if (!error) {
+          error = std::current_exception();
+        }
+        nextPosition.store(evaluationKeyCount);
+        return;
+      }
+    }
+  };
+
+  if (threads <= 1) {
+    work();
+  } else {
+    std::vector<std::thread> workers;
+    for (size_t i = 0; i < threads; i++) {
+      workers.emplace_back(work);
+    }
+    for (auto &worker : workers) {
+      worker.join();
+    }
+  }
+
+  if (error) {
+    std::rethrow_exception(error);
+  }
+
+  moveEvaluationKeys();
+}
+
 Keyset Keyset::fromProto(const Message<concreteprotocol::Keyset> &proto) {
   return fromProto(proto.asReader());
 }
@@ -372,13 +562,20 @@ KeysetCache::KeysetCache(std::string backingDirectoryPath) {
 Result<Keyset>
 KeysetCache::getKeyset(const Message<concreteprotocol::KeysetInfo> &keysetInfo,
                        __uint128_t secret_seed, __uint128_t encryption_seed,
-                       std::map<uint32_t, LweSecretKey> lweSecretKeys) {
+                       std::map<uint32_t, LweSecretKey> lweSecretKeys,
+                       const KeysetGenerationOptions &options) {
   std::string hashString = keysetInfo.asReader().toString().flatten().cStr() +
                            std::to_string((uint64_t)secret_seed) +
                            std::to_string((uint64_t)(secret_seed >> 64)) +
                            std::to_string((uint64_t)encryption_seed) +
                            std::to_string((uint64_t)(encryption_seed >> 64));
 
+  // evaluation keys generated concurrently are encrypted with CSPRNGs derived
+  // per key, so they differ from the ones generated sequentially
+  if (options.threads != 1) {
+    hashString += "ConcurrentKeygenV1";
+  }
+
   // hash initial keys if any
   if (lweSecretKeys.size()) {
     hashString += "InitSKsSig:";
@@ -447,9 +644,8 @@ KeysetCache::getKeyset(const Message<concreteprotocol::KeysetInfo> &keysetInfo,
   std::cerr << "KeySetCache: miss, regenerating " << std::string(folderPath)
             << "\n";
 
-  auto encryptionCsprng = csprng::EncryptionCSPRNG(encryption_seed);
-  auto secretCsprng = csprng::SecretCSPRNG(secret_seed);
-  Keyset keyset(keysetInfo, secretCsprng, encryptionCsprng, lweSecretKeys);
+  Keyset keyset(keysetInfo, secret_seed, encryption_seed, lweSecretKeys,
+                options);
 
   OUTCOME_TRYV(saveKeys(keyset, folderPath));
 
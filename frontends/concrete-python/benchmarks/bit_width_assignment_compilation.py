@@ -0,0 +1,112 @@
+"""
+Benchmarks of bit-width assignment during compilation of large circuits.
+"""
+
+# pylint: disable=import-error
+
+import time
+
+import numpy as np
+import py_progress_tracker as progress
+
+from concrete import fhe
+from concrete.fhe.mlir.processors import AssignBitWidths
+
+
+def targets():
+    """
+    Generates targets to benchmark.
+    """
+
+    result = []
+    for precision in ["single", "multi"]:
+        for size in [100, 1_000, 5_000]:
+            result.append(
+                {
+                    "id": (
+                        f"bit-width-assignment-compilation :: "
+                        f"{precision} precision | {size} rounds"
+                    ),
+                    "name": (
+                        f"Assigning bit-widths in {precision} precision "
+                        f"to a circuit with {size} rounds of operations"
+                    ),
+                    "parameters": {
+                        "precision": precision,
+                        "size": size,
+                    },
+                }
+            )
+    return result
+
+
+@progress.track(targets())
+def main(precision, size):
+    """
+    Benchmark a target.
+
+    Args:
+        precision:
+            "single" or "multi" precision
+
+        size:
+            number of rounds of operations in the circuit
+    """
+
+    def function(x, y):
+        for i in range(size):
+            z = (x + y) % 16
+            x = fhe.univariate(lambda v, i=i: (v * (i + 3)) % 8)(z)
+            y = np.maximum(x, y) + (x == y)
+        return x + y
+
+    configuration = fhe.Configuration(single_precision=(precision == "single"))
+    inputset = [(np.random.randint(0, 8), np.random.randint(0, 8)) for _ in range(10)]
+
+    print("Tracing...")
+    compiler = fhe.Compiler(function, {"x": "encrypted", "y": "encrypted"})
+    graph = compiler.trace(inputset, configuration)
+
+    progress.measure(
+        id="number-of-nodes",
+        label="Number of Nodes",
+        value=len(graph.graph.nodes),
+    )
+
+    for i in range(3):
+        print(f"Running subsample {i + 1} out of 3...")
+
+        graph = compiler.trace(inputset, configuration)
+        processor = AssignBitWidths(
+            single_precision=configuration.single_precision,
+            composition_rules=[],
+            comparison_strategy_preference=configuration.comparison_strategy_preference,
+            bitwise_strategy_preference=configuration.bitwise_strategy_preference,
+            shifts_with_promotion=configuration.shifts_with_promotion,
+            multivariate_strategy_preference=configuration.multivariate_strategy_preference,
+            min_max_strategy_preference=configuration.min_max_strategy_preference,
+        )
+
+        start = time.perf_counter()
+        processor.apply_many({"main": graph})
+        end = time.perf_counter()
+
+        progress.measure(
+            id="bit-width-assignment-time-ms",
+            label="Bit-Width Assignment Time (ms)",
+            value=(end - start) * 1000,
+        )
+
+        # solving the same constraints with z3, which was used for all graphs before
+        solver = graph.bit_width_constraints
+        assert solver is not None
+
+        start = time.perf_counter()
+        solver.solve_with_z3()
+        end = time.perf_counter()
+
+        progress.measure(
+            id="z3-bit-width-assignment-time-ms",
+            label="Bit-Width Assignment Time with z3 (ms)",
+            value=(end - start) * 1000,
+        )
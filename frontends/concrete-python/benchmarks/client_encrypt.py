@@ -0,0 +1,98 @@
+"""
+Benchmarks of the encryption throughput of `Client` on scalar inputs.
+"""
+
+# pylint: disable=import-error
+
+import random
+import time
+
+import py_progress_tracker as progress
+
+from concrete import fhe
+
+functions = {
+    1: (lambda x: x + 1, {"x": "encrypted"}),
+    4: (
+        lambda x, y, z, w: x + y + z + w,
+        {"x": "encrypted", "y": "encrypted", "z": "encrypted", "w": "encrypted"},
+    ),
+}
+
+
+def targets():
+    """
+    Generates targets to benchmark.
+    """
+
+    result = []
+    for bit_width in [2, 4, 8]:
+        for arity in functions:
+            result.append(
+                {
+                    "id": f"client-encrypt :: {arity} x eint{bit_width}",
+                    "name": f"Encryption throughput of {arity} {bit_width}-bit scalar input(s)",
+                    "parameters": {
+                        "bit_width": bit_width,
+                        "arity": arity,
+                    },
+                }
+            )
+    return result
+
+
+@progress.track(targets())
+def main(bit_width, arity):
+    """
+    Benchmark a target.
+
+    Args:
+        bit_width:
+            bit width of the inputs
+
+        arity:
+            number of inputs
+    """
+
+    function, encryption = functions[arity]
+
+    compiler = fhe.Compiler(function, encryption)
+    inputset = fhe.inputset(*([lambda _: random.randint(0, (2**bit_width) - 1)] * arity))
+    configuration = fhe.Configuration(
+        enable_unsafe_features=True,
+        use_insecure_key_cache=True,
+        insecure_key_cache_location=".keys",
+    )
+
+    print("Compiling...")
+    circuit = compiler.compile(inputset, configuration)
+
+    print("Generating keys...")
+    circuit.keygen()
+
+    client = circuit.client
+    samples = [
+        tuple(random.randint(0, (2**bit_width) - 1) for _ in range(arity)) for _ in range(1000)
+    ]
+
+    print("Warming up...")
+    client.encrypt(*samples[0])
+
+    for i in range(5):
+        print(f"Running subsample {i + 1} out of 5...")
+
+        start = time.perf_counter()
+        for sample in samples:
+            client.encrypt(*sample)
+        end = time.perf_counter()
+
+        progress.measure(
+            id="encryption-throughput",
+            label="Encryption Throughput (samples/s)",
+            value=len(samples) / (end - start),
+        )
+        progress.measure(
+            id="encryption-time-us",
+            label="Encryption Time (us)",
+            value=((end - start) / len(samples)) * 1_000_000,
+        )
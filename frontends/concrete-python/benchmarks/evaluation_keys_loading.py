@@ -0,0 +1,152 @@
+"""
+Benchmarks of loading evaluation keys of many tenants.
+"""
+
+import multiprocessing
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Tuple
+
+import py_progress_tracker as progress
+
+from concrete import fhe
+
+
+def targets():
+    """
+    Generates targets to benchmark.
+    """
+
+    result = []
+    for tenants in [1, 8, 32]:
+        for method in ["bytes", "file"]:
+            result.append(
+                {
+                    "id": (
+                        f"evaluation-keys-loading :: "
+                        f"Evaluation keys loading "
+                        f"| tenants = {tenants} "
+                        f"| method = {method}"
+                    ),
+                    "name": (
+                        f"Loading evaluation keys of {tenants} tenant(s) "
+                        f"{'from bytes' if method == 'bytes' else 'from files'}"
+                    ),
+                    "parameters": {
+                        "tenants": tenants,
+                        "method": method,
+                    },
+                }
+            )
+    return result
+
+
+def memory_usage_in_mb(field: str) -> float:
+    """
+    Get a memory usage field of the current process from `/proc/self/status` in MB.
+    """
+
+    with open("/proc/self/status", "r", encoding="utf-8") as f:
+        for line in f:
+            if line.startswith(f"{field}:"):
+                return int(line.split()[1]) / 1024
+    return 0.0  # pragma: no cover
+
+
+def load(method: str, paths: List[Path]) -> Tuple[float, float, float]:
+    """
+    Load evaluation keys from files, and measure the time and the memory it takes.
+    """
+
+    # reset peak resident memory of the process
+    with open("/proc/self/clear_refs", "w", encoding="utf-8") as f:
+        f.write("5")
+
+    baseline = memory_usage_in_mb("VmRSS")
+
+    evaluation_keys = []
+    start = time.perf_counter()
+    for path in paths:
+        if method == "bytes":
+            with open(path, "rb") as f:
+                evaluation_keys.append(fhe.EvaluationKeys.deserialize(f.read()))
+        else:
+            evaluation_keys.append(fhe.EvaluationKeys.deserialize(path))
+    end = time.perf_counter()
+
+    resident = memory_usage_in_mb("VmRSS") - baseline
+    peak = memory_usage_in_mb("VmHWM") - baseline
+
+    return end - start, resident, peak
+
+
+@progress.track(targets())
+def main(tenants, method):
+    """
+    Benchmark a target.
+
+    Args:
+        tenants:
+            number of tenants to load the evaluation keys of
+
+        method:
+            "bytes" to read the files before deserializing them,
+            "file" to deserialize the files directly
+    """
+
+    @fhe.compiler({"x": "encrypted"})
+    def f(x):
+        return (x**2) % 97
+
+    configuration = fhe.Configuration(
+        enable_unsafe_features=True,
+        use_insecure_key_cache=True,
+        insecure_key_cache_location=".keys",
+    )
+
+    print("Compiling...")
+    circuit = f.compile(range(2**8), configuration)
+
+    print("Generating keys...")
+    circuit.keygen()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        template = Path(tmp_dir) / "evaluation_keys.0"
+        circuit.client.evaluation_keys.serialize_to_file(template)
+
+        # each tenant has its own file, as they would have their own keys
+        paths = [template]
+        for tenant in range(1, tenants):
+            paths.append(Path(tmp_dir) / f"evaluation_keys.{tenant}")
+            shutil.copyfile(template, paths[-1])
+
+        for i in range(3):
+            print(f"Running subsample {i + 1} out of 3...")
+
+            # keys are loaded in a new process each time, so the memory it uses can be measured
+            with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("fork")) as pool:
+                duration, resident, peak = pool.submit(load, method, paths).result()
+
+            progress.measure(
+                id="loading-time-ms",
+                label="Loading Time (ms)",
+                value=duration * 1000,
+            )
+            progress.measure(
+                id="resident-memory-mb",
+                label="Resident Memory (MB)",
+                value=resident,
+            )
+            progress.measure(
+                id="resident-memory-per-tenant-mb",
+                label="Resident Memory per Tenant (MB)",
+                value=resident / tenants,
+            )
+            progress.measure(
+                id="peak-memory-mb",
+                label="Peak Memory (MB)",
+                value=peak,
+            )
@@ -0,0 +1,74 @@
+"""
+Benchmarks of the compilation time of the game of life example with large inputsets.
+"""
+
+import os
+
+import numpy as np
+import py_progress_tracker as progress
+
+from concrete import fhe
+from examples.game_of_life.game_of_life import update_grid_method_3b
+
+
+def targets():
+    """
+    Generates targets to benchmark.
+    """
+
+    result = []
+    for inputset_size in [10_000]:
+        for workers in [1, 2, 4, 8, 16]:
+            if workers > (os.cpu_count() or 1):
+                continue
+
+            result.append(
+                {
+                    "id": (
+                        f"game-of-life-compilation :: "
+                        f"Game of Life "
+                        f"| inputset_size = {inputset_size} "
+                        f"| workers = {workers}"
+                    ),
+                    "name": (
+                        f"Compiling Game of Life simulation "
+                        f"with {inputset_size} samples "
+                        f"using {workers} bounds measurement worker(s)"
+                    ),
+                    "parameters": {
+                        "inputset_size": inputset_size,
+                        "workers": workers,
+                    },
+                }
+            )
+    return result
+
+
+@progress.track(targets())
+def main(inputset_size, workers):
+    """
+    Benchmark a target.
+
+    Args:
+        inputset_size:
+            number of samples in the inputset
+
+        workers:
+            number of processes to measure bounds with
+    """
+
+    dimension = 8
+    inputset = [
+        np.random.randint(0, 2, size=(1, 1, dimension, dimension)) for _ in range(inputset_size)
+    ]
+    configuration = fhe.Configuration(
+        bitwise_strategy_preference=fhe.BitwiseStrategy.ONE_TLU_PROMOTED,
+        bounds_measurement_workers=workers,
+    )
+
+    for i in range(3):
+        print(f"Running subsample {i + 1} out of 3...")
+
+        compiler = fhe.Compiler(update_grid_method_3b, {"grid": "encrypted"})
+        with progress.measure(id="compilation-time-ms", label="Compilation Time (ms)"):
+            compiler.compile(inputset, configuration)
@@ -0,0 +1,78 @@
+"""
+Benchmarks of clear evaluation of large computation graphs.
+"""
+
+# pylint: disable=import-error
+
+import time
+
+import numpy as np
+import py_progress_tracker as progress
+
+from concrete import fhe
+
+
+def targets():
+    """
+    Generates targets to benchmark.
+    """
+
+    result = []
+    for shape in [(), (10,), (10, 10)]:
+        shape_str = "scalar" if shape == () else f"tensor[{', '.join(str(s) for s in shape)}]"
+        result.append(
+            {
+                "id": f"graph-evaluation :: 1000 nodes | {shape_str}",
+                "name": f"Clear evaluation of a graph with 1000 nodes on {shape_str} inputs",
+                "parameters": {
+                    "shape": shape,
+                },
+            }
+        )
+    return result
+
+
+@progress.track(targets())
+def main(shape):
+    """
+    Benchmark a target.
+
+    Args:
+        shape:
+            shape of the input
+    """
+
+    def function(x):
+        # each iteration adds a constant node and an add node to the graph
+        for _ in range(500):
+            x = x + 1
+        return x
+
+    inputset = [np.random.randint(0, 2**4, size=shape) for _ in range(10)]
+
+    print("Tracing...")
+    graph = fhe.Compiler(function, {"x": "encrypted"}).trace(inputset)
+    assert len(graph.graph.nodes) >= 1000
+
+    samples = [np.random.randint(0, 2**4, size=shape) for _ in range(100)]
+
+    print("Warming up...")
+    graph(samples[0])
+
+    for i in range(5):
+        print(f"Running subsample {i + 1} out of 5...")
+
+        start = time.perf_counter()
+        for sample in samples:
+            graph(sample)
+        end = time.perf_counter()
+
+        progress.measure(
+            id="evaluation-time-ms",
+            label="Evaluation Time (ms)",
+            value=((end - start) / len(samples)) * 1000,
+        )
+
+    print("Measuring bounds...")
+    with progress.measure(id="bounds-measurement-time-ms", label="Bounds Measurement Time (ms)"):
+        graph.measure_bounds(samples)
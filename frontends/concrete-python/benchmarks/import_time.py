@@ -0,0 +1,128 @@
+"""
+Benchmarks of import time and memory usage of concrete.
+"""
+
+# pylint: disable=import-error
+
+import json
+import subprocess
+import sys
+
+import py_progress_tracker as progress
+
+HEAVY_DEPENDENCIES = ["torch", "z3", "scipy", "networkx"]
+
+SCENARIOS = {
+    "import": """
+import concrete.fhe
+    """,
+    "import-client": """
+from concrete.fhe import Client, ClientSpecs, EvaluationKeys, Keys, Value
+    """,
+    "import-slim-client": """
+from concrete.fhe.client import Client, ClientSpecs, EvaluationKeys, Keys, Value
+    """,
+    "import-and-trace": """
+from concrete import fhe
+
+fhe.Compiler(lambda x: x + 1, {"x": "encrypted"}).trace(range(10))
+    """,
+}
+
+MEASUREMENT = """
+import json
+import resource
+import sys
+import time
+
+start = time.perf_counter()
+exec(sys.argv[1])
+end = time.perf_counter()
+
+heavy_dependencies = sys.argv[2].split(",")
+loaded = [
+    name
+    for name in heavy_dependencies
+    if any(module.startswith(f"{name}.") for module in sys.modules)
+]
+
+print(
+    json.dumps(
+        {
+            "time": end - start,
+            "memory": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            "loaded": loaded,
+            "mlir": "mlir.ir" in sys.modules,
+        }
+    )
+)
+"""
+
+
+def targets():
+    """
+    Generates targets to benchmark.
+    """
+
+    result = []
+    for scenario in SCENARIOS:
+        result.append(
+            {
+                "id": f"import-time :: {scenario}",
+                "name": f"Startup of a process which does '{scenario}'",
+                "parameters": {
+                    "scenario": scenario,
+                },
+            }
+        )
+    return result
+
+
+@progress.track(targets())
+def main(scenario):
+    """
+    Benchmark a target.
+
+    Args:
+        scenario:
+            what the process does after it starts
+    """
+
+    for i in range(5):
+        print(f"Running subsample {i + 1} out of 5...")
+
+        # imports are cached within a process, so each subsample runs in a new process
+        process = subprocess.run(  # noqa: S603
+            [
+                sys.executable,
+                "-c",
+                MEASUREMENT,
+                SCENARIOS[scenario],
+                ",".join(HEAVY_DEPENDENCIES),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        result = json.loads(process.stdout.strip().splitlines()[-1])
+
+        progress.measure(
+            id="import-time-ms",
+            label="Import Time (ms)",
+            value=result["time"] * 1000,
+        )
+        progress.measure(
+            id="peak-memory-mb",
+            label="Peak Memory (MB)",
+            value=result["memory"] / 1024,
+        )
+        progress.measure(
+            id="heavy-dependencies-loaded",
+            label="Heavy Dependencies Loaded",
+            value=len(result["loaded"]),
+        )
+        progress.measure(
+            id="mlir-bindings-loaded",
+            label="MLIR Bindings Loaded",
+            value=int(result["mlir"]),
+        )
@@ -0,0 +1,104 @@
+"""
+Benchmarks of key generation.
+"""
+
+import time
+
+import numpy as np
+import py_progress_tracker as progress
+
+from concrete import fhe
+
+
+def targets():
+    """
+    Generates targets to benchmark.
+    """
+
+    result = []
+    for strategy in ["mono", "multi"]:
+        for threads in [1, None]:
+            result.append(
+                {
+                    "id": (
+                        f"keygen :: "
+                        f"Key generation "
+                        f"| strategy = {strategy} "
+                        f"| threads = {threads if threads is not None else 'all'}"
+                    ),
+                    "name": (
+                        f"Generating keys of a {strategy}-parameter circuit "
+                        f"{'on 1 thread' if threads == 1 else 'on all threads'}"
+                    ),
+                    "parameters": {
+                        "strategy": strategy,
+                        "threads": threads,
+                    },
+                }
+            )
+    return result
+
+
+@progress.track(targets())
+def main(strategy, threads):
+    """
+    Benchmark a target.
+
+    Args:
+        strategy:
+            "mono" or "multi" parameter selection strategy
+            (multi-parameter circuits have more keys to generate)
+
+        threads:
+            number of threads to generate keys with (all hardware threads if None)
+    """
+
+    @fhe.compiler({"x": "encrypted", "y": "encrypted", "z": "encrypted"})
+    def f(x, y, z):
+        a = fhe.univariate(lambda v: v // 2)(x)
+        b = fhe.univariate(lambda v: v % 7)(y + 100)
+        c = fhe.univariate(lambda v: v * 3)(z)
+        return fhe.univariate(lambda v: v % 8)(a + b + c)
+
+    configuration = fhe.Configuration(
+        parameter_selection_strategy=strategy,
+        use_insecure_key_cache=False,
+    )
+
+    print("Compiling...")
+    inputset = [
+        (
+            np.random.randint(0, 2**4),
+            np.random.randint(0, 2**6),
+            np.random.randint(0, 2**3),
+        )
+        for _ in range(100)
+    ]
+    circuit = f.compile(inputset, configuration)
+
+    keyset_info = circuit.server.program_info.get_keyset_info()
+    progress.measure(
+        id="number-of-keys",
+        label="Number of Keys",
+        value=(
+            len(keyset_info.secret_keys())
+            + len(keyset_info.bootstrap_keys())
+            + len(keyset_info.keyswitch_keys())
+            + len(keyset_info.packing_keyswitch_keys())
+        ),
+    )
+
+    for i in range(3):
+        print(f"Running subsample {i + 1} out of 3...")
+
+        client = fhe.Client(circuit.server.client_specs)
+
+        start = time.perf_counter()
+        client.keys.generate(threads=threads)
+        end = time.perf_counter()
+
+        progress.measure(
+            id="keygen-time-s",
+            label="Key Generation Time (s)",
+            value=end - start,
+        )
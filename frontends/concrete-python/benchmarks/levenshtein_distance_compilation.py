@@ -0,0 +1,85 @@
+"""
+Benchmarks of the compilation time of the levenshtein distance example.
+"""
+
+import tempfile
+
+import py_progress_tracker as progress
+
+from concrete import fhe
+from concrete.fhe.compilation.optimizer_cache import OptimizerCache
+from examples.levenshtein_distance.levenshtein_distance import Alphabet, LevenshteinDistance
+
+
+def targets():
+    """
+    Generates targets to benchmark.
+    """
+
+    result = []
+    for alphabet in ["ACTG", "string"]:
+        for max_string_length in [4]:
+            for optimizer_cache in [False, True]:
+                result.append(
+                    {
+                        "id": (
+                            f"levenshtein-distance-compilation :: "
+                            f"Levenshtein distance "
+                            f"| alphabet = {alphabet} "
+                            f"| max_string_size = {max_string_length} "
+                            f"| optimizer_cache = {'warm' if optimizer_cache else 'disabled'}"
+                        ),
+                        "name": (
+                            f"Compiling levenshtein distance between two strings "
+                            f"of length {max_string_length} "
+                            f"from {alphabet} alphabet"
+                            f"{' with a warm optimizer cache' if optimizer_cache else ''}"
+                        ),
+                        "parameters": {
+                            "alphabet": alphabet,
+                            "max_string_length": max_string_length,
+                            "optimizer_cache": optimizer_cache,
+                        },
+                    }
+                )
+    return result
+
+
+@progress.track(targets())
+def main(alphabet, max_string_length, optimizer_cache):
+    """
+    Benchmark a target.
+
+    Args:
+        alphabet:
+            alphabet of the inputs
+
+        max_string_length:
+            maximum size of the inputs
+
+        optimizer_cache:
+            whether to recompile with a warm optimizer cache
+    """
+
+    alphabet = Alphabet.init_by_name(alphabet)
+
+    with tempfile.TemporaryDirectory() as location:
+        configuration = fhe.Configuration(
+            optimizer_cache_location=(location if optimizer_cache else None),
+        )
+
+        if optimizer_cache:
+            print("Warming up...")
+            LevenshteinDistance(alphabet, max_string_length, configuration=configuration)
+
+        OptimizerCache.reset_statistics()
+        for i in range(3):
+            print(f"Running subsample {i + 1} out of 3...")
+
+            # compilation cache is disabled, so only the parameters of the optimizer are reused
+            with progress.measure(id="compilation-time-ms", label="Compilation Time (ms)"):
+                LevenshteinDistance(alphabet, max_string_length, configuration=configuration)
+
+        if optimizer_cache:
+            statistics = OptimizerCache.statistics()
+            print(f"Optimizer cache: {statistics['hits']} hit(s), {statistics['misses']} miss(es)")
@@ -0,0 +1,153 @@
+"""
+Benchmarks of the levenshtein distance example, evaluated as a pipeline.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import py_progress_tracker as progress
+
+from concrete import fhe
+from examples.levenshtein_distance.levenshtein_distance import Alphabet, LevenshteinDistance
+
+
+def levenshtein_pipeline(server: fhe.Server, length: int) -> fhe.Pipeline:
+    """
+    Create a pipeline computing levenshtein distance between two strings of the same length.
+
+    Inputs of the pipeline are the characters of the first string, then the characters of the
+    second string, and the output is the distance.
+    """
+
+    pipeline = fhe.Pipeline(server)
+
+    x = [pipeline.input() for _ in range(length)]
+    y = [pipeline.input() for _ in range(length)]
+
+    # distance between x[i:] and y[j:]
+    distances = {}
+    for i in reversed(range(length + 1)):
+        for j in reversed(range(length + 1)):
+            if length in (i, j):
+                distances[i, j] = pipeline.call("constant", (length - i) + (length - j))
+                continue
+
+            is_equal = pipeline.call("equal", x[i], y[j])
+            distances[i, j] = pipeline.call(
+                "mix",
+                is_equal,
+                distances[i + 1, j + 1],
+                distances[i + 1, j],
+                distances[i, j + 1],
+                distances[i + 1, j + 1],
+            )
+
+    pipeline.output(distances[0, 0])
+    return pipeline
+
+
+def targets():
+    """
+    Generates targets to benchmark.
+    """
+
+    result = []
+    for alphabet in ["ACTG", "string"]:
+        for max_string_length in [2, 4, 8]:
+            for workers in [1, 4]:
+                result.append(
+                    {
+                        "id": (
+                            f"levenshtein-distance-pipeline :: "
+                            f"Levenshtein distance pipeline "
+                            f"| alphabet = {alphabet} "
+                            f"| max_string_size = {max_string_length} "
+                            f"| workers = {workers}"
+                        ),
+                        "name": (
+                            f"Levenshtein distance between two strings "
+                            f"of length {max_string_length} "
+                            f"from {alphabet} alphabet "
+                            f"evaluated as a pipeline with {workers} worker(s)"
+                        ),
+                        "parameters": {
+                            "alphabet": alphabet,
+                            "max_string_length": max_string_length,
+                            "workers": workers,
+                        },
+                    }
+                )
+    return result
+
+
+@progress.track(targets())
+def main(alphabet, max_string_length, workers):
+    """
+    Benchmark a target.
+
+    Args:
+        alphabet:
+            alphabet of the inputs
+        max_string_length:
+            maximum size of the inputs
+        workers:
+            number of threads to evaluate independent invocations concurrently
+    """
+
+    cached_server = Path(f"levenshtein.{alphabet}.{max_string_length}.server.zip")
+    alphabet = Alphabet.init_by_name(alphabet)
+
+    print("Compiling...")
+    if cached_server.exists():
+        server = fhe.Server.load(cached_server)
+        client = fhe.Client(server.client_specs, keyset_cache_directory=".keys")
+    else:
+        levenshtein_distance = LevenshteinDistance(
+            alphabet,
+            max_string_length,
+            configuration=fhe.Configuration(
+                enable_unsafe_features=True,
+                use_insecure_key_cache=True,
+                insecure_key_cache_location=".keys",
+            ),
+        )
+        levenshtein_distance.module.server.save(cached_server)
+
+        server = levenshtein_distance.module.server
+        client = levenshtein_distance.module.client
+
+    print("Generating keys...")
+    client.keygen()
+
+    pipeline = levenshtein_pipeline(server, max_string_length)
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+
+    def encrypt_samples():
+        sample_a = alphabet.random_string(max_string_length)
+        sample_b = alphabet.random_string(max_string_length)
+
+        encrypted_sample_a = [
+            client.encrypt(ai, None, function_name="equal")[0] for ai in alphabet.encode(sample_a)
+        ]
+        encrypted_sample_b = [
+            client.encrypt(None, bi, function_name="equal")[1] for bi in alphabet.encode(sample_b)
+        ]
+        return encrypted_sample_a + encrypted_sample_b
+
+    print("Warming up...")
+    pipeline.run(
+        *encrypt_samples(),
+        evaluation_keys=client.evaluation_keys,
+        executor=executor,
+    )
+
+    for i in range(5):
+        print(f"Running subsample {i + 1} out of 5...")
+
+        encrypted_samples = encrypt_samples()
+        with progress.measure(id="evaluation-time-ms", label="Evaluation Time (ms)"):
+            pipeline.run(
+                *encrypted_samples,
+                evaluation_keys=client.evaluation_keys,
+                executor=executor,
+            )
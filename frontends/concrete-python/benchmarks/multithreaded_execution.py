@@ -0,0 +1,112 @@
+"""
+Benchmarks of encrypt/run/decrypt throughput using multiple threads.
+"""
+
+# pylint: disable=import-error
+
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import py_progress_tracker as progress
+
+from concrete import fhe
+
+
+def targets():
+    """
+    Generates targets to benchmark.
+    """
+
+    result = []
+    for bit_width in [4, 8]:
+        for threads in [1, 2, 4, 8]:
+            if threads > (os.cpu_count() or 1):
+                continue
+
+            result.append(
+                {
+                    "id": (
+                        f"multithreaded-execution :: "
+                        f"tlu[eint{bit_width}] "
+                        f"| threads = {threads}"
+                    ),
+                    "name": (
+                        f"Encrypt/run/decrypt throughput of a {bit_width}-bit table lookup "
+                        f"using {threads} thread(s)"
+                    ),
+                    "parameters": {
+                        "bit_width": bit_width,
+                        "threads": threads,
+                    },
+                }
+            )
+    return result
+
+
+@progress.track(targets())
+def main(bit_width, threads):
+    """
+    Benchmark a target.
+
+    Args:
+        bit_width:
+            bit width of the input
+
+        threads:
+            number of threads to use
+    """
+
+    @fhe.compiler({"x": "encrypted"})
+    def function(x):
+        return (x * 3) // 2
+
+    inputset = fhe.inputset(lambda _: random.randint(0, (2**bit_width) - 1))
+    configuration = fhe.Configuration(
+        enable_unsafe_features=True,
+        use_insecure_key_cache=True,
+        insecure_key_cache_location=".keys",
+    )
+
+    print("Compiling...")
+    circuit = function.compile(inputset, configuration)
+
+    print("Generating keys...")
+    circuit.keygen()
+
+    client = circuit.client
+    server = circuit.server
+    evaluation_keys = client.evaluation_keys
+
+    def encrypt_run_decrypt(sample):
+        encrypted = client.encrypt(sample)
+        ran = server.run(encrypted, evaluation_keys=evaluation_keys)
+        return client.decrypt(ran)
+
+    samples = [random.randint(0, (2**bit_width) - 1) for _ in range(64)]
+
+    print("Warming up...")
+    encrypt_run_decrypt(samples[0])
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for i in range(5):
+            print(f"Running subsample {i + 1} out of 5...")
+
+            start = time.perf_counter()
+            outputs = list(executor.map(encrypt_run_decrypt, samples))
+            end = time.perf_counter()
+
+            progress.measure(
+                id="throughput",
+                label="Throughput (samples/s)",
+                value=len(samples) / (end - start),
+            )
+            progress.measure(
+                id="accuracy",
+                label="Accuracy",
+                value=sum(
+                    int(output == (sample * 3) // 2) for sample, output in zip(samples, outputs)
+                )
+                / len(samples),
+            )
@@ -0,0 +1,78 @@
+"""
+Benchmarks of the per-call overhead of `Server.run`.
+"""
+
+# pylint: disable=import-error,protected-access
+
+import random
+
+import py_progress_tracker as progress
+
+from concrete import fhe
+
+
+def targets():
+    """
+    Generates targets to benchmark.
+    """
+
+    result = []
+    for bit_width in [2, 4, 8]:
+        result.append(
+            {
+                "id": f"server-run :: x + 1 | eint{bit_width}",
+                "name": f"Per-call overhead of running x + 1 on a {bit_width}-bit input",
+                "parameters": {
+                    "bit_width": bit_width,
+                },
+            }
+        )
+    return result
+
+
+@progress.track(targets())
+def main(bit_width):
+    """
+    Benchmark a target.
+
+    Args:
+        bit_width:
+            bit width of the input
+    """
+
+    @fhe.compiler({"x": "encrypted"})
+    def function(x):
+        return x + 1
+
+    inputset = fhe.inputset(lambda _: random.randint(0, (2**bit_width) - 1))
+    configuration = fhe.Configuration(
+        enable_unsafe_features=True,
+        use_insecure_key_cache=True,
+        insecure_key_cache_location=".keys",
+    )
+
+    print("Compiling...")
+    circuit = function.compile(inputset, configuration)
+
+    print("Generating keys...")
+    circuit.keygen()
+
+    server = circuit.server
+    evaluation_keys = circuit.client.evaluation_keys
+
+    print("Warming up...")
+    encrypted = circuit.encrypt(random.randint(0, (2**bit_width) - 1))
+    server.run(encrypted, evaluation_keys=evaluation_keys)
+
+    for i in range(10):
+        print(f"Running subsample {i + 1} out of 10...")
+
+        encrypted = circuit.encrypt(random.randint(0, (2**bit_width) - 1))
+
+        # a fresh server has no cached circuit handles, so this measures the setup cost as well
+        cold_server = fhe.Server(server._library, server.is_simulated, server._composition_rules)
+        with progress.measure(id="cold-run-time-ms", label="Cold Run Time (ms)"):
+            cold_server.run(encrypted, evaluation_keys=evaluation_keys)
+
+        with progress.measure(id="warm-run-time-ms", label="Warm Run Time (ms)"):
+            server.run(encrypted, evaluation_keys=evaluation_keys)
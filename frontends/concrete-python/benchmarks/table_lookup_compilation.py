@@ -0,0 +1,80 @@
+"""
+Benchmarks of compilation of circuits with many table lookups.
+"""
+
+# pylint: disable=import-error
+
+import numpy as np
+import py_progress_tracker as progress
+
+from concrete import fhe
+
+
+def targets():
+    """
+    Generates targets to benchmark.
+    """
+
+    result = []
+    for kind in ["univariate", "multivariate"]:
+        for bit_width in [4, 6, 8]:
+            for shape in [(10,), (10, 10)]:
+                shape_str = f"tensor[{', '.join(str(s) for s in shape)}]"
+                result.append(
+                    {
+                        "id": f"table-lookup-compilation :: {kind} | {shape_str}[eint{bit_width}]",
+                        "name": (
+                            f"Compiling 8 {kind} table lookups "
+                            f"on {bit_width}-bit {shape_str} inputs"
+                        ),
+                        "parameters": {
+                            "kind": kind,
+                            "bit_width": bit_width,
+                            "shape": shape,
+                        },
+                    }
+                )
+    return result
+
+
+@progress.track(targets())
+def main(kind, bit_width, shape):
+    """
+    Benchmark a target.
+
+    Args:
+        kind:
+            kind of the table lookups ("univariate" or "multivariate")
+
+        bit_width:
+            bit width of the inputs
+
+        shape:
+            shape of the inputs
+    """
+
+    def univariate(x, y):
+        for i in range(8):
+            x = fhe.univariate(lambda v, i=i: (v * (i + 3)) % (2**bit_width))(x + y)
+        return x
+
+    def multivariate(x, y):
+        for i in range(8):
+            x = fhe.multivariate(lambda a, b, i=i: (a * b + i) % (2**bit_width))(x, y)
+        return x
+
+    function = univariate if kind == "univariate" else multivariate
+    inputset = [
+        (
+            np.random.randint(0, 2**bit_width, size=shape),
+            np.random.randint(0, 2**bit_width, size=shape),
+        )
+        for _ in range(100)
+    ]
+
+    for i in range(3):
+        print(f"Running subsample {i + 1} out of 3...")
+
+        compiler = fhe.Compiler(function, {"x": "encrypted", "y": "encrypted"})
+        with progress.measure(id="compilation-time-ms", label="Compilation Time (ms)"):
+            compiler.compile(inputset)
@@ -0,0 +1,70 @@
+"""
+Benchmarks of encoding and decoding of TFHE-rs integers.
+"""
+
+# pylint: disable=import-error
+
+import numpy as np
+import py_progress_tracker as progress
+
+from concrete.fhe import tfhers
+
+PARAMS = tfhers.CryptoParams(
+    909,
+    1,
+    4096,
+    15,
+    2,
+    0,
+    2.168404344971009e-19,
+    tfhers.EncryptionKeyChoice.BIG,
+)
+
+
+def targets():
+    """
+    Generates targets to benchmark.
+    """
+
+    result = []
+    for type_name in ["uint8_2_2", "int8_2_2", "uint16_2_2", "int16_2_2"]:
+        for size in [1_000, 10_000, 100_000, 1_000_000]:
+            result.append(
+                {
+                    "id": f"tfhers-encoding :: {type_name} | size = {size}",
+                    "name": f"Encoding and decoding {size} {type_name} TFHE-rs integers",
+                    "parameters": {
+                        "type_name": type_name,
+                        "size": size,
+                    },
+                }
+            )
+    return result
+
+
+@progress.track(targets())
+def main(type_name, size):
+    """
+    Benchmark a target.
+
+    Args:
+        type_name:
+            name of the TFHE-rs integer type in `concrete.fhe.tfhers`
+
+        size:
+            number of integers to encode and decode
+    """
+
+    dtype = getattr(tfhers, type_name)(PARAMS)
+    value = np.random.randint(dtype.min(), dtype.max() + 1, size=(size,))
+
+    for i in range(5):
+        print(f"Running subsample {i + 1} out of 5...")
+
+        with progress.measure(id="encoding-time-ms", label="Encoding Time (ms)"):
+            encoded = dtype.encode(value)
+
+        with progress.measure(id="decoding-time-ms", label="Decoding Time (ms)"):
+            decoded = dtype.decode(encoded)
+
+        assert np.array_equal(decoded, value)
@@ -0,0 +1,104 @@
+"""
+Benchmarks of serializing and deserializing encrypted values.
+"""
+
+import time
+
+import numpy as np
+import py_progress_tracker as progress
+
+from concrete import fhe
+
+
+def targets():
+    """
+    Generates targets to benchmark.
+    """
+
+    result = []
+    for size in [10, 100, 1_000, 10_000]:
+        for method in ["bytes", "buffer"]:
+            result.append(
+                {
+                    "id": (
+                        f"value-serialization :: "
+                        f"Value serialization "
+                        f"| size = {size} "
+                        f"| method = {method}"
+                    ),
+                    "name": (
+                        f"Serializing and deserializing encrypted tensors of {size} elements "
+                        f"{'to and from bytes' if method == 'bytes' else 'into and from a buffer'}"
+                    ),
+                    "parameters": {
+                        "size": size,
+                        "method": method,
+                    },
+                }
+            )
+    return result
+
+
+@progress.track(targets())
+def main(size, method):
+    """
+    Benchmark a target.
+
+    Args:
+        size:
+            number of elements of the encrypted tensor
+
+        method:
+            "bytes" to use `serialize` and `deserialize`,
+            "buffer" to use `serialize_into` and `from_buffer` with a preallocated buffer
+    """
+
+    @fhe.compiler({"x": "encrypted"})
+    def f(x):
+        return x + 1
+
+    configuration = fhe.Configuration(
+        enable_unsafe_features=True,
+        use_insecure_key_cache=True,
+        insecure_key_cache_location=".keys",
+    )
+
+    print("Compiling...")
+    inputset = [np.random.randint(0, 2**4, size=(size,)) for _ in range(10)]
+    circuit = f.compile(inputset, configuration)
+
+    print("Generating keys...")
+    circuit.keygen()
+
+    value = circuit.encrypt(np.random.randint(0, 2**4, size=(size,)))
+    megabytes = value.serialized_size / (1024**2)
+
+    buffer = bytearray(value.serialized_size)
+    view = memoryview(buffer)
+
+    for i in range(5):
+        print(f"Running subsample {i + 1} out of 5...")
+
+        if method == "bytes":
+            start = time.perf_counter()
+            serialized = value.serialize()
+            middle = time.perf_counter()
+            fhe.Value.deserialize(serialized)
+            end = time.perf_counter()
+        else:
+            start = time.perf_counter()
+            value.serialize_into(view)
+            middle = time.perf_counter()
+            fhe.Value.from_buffer(view)
+            end = time.perf_counter()
+
+        progress.measure(
+            id="serialization-throughput-mb-per-s",
+            label="Serialization Throughput (MB/s)",
+            value=megabytes / (middle - start),
+        )
+        progress.measure(
+            id="deserialization-throughput-mb-per-s",
+            label="Deserialization Throughput (MB/s)",
+            value=megabytes / (end - middle),
+        )
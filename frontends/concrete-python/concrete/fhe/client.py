@@ -0,0 +1,16 @@
+"""
+Export everything needed to encrypt and decrypt, without the rest of the frontend.
+
+Importing this module only loads the client classes of the compiler bindings and NumPy, so it's
+suitable for short-lived processes which only encrypt arguments and decrypt results.
+"""
+
+# pylint: disable=unused-import
+
+from .compilation.client import Client
+from .compilation.evaluation_keys import EvaluationKeys
+from .compilation.keys import Keys
+from .compilation.specs import ClientSpecs
+from .compilation.value import Value
+
+# pylint: enable=unused-import
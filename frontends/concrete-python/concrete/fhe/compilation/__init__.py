@@ -2,31 +2,13 @@
 Glue the compilation process together.
 """
 
-from .artifacts import DebugArtifacts, FunctionDebugArtifacts, ModuleDebugArtifacts
-from .circuit import Circuit
-from .client import Client
-from .compiler import Compiler
-from .composition import CompositionClause, CompositionPolicy, CompositionRule
-from .configuration import (
-    DEFAULT_GLOBAL_P_ERROR,
-    DEFAULT_P_ERROR,
-    ApproximateRoundingConfig,
-    BitwiseStrategy,
-    ComparisonStrategy,
-    Configuration,
-    Exactness,
-    MinMaxStrategy,
-    MultiParameterStrategy,
-    MultivariateStrategy,
-    ParameterSelectionStrategy,
-)
-from .evaluation_keys import EvaluationKeys
-from .keys import Keys
-from .module import FheFunction, FheModule
-from .module_compiler import FunctionDef, ModuleCompiler
-from .server import Server
-from .specs import ClientSpecs
-from .status import EncryptionStatus
-from .utils import inputset
-from .value import Value
-from .wiring import AllComposable, AllInputs, AllOutputs, Input, NotComposable, Output, Wire, Wired
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .exports import *  # noqa: F403  # pragma: no cover
+else:
+    from ..internal.utils import export_names, lazy_exports
+
+    # exports are only loaded when they are used, so the client can be imported alone
+    __getattr__, __dir__ = lazy_exports(__name__, ".exports")
+    __all__ = export_names(__name__, ".exports")  # noqa: PLE0605
@@ -3,6 +3,7 @@ Declaration of `DebugArtifacts` class.
 """
 
 import inspect
+import json
 import platform
 import shutil
 import subprocess
@@ -11,6 +12,7 @@ from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Union
 
 from ..representation import Graph
 from .configuration import Configuration
+from .profiler import CompilationProfiler
 from .utils import get_terminal_size
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -297,6 +299,7 @@ class ModuleDebugArtifacts:
     output_directory: Path
     mlir_to_compile: Optional[str]
     _execution_runtime: Optional["Lazy[ExecutionRt]"]
+    _compilation_profiler: Optional[CompilationProfiler]
     functions: Dict[str, FunctionDebugArtifacts]
 
     def __init__(
@@ -307,6 +310,7 @@ class ModuleDebugArtifacts:
         self.output_directory = Path(output_directory)
         self.mlir_to_compile = None
         self._execution_runtime = None
+        self._compilation_profiler = None
         self.functions = (
             {name: FunctionDebugArtifacts() for name in function_names} if function_names else {}
         )
@@ -332,6 +336,17 @@ class ModuleDebugArtifacts:
 
         self._execution_runtime = execution_runtime
 
+    def add_compilation_profiler(self, profiler: CompilationProfiler):
+        """
+        Add the profiler measuring the compilation stages.
+
+        Args:
+            profiler (CompilationProfiler):
+                profiler measuring the compilation stages
+        """
+
+        self._compilation_profiler = profiler
+
     @property
     def client_parameters(self) -> Optional[bytes]:
         """
@@ -436,6 +451,15 @@ class ModuleDebugArtifacts:
             with open(output_directory.joinpath("client_parameters.json"), "wb") as f:
                 f.write(self.client_parameters)
 
+        if self._compilation_profiler is not None:
+            profile_path = output_directory.joinpath("compilation_profile.json")
+            with open(profile_path, "w", encoding="utf-8") as f:
+                json.dump(self._compilation_profiler.summary(), f, indent=4)
+
+            self._compilation_profiler.export_chrome_trace(
+                output_directory.joinpath("compilation_trace.json")
+            )
+
         # pylint: enable=too-many-branches
 
 
@@ -530,6 +530,23 @@ class Circuit:
         func_stats = mod_stats.pop("functions")[self._name]
         return {**mod_stats, **func_stats}
 
+    @property
+    def compilation_profile(self) -> Dict[str, Any]:
+        """
+        Get the time and the peak memory spent in each compilation stage of the circuit.
+        """
+        return self._module.compilation_profile
+
+    def export_compilation_profile(self, path: Union[str, Path]):
+        """
+        Export the compilation stages of the circuit to a file in the Chrome trace event format.
+
+        Args:
+            path (Union[str, Path]):
+                path of the JSON file to export to
+        """
+        self._module.export_compilation_profile(path)
+
     @property
     def configuration(self) -> Configuration:
         """
@@ -6,17 +6,19 @@ Declaration of `Client` class.
 
 import shutil
 import tempfile
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
-from concrete.compiler import ClientProgram, LweSecretKey
+from concrete.compiler import ClientCircuit, ClientProgram, LweSecretKey
 from concrete.compiler import Value as Value_
 
 from .evaluation_keys import EvaluationKeys
 from .keys import Keys
-from .specs import ClientSpecs
-from .utils import validate_input_args
+from .specs import ClientSpecs, validate_input_args
 from .value import Value
 
 # pylint: enable=import-error,no-member,no-name-in-module
@@ -366,6 +368,168 @@ Provide a `function_name` keyword argument to disambiguate."
 
         return decrypted if len(decrypted) != 1 else decrypted[0]
 
+    def encrypt_batch(
+        self,
+        samples: Union[Iterable[Any], np.ndarray],
+        function_name: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[Optional[Union[Value, Tuple[Optional[Value], ...]]]]:
+        """
+        Encrypt many argument sets for evaluation.
+
+        A single client circuit is created (per worker thread) and reused for all samples,
+        and encrypted samples are yielded in order, as soon as they are ready.
+
+        Args:
+            samples (Union[Iterable[Any], np.ndarray]):
+                argument sets to encrypt, each sample is either a tuple of arguments or,
+                for functions with a single argument, the argument itself
+                (a stacked array is iterated over its leading axis)
+
+            function_name (Optional[str], default = None):
+                name of the function to encrypt
+
+            max_workers (Optional[int], default = None):
+                number of threads to encrypt with, samples are encrypted in the calling thread
+                if it's None or 1
+
+        Returns:
+            Iterator[Optional[Union[Value, Tuple[Optional[Value], ...]]]]:
+                encrypted argument sets for evaluation, in the order of the samples
+        """
+
+        assert self._keys is not None, "Tried to encrypt on a simulated client."
+        if not self._keys.are_generated:
+            self._keys.generate()
+
+        function_name = self._resolve_function_name(function_name)
+        arity = len(self._client_specs.input_specs(function_name))
+        client_circuit = self._client_circuit_factory(function_name)
+
+        def encrypt_sample(sample: Any) -> Optional[Union[Value, Tuple[Optional[Value], ...]]]:
+            if isinstance(sample, tuple):
+                args = sample
+            elif arity == 1:
+                args = (sample,)
+            else:
+                args = tuple(sample)
+
+            ordered_sanitized_args = validate_input_args(
+                self._client_specs, *args, function_name=function_name
+            )
+
+            circuit = client_circuit()
+            exported = [
+                (
+                    None
+                    if arg is None
+                    else Value(
+                        circuit.prepare_input(
+                            Value_(arg.astype(np.int64) if isinstance(arg, np.ndarray) else arg),
+                            position,
+                        )
+                    )
+                )
+                for position, arg in enumerate(ordered_sanitized_args)
+            ]
+
+            return tuple(exported) if len(exported) != 1 else exported[0]
+
+        return _map_in_order(encrypt_sample, samples, max_workers)
+
+    def decrypt_batch(
+        self,
+        results: Iterable[Union[Value, Tuple[Value, ...]]],
+        function_name: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[Optional[Union[int, np.ndarray, Tuple[Optional[Union[int, np.ndarray]], ...]]]]:
+        """
+        Decrypt many results of evaluation.
+
+        A single client circuit is created (per worker thread) and reused for all results,
+        and decrypted results are yielded in order, as soon as they are ready.
+
+        Args:
+            results (Iterable[Union[Value, Tuple[Value, ...]]]):
+                results of evaluation
+
+            function_name (Optional[str], default = None):
+                name of the function to decrypt for
+
+            max_workers (Optional[int], default = None):
+                number of threads to decrypt with, results are decrypted in the calling thread
+                if it's None or 1
+
+        Returns:
+            Iterator[Optional[Union[int, np.ndarray, Tuple[Optional[Union[...]], ...]]]]:
+                decrypted results of evaluation, in the order of the results
+        """
+
+        assert self._keys is not None, "Tried to decrypt on a simulated client."
+        assert self._keys.are_generated
+
+        function_name = self._resolve_function_name(function_name)
+        client_circuit = self._client_circuit_factory(function_name)
+
+        def decrypt_result(
+            result: Union[Value, Tuple[Value, ...]],
+        ) -> Optional[Union[int, np.ndarray, Tuple[Optional[Union[int, np.ndarray]], ...]]]:
+            flattened_result = result if isinstance(result, tuple) else (result,)
+
+            circuit = client_circuit()
+            decrypted = tuple(
+                circuit.process_output(
+                    value._inner, position  # pylint: disable=protected-access
+                ).to_py_val()
+                for position, value in enumerate(flattened_result)
+            )
+            decrypted = tuple(
+                d.astype("int64") if isinstance(d, np.ndarray) else d for d in decrypted
+            )
+
+            return decrypted if len(decrypted) != 1 else decrypted[0]
+
+        return _map_in_order(decrypt_result, results, max_workers)
+
+    def _resolve_function_name(self, function_name: Optional[str]) -> str:
+        """
+        Get the name of the function to use, defaulting to the only function of the client.
+        """
+
+        if function_name is not None:
+            return function_name
+
+        functions = self.specs.program_info.function_list()
+        if len(functions) != 1:
+            msg = "The client contains more than one functions. \
+Provide a `function_name` keyword argument to disambiguate."
+            raise TypeError(msg)
+
+        return functions[0]
+
+    def _client_circuit_factory(self, function_name: str) -> Callable[[], ClientCircuit]:
+        """
+        Create a getter for an encrypted client circuit of a function.
+
+        Client circuits hold their own encryption randomness generator,
+        so a separate circuit is created lazily for each thread using the getter.
+        """
+
+        assert self._keys is not None
+        keyset = self._keys._keyset  # pylint: disable=protected-access
+        program_info = self._client_specs.program_info
+        local = threading.local()
+
+        def client_circuit() -> ClientCircuit:
+            circuit = getattr(local, "circuit", None)
+            if circuit is None:
+                client_program = ClientProgram.create_encrypted(program_info, keyset)
+                circuit = client_program.get_client_circuit(function_name)
+                local.circuit = circuit
+            return circuit
+
+        return client_circuit
+
     @property
     def evaluation_keys(self) -> EvaluationKeys:
         """
@@ -379,3 +543,30 @@ Provide a `function_name` keyword argument to disambiguate."
         assert self._keys is not None, "Tried to get evaluation keys from simulated client."
         self.keygen(force=False)
         return self._keys.evaluation
+
+
+def _map_in_order(
+    function: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: Optional[int],
+) -> Iterator[Any]:
+    """
+    Lazily apply a function to items, optionally using a thread pool, preserving the order.
+
+    At most `2 * max_workers` items are in flight at any time, so large (or infinite) iterables
+    are streamed instead of being fully materialized.
+    """
+
+    if max_workers is None or max_workers <= 1:
+        for item in items:
+            yield function(item)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: Deque[Future] = deque()
+        for item in items:
+            pending.append(executor.submit(function, item))
+            if len(pending) >= 2 * max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
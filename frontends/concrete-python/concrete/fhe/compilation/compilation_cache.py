@@ -0,0 +1,431 @@
+"""
+Declaration of `CompilationCache` class.
+"""
+
+# pylint: disable=import-error,no-member,no-name-in-module
+
+import fcntl
+import functools
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from concrete.compiler import Compiler, Library, lookup_runtime_lib
+
+from ..version import __version__
+from .composition import CompositionRule
+from .configuration import DEFAULT_GLOBAL_P_ERROR, DEFAULT_P_ERROR, Configuration
+
+# pylint: enable=import-error,no-member,no-name-in-module
+
+CONFIGURATION_FIELDS_AFFECTING_COMPILATION = [
+    "use_gpu",
+    "loop_parallelize",
+    "dataflow_parallelize",
+    "auto_parallelize",
+    "compress_evaluation_keys",
+    "compress_input_ciphertexts",
+    "detect_overflow_in_simulation",
+    "composable",
+    "global_p_error",
+    "p_error",
+    "parameter_selection_strategy",
+    "multi_parameter_strategy",
+    "enable_tlu_fusing",
+    "security_level",
+]
+
+STAGING_PREFIX = ".staging-"
+EVICTED_PREFIX = ".evicted-"
+LOCK_FILE_NAME = ".lock"
+
+ABANDONED_STAGING_DIRECTORY_AGE_IN_SECONDS = 24 * 60 * 60
+
+# shared locks of the entries used by this process, by the path of the entry
+LEASES: Dict[str, IO] = {}
+
+
+class CompilationCache:
+    """
+    CompilationCache class, to reuse compilation outputs across processes using the filesystem.
+
+    Each entry is a directory, named after the key of the compilation, with the output of the
+    compiler in it. Entries are compiled into a staging directory and renamed once complete,
+    and they are renamed before being deleted on eviction, so that other processes sharing the
+    cache never see an incomplete entry.
+
+    Servers load their program lazily from the entry, so processes hold a shared lock on each
+    entry they use until they exit, and entries are only evicted if they can be locked exclusively.
+    """
+
+    location: Path
+    max_size: int
+
+    def __init__(self, location: Union[str, Path], max_size: int):
+        self.location = Path(location)
+        self.max_size = max_size
+
+    @staticmethod
+    def of(configuration: Configuration) -> Optional["CompilationCache"]:
+        """
+        Get the compilation cache to use with a configuration.
+
+        Args:
+            configuration (Configuration):
+                configuration to get the compilation cache of
+
+        Returns:
+            Optional[CompilationCache]:
+                compilation cache of the configuration
+                or None if it's disabled or if compilations using the configuration cannot be cached
+        """
+
+        if configuration.compilation_cache_location is None:
+            return None
+
+        if configuration.keyset_restriction or configuration.range_restriction:
+            # restrictions cannot be serialized so they cannot be part of the key
+            return None
+
+        return CompilationCache(
+            configuration.compilation_cache_location,
+            configuration.compilation_cache_max_size,
+        )
+
+    @staticmethod
+    def key(
+        mlir: str,
+        configuration: Configuration,
+        is_simulated: bool,
+        composition_rules: Iterable[CompositionRule],
+    ) -> str:
+        """
+        Compute the key of a compilation.
+
+        Args:
+            mlir (str):
+                mlir to compile
+
+            configuration (Configuration):
+                configuration to use
+
+            is_simulated (bool):
+                whether to compile in simulation mode or not
+
+            composition_rules (Iterable[CompositionRule]):
+                composition rules to be applied when compiling
+
+        Returns:
+            str:
+                key of the compilation
+        """
+
+        description: Dict[str, Any] = {
+            "version": __version__,
+            "compiler": _compiler_identity(),
+            "mlir": mlir.strip(),
+            "is_simulated": is_simulated,
+            "composition_rules": [
+                [[rule.from_.func, rule.from_.pos], [rule.to.func, rule.to.pos]]
+                for rule in composition_rules
+            ],
+            "configuration": {
+                field: repr(getattr(configuration, field))
+                for field in CONFIGURATION_FIELDS_AFFECTING_COMPILATION
+            },
+            "default_global_p_error": DEFAULT_GLOBAL_P_ERROR,
+            "default_p_error": DEFAULT_P_ERROR,
+        }
+
+        return hashlib.sha256(json.dumps(description, sort_keys=True).encode()).hexdigest()
+
+    def lookup(self, key: str) -> Optional[Library]:
+        """
+        Get the library of a compilation from the cache.
+
+        Args:
+            key (str):
+                key of the compilation
+
+        Returns:
+            Optional[Library]:
+                library of the compilation or None if it's not in the cache
+        """
+
+        entry = self.location / key
+        if not entry.is_dir():
+            return None
+
+        lease = lock_directory(entry, shared=True)
+        if lease is not None and not is_lock_of_directory(lease, entry):
+            # the entry was evicted while waiting for the lock
+            lease.close()
+            return None
+
+        try:
+            library = Library(str(entry))
+            library.get_program_info()
+        except Exception:  # pylint: disable=broad-except
+            # the entry might have been evicted in the meantime
+            if lease is not None:
+                lease.close()
+            return None
+
+        _keep_lease(entry, lease)
+
+        try:
+            # modification time of entries is used as their last access time for eviction
+            os.utime(entry)
+        except OSError:  # pragma: no cover
+            pass
+
+        return library
+
+    def staging_directory(self) -> Path:
+        """
+        Create a new directory to compile into, before inserting the result to the cache.
+
+        Returns:
+            Path:
+                path of the staging directory
+        """
+
+        self.location.mkdir(parents=True, exist_ok=True)
+        return Path(tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=self.location))
+
+    def insert(self, key: str, staging_directory: Path) -> Library:
+        """
+        Insert the output of a compilation to the cache.
+
+        Args:
+            key (str):
+                key of the compilation
+
+            staging_directory (Path):
+                staging directory with the output of the compilation
+
+        Returns:
+            Library:
+                library of the compilation
+        """
+
+        entry = self.location / key
+
+        # the lock is taken before the entry is visible so it cannot be evicted before it's used
+        lease = lock_directory(staging_directory, shared=True)
+        try:
+            staging_directory.rename(entry)
+        except OSError:
+            if lease is not None:
+                lease.close()
+
+            # another process inserted the same compilation first, so we use theirs
+            library = self.lookup(key)
+            if library is None:  # pragma: no cover
+                # and it's already evicted, so we keep ours out of the cache
+                return Library(str(staging_directory))
+
+            shutil.rmtree(staging_directory, ignore_errors=True)
+            return library
+
+        _keep_lease(entry, lease)
+
+        self.evict(keep=key)
+        return Library(str(entry))
+
+    def evict(self, keep: Optional[str] = None):
+        """
+        Evict least recently used entries until the cache fits its maximum size.
+
+        Args:
+            keep (Optional[str], default = None):
+                key of the entry to keep even if the cache doesn't fit its maximum size
+        """
+
+        entries: List[Tuple[float, int, Path]] = []
+        for path in self.location.iterdir():
+            try:
+                stat = path.stat()
+            except OSError:  # pragma: no cover
+                continue
+
+            if remove_if_leftover(path, stat):
+                continue
+
+            if path.is_dir():
+                entries.append((stat.st_mtime, _size_of(path), path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total_size <= self.max_size:
+                break
+
+            if path.name == keep:
+                continue
+
+            lock = lock_directory(path, shared=False)
+            if lock is None:
+                # the entry is used by a server, possibly in another process
+                continue
+
+            with lock:
+                remove_directory(path)
+            total_size -= size
+
+
+@functools.lru_cache(maxsize=None)
+def _compiler_identity() -> str:
+    """
+    Get a description of the installed compiler, which changes when the compiler is changed.
+    """
+
+    result = [lookup_runtime_lib()]
+    try:
+        native_module = Path(sys.modules[Compiler.__module__].__file__)  # type: ignore
+        native_module_stat = native_module.stat()
+        result += [str(native_module), str(native_module_stat.st_size)]
+        result += [str(native_module_stat.st_mtime_ns)]
+    except Exception:  # pylint: disable=broad-except  # pragma: no cover
+        pass
+
+    return ":".join(result)
+
+
+def _size_of(directory: Path) -> int:
+    """
+    Get the total size of the files in a directory.
+    """
+
+    result = 0
+    for root, _, files in os.walk(directory):
+        for file in files:
+            try:
+                result += (Path(root) / file).stat().st_size
+            except OSError:  # pragma: no cover
+                pass
+    return result
+
+
+def lock_directory(directory: Path, shared: bool) -> Optional[IO]:
+    """
+    Lock a directory used by many processes, using a lock file in it.
+
+    Args:
+        directory (Path):
+            directory to lock
+
+        shared (bool):
+            whether to wait for a shared lock, or to try to get an exclusive lock without waiting
+
+    Returns:
+        Optional[IO]:
+            lock file, which holds the lock until it's closed,
+            or None if the directory couldn't be locked
+    """
+
+    try:
+        # pylint: disable=consider-using-with
+        lock = open(directory / LOCK_FILE_NAME, "a", encoding="utf-8")  # noqa: SIM115
+        # pylint: enable=consider-using-with
+    except OSError:
+        return None
+
+    try:
+        fcntl.flock(lock, fcntl.LOCK_SH if shared else fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock.close()
+        return None
+
+    return lock
+
+
+def _keep_lease(entry: Path, lease: Optional[IO]):
+    """
+    Keep the shared lock of an entry until the process exits, so that it's never evicted.
+    """
+
+    if lease is None:
+        # the entry cannot be locked (e.g., read-only cache), so it's used unprotected
+        return
+
+    previous = LEASES.setdefault(str(entry), lease)
+    if previous is not lease:
+        lease.close()
+
+
+def is_lock_of_directory(lock: IO, directory: Path) -> bool:
+    """
+    Get whether a lock is still the lock of a directory, which is not the case if it's removed.
+
+    Args:
+        lock (IO):
+            lock file returned by `lock_directory`
+
+        directory (Path):
+            directory which was locked
+
+    Returns:
+        bool:
+            True if the lock file is still in the directory, False otherwise
+    """
+
+    try:
+        return os.path.samestat(os.fstat(lock.fileno()), (directory / LOCK_FILE_NAME).stat())
+    except OSError:
+        return False
+
+
+def remove_if_leftover(path: Path, path_stat: os.stat_result) -> bool:
+    """
+    Remove a directory left by a process which was interrupted while staging or removing it.
+
+    Staging directories are only removed once they are old enough to be sure they are abandoned.
+
+    Args:
+        path (Path):
+            directory to check
+
+        path_stat (os.stat_result):
+            status of the directory
+
+    Returns:
+        bool:
+            True if the directory is a staging or a removed directory, False otherwise
+    """
+
+    if path.name.startswith(EVICTED_PREFIX):
+        remove_directory(path)
+        return True
+
+    if path.name.startswith(STAGING_PREFIX):
+        if time.time() - path_stat.st_mtime > ABANDONED_STAGING_DIRECTORY_AGE_IN_SECONDS:
+            remove_directory(path)
+        return True
+
+    return False
+
+
+def remove_directory(path: Path):
+    """
+    Remove a directory used by many processes without them seeing it partially removed.
+
+    Args:
+        path (Path):
+            directory to remove
+    """
+
+    evicted = path.parent / f"{EVICTED_PREFIX}{uuid.uuid4().hex}"
+    try:
+        path.rename(evicted)
+    except OSError:  # pragma: no cover
+        # another process removed it first
+        return
+
+    shutil.rmtree(evicted, ignore_errors=True)
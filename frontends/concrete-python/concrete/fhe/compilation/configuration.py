@@ -6,7 +6,7 @@ import platform
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Tuple, Union, get_type_hints
+from typing import Dict, List, Optional, Tuple, Union, get_type_hints
 
 import numpy as np
 from mlir._mlir_libs._concretelang._compiler import KeysetRestriction, RangeRestriction
@@ -970,6 +970,9 @@ class Configuration:
     p_error: Optional[float]
     global_p_error: Optional[float]
     insecure_key_cache_location: Optional[str]
+    compilation_cache_location: Optional[str]
+    compilation_cache_max_size: int
+    optimizer_cache_location: Optional[str]
     auto_adjust_rounders: bool
     auto_adjust_truncators: bool
     single_precision: bool
@@ -1007,7 +1010,14 @@ class Configuration:
     range_restriction: Optional[RangeRestriction]
     keyset_restriction: Optional[KeysetRestriction]
     auto_schedule_run: bool
+    auto_schedule_max_workers: Optional[int]
+    auto_schedule_max_queue_depth: Optional[int]
+    auto_schedule_reject_when_full: bool
+    auto_schedule_priorities: Optional[Dict[str, int]]
     security_level: SecurityLevel
+    bounds_measurement_batch_size: int
+    bounds_measurement_workers: int
+    retain_streamed_inputsets: bool
 
     def __init__(
         self,
@@ -1024,6 +1034,9 @@ class Configuration:
         enable_unsafe_features: bool = False,
         use_insecure_key_cache: bool = False,
         insecure_key_cache_location: Optional[Union[Path, str]] = None,
+        compilation_cache_location: Optional[Union[Path, str]] = None,
+        compilation_cache_max_size: int = 4 * (1024**3),
+        optimizer_cache_location: Optional[Union[Path, str]] = None,
         loop_parallelize: bool = True,
         dataflow_parallelize: bool = False,
         auto_parallelize: bool = False,
@@ -1080,7 +1093,14 @@ class Configuration:
         range_restriction: Optional[RangeRestriction] = None,
         keyset_restriction: Optional[KeysetRestriction] = None,
         auto_schedule_run: bool = False,
+        auto_schedule_max_workers: Optional[int] = None,
+        auto_schedule_max_queue_depth: Optional[int] = None,
+        auto_schedule_reject_when_full: bool = False,
+        auto_schedule_priorities: Optional[Dict[str, int]] = None,
         security_level: SecurityLevel = SecurityLevel.SECURITY_128_BITS,
+        bounds_measurement_batch_size: int = 128,
+        bounds_measurement_workers: int = 1,
+        retain_streamed_inputsets: bool = False,
     ):
         self.verbose = verbose
         self.compiler_debug_mode = compiler_debug_mode
@@ -1100,6 +1120,17 @@ class Configuration:
             if isinstance(insecure_key_cache_location, Path)
             else insecure_key_cache_location
         )
+        self.compilation_cache_location = (
+            str(compilation_cache_location)
+            if isinstance(compilation_cache_location, Path)
+            else compilation_cache_location
+        )
+        self.compilation_cache_max_size = compilation_cache_max_size
+        self.optimizer_cache_location = (
+            str(optimizer_cache_location)
+            if isinstance(optimizer_cache_location, Path)
+            else optimizer_cache_location
+        )
         self.loop_parallelize = loop_parallelize
         self.dataflow_parallelize = dataflow_parallelize
         self.auto_parallelize = auto_parallelize
@@ -1191,9 +1222,17 @@ class Configuration:
         self.keyset_restriction = keyset_restriction
 
         self.auto_schedule_run = auto_schedule_run
+        self.auto_schedule_max_workers = auto_schedule_max_workers
+        self.auto_schedule_max_queue_depth = auto_schedule_max_queue_depth
+        self.auto_schedule_reject_when_full = auto_schedule_reject_when_full
+        self.auto_schedule_priorities = auto_schedule_priorities
 
         self.security_level = security_level
 
+        self.bounds_measurement_batch_size = bounds_measurement_batch_size
+        self.bounds_measurement_workers = bounds_measurement_workers
+        self.retain_streamed_inputsets = retain_streamed_inputsets
+
         self._validate()
 
     class Keep:
@@ -1217,6 +1256,9 @@ class Configuration:
         enable_unsafe_features: Union[Keep, bool] = KEEP,
         use_insecure_key_cache: Union[Keep, bool] = KEEP,
         insecure_key_cache_location: Union[Keep, Optional[Union[Path, str]]] = KEEP,
+        compilation_cache_location: Union[Keep, Optional[Union[Path, str]]] = KEEP,
+        compilation_cache_max_size: Union[Keep, int] = KEEP,
+        optimizer_cache_location: Union[Keep, Optional[Union[Path, str]]] = KEEP,
         loop_parallelize: Union[Keep, bool] = KEEP,
         dataflow_parallelize: Union[Keep, bool] = KEEP,
         auto_parallelize: Union[Keep, bool] = KEEP,
@@ -1272,7 +1314,14 @@ class Configuration:
         range_restriction: Union[Keep, Optional[RangeRestriction]] = KEEP,
         keyset_restriction: Union[Keep, Optional[KeysetRestriction]] = KEEP,
         auto_schedule_run: Union[Keep, bool] = KEEP,
+        auto_schedule_max_workers: Union[Keep, Optional[int]] = KEEP,
+        auto_schedule_max_queue_depth: Union[Keep, Optional[int]] = KEEP,
+        auto_schedule_reject_when_full: Union[Keep, bool] = KEEP,
+        auto_schedule_priorities: Union[Keep, Optional[Dict[str, int]]] = KEEP,
         security_level: Union[Keep, SecurityLevel] = KEEP,
+        bounds_measurement_batch_size: Union[Keep, int] = KEEP,
+        bounds_measurement_workers: Union[Keep, int] = KEEP,
+        retain_streamed_inputsets: Union[Keep, bool] = KEEP,
     ) -> "Configuration":
         """
         Get a new configuration from another one specified changes.
@@ -1324,6 +1373,27 @@ class Configuration:
 
                 continue  # pragma: no cover
 
+            if name == "auto_schedule_priorities":
+                attr = getattr(self, name)
+                valid = attr is None or (
+                    isinstance(attr, dict)
+                    and all(
+                        isinstance(function_name, str) and isinstance(priority, int)
+                        for function_name, priority in attr.items()
+                    )
+                )
+
+                if not valid:
+                    hint_type = friendly_type_format(hint)
+                    value_type = friendly_type_format(type(attr))
+                    message = (
+                        f"Unexpected type for keyword argument '{name}' "
+                        f"(expected '{hint_type}', got '{value_type}')"
+                    )
+                    raise TypeError(message)
+
+                continue
+
             original_hint = hint
             value = getattr(self, name)
             if str(hint).startswith("typing.Union") or str(hint).startswith("typing.Optional"):
@@ -1349,6 +1419,12 @@ class Configuration:
                 )
                 raise RuntimeError(message)
 
+        for name in ["bounds_measurement_batch_size", "bounds_measurement_workers"]:
+            value = getattr(self, name)
+            if value < 1:
+                message = f"Expected {name} to be positive but it's {value}"
+                raise ValueError(message)
+
         if self.use_insecure_key_cache and self.insecure_key_cache_location is None:
             message = "Insecure key cache cannot be enabled without specifying its location"
             raise RuntimeError(message)
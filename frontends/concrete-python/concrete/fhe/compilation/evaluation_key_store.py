@@ -0,0 +1,223 @@
+"""
+Declaration of `EvaluationKeyStore` class.
+"""
+
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+from .evaluation_keys import EvaluationKeys
+from .server import Server
+from .value import Value
+
+
+class EvaluationKeyStore:
+    """
+    EvaluationKeyStore class, to serve many clients of a server within a memory budget.
+
+    Evaluation keys of each client are stored in a file, named after the identifier of the client.
+    Deserialized evaluation keys are kept in memory, until keeping them would exceed the memory
+    budget, in which case the least recently used ones are evicted and they are loaded again from
+    their file the next time they are used. The most recently used evaluation keys are always kept
+    in memory, even if they don't fit in the memory budget.
+    """
+
+    server: Server
+    location: Path
+    memory_budget: int
+
+    _entries: "OrderedDict[str, EvaluationKeys]"
+    _generations: Dict[str, int]
+    _lock: threading.Lock
+    _statistics: Dict[str, int]
+    _size_of_evaluation_keys: int
+
+    def __init__(self, server: Server, location: Union[str, Path], memory_budget: int):
+        self.server = server
+        self.location = Path(location)
+        self.memory_budget = memory_budget
+
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._lock = threading.Lock()
+        self._statistics = {"hits": 0, "misses": 0, "evictions": 0}
+        self._size_of_evaluation_keys = (
+            server.size_of_bootstrap_keys + server.size_of_keyswitch_keys
+        )
+
+        self.location.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def size_of_evaluation_keys(self) -> int:
+        """
+        Get size of the evaluation keys of a client, which is used to account for memory usage.
+        """
+
+        return self._size_of_evaluation_keys
+
+    def add(self, identifier: str, evaluation_keys: EvaluationKeys):
+        """
+        Add the evaluation keys of a client to the store.
+
+        Args:
+            identifier (str):
+                identifier of the client
+
+            evaluation_keys (EvaluationKeys):
+                evaluation keys of the client
+        """
+
+        path = self._path(identifier)
+
+        with tempfile.NamedTemporaryFile(dir=self.location, prefix=".", delete=False) as f:
+            temporary_path = f.name
+
+        try:
+            evaluation_keys.serialize_to_file(temporary_path)
+            # files are moved in place at once so evaluation keys are never loaded partially
+            os.replace(temporary_path, path)
+        except Exception:
+            os.unlink(temporary_path)
+            raise
+
+        with self._lock:
+            self._bump_generation(identifier)
+            self._entries[identifier] = evaluation_keys
+            self._entries.move_to_end(identifier)
+            self._evict()
+
+    def get(self, identifier: str) -> EvaluationKeys:
+        """
+        Get the evaluation keys of a client.
+
+        Args:
+            identifier (str):
+                identifier of the client
+
+        Returns:
+            EvaluationKeys:
+                evaluation keys of the client
+        """
+
+        path = self._path(identifier)
+
+        with self._lock:
+            evaluation_keys = self._entries.get(identifier)
+            if evaluation_keys is not None:
+                self._statistics["hits"] += 1
+                self._entries.move_to_end(identifier)
+                return evaluation_keys
+
+            self._statistics["misses"] += 1
+            generation = self._generations.get(identifier, 0)
+
+        if not path.exists():
+            message = f"Evaluation keys of '{identifier}' are not in the store"
+            raise ValueError(message)
+
+        # evaluation keys are loaded without holding the lock, so other clients can be served
+        loaded_evaluation_keys = EvaluationKeys.deserialize(path)
+
+        with self._lock:
+            if self._generations.get(identifier, 0) != generation:
+                # evaluation keys were added or removed in the meantime,
+                # so loaded evaluation keys are stale and they must not be put back in memory
+                return self._entries.get(identifier, loaded_evaluation_keys)
+
+            evaluation_keys = self._entries.get(identifier)
+            if evaluation_keys is None:
+                # evaluation keys were not loaded by another thread in the meantime
+                evaluation_keys = loaded_evaluation_keys
+                self._entries[identifier] = evaluation_keys
+
+            self._entries.move_to_end(identifier)
+            self._evict()
+
+        return evaluation_keys
+
+    def remove(self, identifier: str):
+        """
+        Remove the evaluation keys of a client from the store.
+
+        Args:
+            identifier (str):
+                identifier of the client
+        """
+
+        path = self._path(identifier)
+
+        with self._lock:
+            self._bump_generation(identifier)
+            self._entries.pop(identifier, None)
+
+            # file is removed while holding the lock so it's never loaded again after removal
+            if path.exists():
+                path.unlink()
+
+    def run(
+        self,
+        identifier: str,
+        *args: Optional[Union[Value, Tuple[Optional[Value], ...]]],
+        function_name: Optional[str] = None,
+    ) -> Union[Value, Tuple[Value, ...]]:
+        """
+        Evaluate using the evaluation keys of a client.
+
+        Args:
+            identifier (str):
+                identifier of the client
+
+            *args (Optional[Union[Value, Tuple[Optional[Value], ...]]]):
+                argument(s) for evaluation
+
+            function_name (str):
+                The name of the function to run
+
+        Returns:
+            Union[Value, Tuple[Value, ...]]:
+                result(s) of evaluation
+        """
+
+        return self.server.run(
+            *args,
+            evaluation_keys=self.get(identifier),
+            function_name=function_name,
+        )
+
+    def statistics(self) -> Dict[str, int]:
+        """
+        Get usage statistics of the store.
+
+        Returns:
+            Dict[str, int]:
+                number of "hits", "misses" (evaluation keys loaded from their file) and "evictions",
+                along with the number of evaluation keys in memory ("resident")
+                and their total size ("memory")
+        """
+
+        with self._lock:
+            result = dict(self._statistics)
+            result["resident"] = len(self._entries)
+            result["memory"] = len(self._entries) * self.size_of_evaluation_keys
+            return result
+
+    def _path(self, identifier: str) -> Path:
+        if identifier in ["", ".", ".."] or Path(identifier).name != identifier:
+            message = f"Expected identifier to be a valid file name but it's '{identifier}'"
+            raise ValueError(message)
+
+        return self.location / f"{identifier}.keys"
+
+    def _bump_generation(self, identifier: str):
+        # generations let loads which happen without the lock detect that the evaluation keys
+        # were added or removed in the meantime
+        self._generations[identifier] = self._generations.get(identifier, 0) + 1
+
+    def _evict(self):
+        size = self.size_of_evaluation_keys
+        while len(self._entries) > 1 and len(self._entries) * size > self.memory_budget:
+            self._entries.popitem(last=False)
+            self._statistics["evictions"] += 1
@@ -3,6 +3,9 @@ Declaration of `EvaluationKeys`.
 """
 
 # pylint: disable=import-error,no-member,no-name-in-module
+from pathlib import Path
+from typing import Union
+
 from concrete.compiler import ServerKeyset
 from typing_extensions import NamedTuple
 
@@ -20,9 +23,38 @@ class EvaluationKeys(NamedTuple):
         """
         return self.server_keyset.serialize()
 
+    def serialize_to_file(self, path: Union[str, Path]):
+        """
+        Serialize the evaluation keys into a file.
+
+        This is supposed to be more performant than `serialize` as it avoid copying the buffer
+        between the Compiler and the Frontend.
+
+        Args:
+            path (Union[str, Path]):
+                where to save serialized evaluation keys
+        """
+        self.server_keyset.serialize_to_file(str(path))
+
     @staticmethod
-    def deserialize(buffer: bytes) -> "EvaluationKeys":
+    def deserialize(buffer: Union[Path, bytes]) -> "EvaluationKeys":
         """
-        Deserialize evaluation keys from bytes.
+        Deserialize evaluation keys from file or buffer.
+
+        Files are read at once and buffers are read in place, so serialized keys are not copied
+        before they are deserialized. Buffers need to be contiguous (e.g., not strided memoryviews).
+        Deserialized keys are a private copy of the keys in each process, whichever way they are
+        loaded.
+
+        Args:
+            buffer (Union[Path, bytes]):
+                previously serialized evaluation keys (either Path or buffer)
+
+        Returns:
+            EvaluationKeys:
+                deserialized evaluation keys
         """
+
+        if isinstance(buffer, Path):
+            return EvaluationKeys(ServerKeyset.deserialize_from_file(str(buffer)))
         return EvaluationKeys(ServerKeyset.deserialize(buffer))
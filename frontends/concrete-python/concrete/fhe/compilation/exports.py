@@ -0,0 +1,36 @@
+"""
+Export everything users can access through `concrete.fhe.compilation`.
+"""
+
+from .artifacts import DebugArtifacts, FunctionDebugArtifacts, ModuleDebugArtifacts
+from .circuit import Circuit
+from .client import Client
+from .compiler import Compiler
+from .composition import CompositionClause, CompositionPolicy, CompositionRule
+from .configuration import (
+    DEFAULT_GLOBAL_P_ERROR,
+    DEFAULT_P_ERROR,
+    ApproximateRoundingConfig,
+    BitwiseStrategy,
+    ComparisonStrategy,
+    Configuration,
+    Exactness,
+    MinMaxStrategy,
+    MultiParameterStrategy,
+    MultivariateStrategy,
+    ParameterSelectionStrategy,
+)
+from .evaluation_key_store import EvaluationKeyStore
+from .evaluation_keys import EvaluationKeys
+from .keys import Keys
+from .module import FheFunction, FheModule
+from .module_compiler import FunctionDef, ModuleCompiler
+from .pipeline import Pipeline, PipelineNode, PipelineOutput
+from .scheduler import Scheduler
+from .server import Server
+from .specs import ClientSpecs
+from .status import EncryptionStatus
+from .utils import inputset
+from .value import Value
+from .value_batch import ValueBatch
+from .wiring import AllComposable, AllInputs, AllOutputs, Input, NotComposable, Output, Wire, Wired
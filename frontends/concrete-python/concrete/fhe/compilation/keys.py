@@ -6,7 +6,7 @@ Declaration of `Keys` class.
 
 import pathlib
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Callable, Dict, Optional, Union
 
 from concrete.compiler import Keyset, KeysetCache, LweSecretKey
 
@@ -51,10 +51,16 @@ class Keys:
         secret_seed: Optional[int] = None,
         encryption_seed: Optional[int] = None,
         initial_keys: Optional[Dict[int, LweSecretKey]] = None,
+        threads: Optional[int] = 1,
+        progress: Optional[Callable[[int, int], None]] = None,
     ):
         """
         Generate new keys.
 
+        Evaluation keys can be generated concurrently, in which case each of them is encrypted
+        using its own randomness derived from the encryption seed, so generated keys only depend on
+        the seeds, not on the number of threads (but they differ from keys generated on 1 thread).
+
         Args:
             force (bool, default = False):
                 whether to generate new keys even if keys are already generated/loaded
@@ -67,6 +73,13 @@ class Keys:
 
             initial_keys (Optional[Dict[int, LweSecretKey]] = None):
                 initial keys to set before keygen
+
+            threads (Optional[int], default = 1):
+                number of threads to generate evaluation keys with (all hardware threads if None)
+
+            progress (Optional[Callable[[int, int], None]], default = None):
+                function called after each generated key,
+                with the number of generated keys and the total number of keys
         """
 
         if self._keyset is None or force:
@@ -82,6 +95,9 @@ class Keys:
             if encryption_seed < 0 or encryption_seed >= 2**128:
                 message = "encryption_seed must be a positive 128 bits integer"
                 raise ValueError(message)
+            if threads is not None and threads <= 0:
+                message = "threads must be a positive integer"
+                raise ValueError(message)
             secret_seed_msb = (secret_seed >> 64) & 0xFFFFFFFFFFFFFFFF
             secret_seed_lsb = (secret_seed) & 0xFFFFFFFFFFFFFFFF
             encryption_seed_msb = (encryption_seed >> 64) & 0xFFFFFFFFFFFFFFFF
@@ -95,6 +111,8 @@ class Keys:
                 encryption_seed_msb,
                 encryption_seed_lsb,
                 initial_keys,
+                threads if threads is not None else 0,
+                progress,
             )
 
     def save(self, location: Union[str, Path]):
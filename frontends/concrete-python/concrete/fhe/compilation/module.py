@@ -5,7 +5,9 @@ Declaration of `FheModule` classes.
 # pylint: disable=import-error,no-member,no-name-in-module
 
 import asyncio
-from concurrent.futures import Future, ThreadPoolExecutor
+import functools
+import inspect
+from concurrent.futures import Executor, Future
 from pathlib import Path
 from threading import Thread
 from typing import Any, Awaitable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
@@ -20,6 +22,9 @@ from .client import Client
 from .composition import CompositionRule
 from .configuration import Configuration
 from .keys import Keys
+from .pipeline import Pipeline
+from .profiler import CompilationProfiler
+from .scheduler import Scheduler
 from .server import Server
 from .utils import Lazy
 from .value import Value
@@ -35,16 +40,22 @@ class ExecutionRt:
     client: Client
     server: Server
     auto_schedule_run: bool
-    fhe_executor_pool: ThreadPoolExecutor
+    fhe_executor_pool: Scheduler
     fhe_waiter_loop: asyncio.BaseEventLoop
     fhe_waiter_thread: Thread  # daemon thread
 
-    def __init__(self, client, server, auto_schedule_run):
+    def __init__(self, client, server, auto_schedule_run, configuration=None):
         self.client = client
         self.server = server
         self.auto_schedule_run = auto_schedule_run
         if auto_schedule_run:
-            self.fhe_executor_pool = ThreadPoolExecutor()
+            configuration = configuration if configuration is not None else Configuration()
+            self.fhe_executor_pool = Scheduler(
+                max_workers=configuration.auto_schedule_max_workers,
+                max_queue_depth=configuration.auto_schedule_max_queue_depth,
+                reject_when_full=configuration.auto_schedule_reject_when_full,
+                priorities=configuration.auto_schedule_priorities,
+            )
             self.fhe_waiter_loop = asyncio.new_event_loop()
 
             def loop_thread():
@@ -245,11 +256,62 @@ class FheFunction:
         ):
             client = self.execution_runtime.val.client
             server = self.execution_runtime.val.server
-            self.execution_runtime = Lazy(lambda: ExecutionRt(client, server, True))
+            configuration = self.configuration
+            self.execution_runtime = Lazy(lambda: ExecutionRt(client, server, True, configuration))
             self.execution_runtime.val.auto_schedule_run = False
 
         return self._run(False, *args)
 
+    async def run_coro(
+        self,
+        *args: Any,
+        executor: Optional[Executor] = None,
+        timeout: Optional[float] = None,
+    ) -> Union[Value, Tuple[Value, ...]]:
+        """
+        Evaluate the function on the event loop of the caller.
+
+        Arguments can be results of previous evaluations which are not available yet, such as
+        coroutines or tasks of `run_coro`, or futures of `run_async`. They are awaited concurrently
+        on the event loop of the caller, without any additional thread. Then the evaluation, which
+        releases the GIL, runs in `executor`.
+
+        Cancelling the coroutine cancels the evaluation if it's not started yet, otherwise its
+        result is discarded once it's done.
+
+        Args:
+            *args (Any):
+                argument(s) for evaluation, or awaitable(s) of argument(s) for evaluation
+
+            executor (Optional[Executor], default = None):
+                executor to run the evaluation in (the default executor of the event loop if None)
+
+            timeout (Optional[float], default = None):
+                maximum number of seconds to wait for the evaluation, including its arguments,
+                before raising `asyncio.TimeoutError`
+
+        Returns:
+            Union[Value, Tuple[Value, ...]]:
+                result(s) of evaluation
+        """
+
+        if timeout is not None:
+            return await asyncio.wait_for(self.run_coro(*args, executor=executor), timeout)
+
+        async def ready(arg: Any) -> Any:
+            if isinstance(arg, Future):
+                return await asyncio.wrap_future(arg)
+            if inspect.isawaitable(arg):
+                return await arg
+            return arg
+
+        if any(isinstance(arg, Future) or inspect.isawaitable(arg) for arg in args):
+            args = tuple(await asyncio.gather(*(ready(arg) for arg in args)))
+
+        # simulation runs in `executor` as well, as it can take as long as the evaluation
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(self._run, True, *args))
+
     def run(
         self,
         *args: Optional[Union[Value, Tuple[Optional[Value], ...]]],
@@ -306,8 +368,8 @@ class FheFunction:
 
         all_args_done = all(not isinstance(arg, Future) or arg.done() for arg in args)
 
-        fhe_work_future = lambda *args: self.execution_runtime.val.fhe_executor_pool.submit(
-            fhe_work, *args
+        fhe_work_future = lambda *args: self.execution_runtime.val.fhe_executor_pool.submit_for(
+            self.name, fhe_work, *args
         )
         if all_args_done:
             return fhe_work_future(*args_ready(args))  # type: ignore
@@ -323,7 +385,10 @@ class FheFunction:
 
         async def args_ready_and_submit(*args):
             args = [await wait_async(arg) for arg in args]
-            return await wait_async(fhe_work_future(*args))
+            # submitting blocks while the queues of the scheduler are full,
+            # so it's done in another thread, to keep waiting for the other evaluations meanwhile
+            loop = asyncio.get_running_loop()
+            return await wait_async(await loop.run_in_executor(None, fhe_work_future, *args))
 
         run_async = args_ready_and_submit(*args)
         return asyncio.run_coroutine_threadsafe(
@@ -705,6 +770,7 @@ class FheModule:
     compilation_context: CompilationContext
     execution_runtime: Lazy[ExecutionRt]
     simulation_runtime: Lazy[SimulationRt]
+    profiler: CompilationProfiler
 
     def __init__(
         self,
@@ -713,20 +779,25 @@ class FheModule:
         compilation_context: CompilationContext,
         configuration: Optional[Configuration] = None,
         composition_rules: Optional[Iterable[CompositionRule]] = None,
+        profiler: Optional[CompilationProfiler] = None,
     ):
         assert configuration
         self.configuration = configuration if configuration is not None else Configuration()
         self.graphs = graphs
         self.mlir_module = mlir
         self.compilation_context = compilation_context
+        self.profiler = profiler if profiler is not None else CompilationProfiler()
+
+        # runtimes are initialized lazily, so their compilation is measured whenever it happens
 
         def init_simulation():
-            simulation_server = Server.create(
-                self.mlir_module,
-                self.configuration.fork(fhe_simulation=True),
-                is_simulated=True,
-                compilation_context=self.compilation_context,
-            )
+            with self.profiler.stage("simulation-compilation"):
+                simulation_server = Server.create(
+                    self.mlir_module,
+                    self.configuration.fork(fhe_simulation=True),
+                    is_simulated=True,
+                    compilation_context=self.compilation_context,
+                )
             simulation_client = Client(simulation_server.client_specs, is_simulated=True)
             return SimulationRt(simulation_client, simulation_server)
 
@@ -735,13 +806,14 @@ class FheModule:
             self.simulation_runtime.init()
 
         def init_execution():
-            execution_server = Server.create(
-                self.mlir_module,
-                self.configuration.fork(fhe_simulation=False),
-                compilation_context=self.compilation_context,
-                composition_rules=composition_rules,
-                is_simulated=False,
-            )
+            with self.profiler.stage("compilation"):
+                execution_server = Server.create(
+                    self.mlir_module,
+                    self.configuration.fork(fhe_simulation=False),
+                    compilation_context=self.compilation_context,
+                    composition_rules=composition_rules,
+                    is_simulated=False,
+                )
             keyset_cache_directory = None
             if self.configuration.use_insecure_key_cache:
                 assert_that(self.configuration.enable_unsafe_features)
@@ -751,7 +823,10 @@ class FheModule:
                 execution_server.client_specs, keyset_cache_directory, is_simulated=False
             )
             return ExecutionRt(
-                execution_client, execution_server, self.configuration.auto_schedule_run
+                execution_client,
+                execution_server,
+                self.configuration.auto_schedule_run,
+                self.configuration,
             )
 
         self.execution_runtime = Lazy(init_execution)
@@ -877,6 +952,26 @@ class FheModule:
         }
         return statistics
 
+    @property
+    def compilation_profile(self) -> Dict[str, Any]:
+        """
+        Get the time and the peak memory spent in each compilation stage of the module.
+
+        Compilation with the optimizer and LLVM is only measured once it has happened,
+        as it's performed lazily unless `fhe_simulation` or `fhe_execution` is set.
+        """
+        return self.profiler.summary()
+
+    def export_compilation_profile(self, path: Union[str, Path]):
+        """
+        Export the compilation stages of the module to a file in the Chrome trace event format.
+
+        Args:
+            path (Union[str, Path]):
+                path of the JSON file to export to
+        """
+        self.profiler.export_chrome_trace(path)
+
     def functions(self) -> Dict[str, FheFunction]:
         """
         Return a dictionnary containing all the functions of the module.
@@ -892,6 +987,28 @@ class FheModule:
             for name in self.graphs.keys()
         }
 
+    def pipeline(self) -> Pipeline:
+        """
+        Create a pipeline, to evaluate a graph of invocations of functions of the module at once.
+
+        Invocations are evaluated on the scheduler of the module if `auto_schedule_run` is enabled.
+
+        Returns:
+            Pipeline:
+                empty pipeline, using the evaluation keys of the client of the module
+        """
+        runtime = self.execution_runtime.val
+        return Pipeline(runtime.server, runtime.client, runtime.fhe_executor_pool)
+
+    @property
+    def scheduler(self) -> Optional[Scheduler]:
+        """
+        Get the scheduler of the evaluations of the module, if `auto_schedule_run` is enabled.
+
+        Its `statistics` method reports the depth of the queues and how long evaluations waited.
+        """
+        return self.execution_runtime.val.fhe_executor_pool
+
     @property
     def server(self) -> Server:
         """
@@ -5,9 +5,10 @@ Declaration of `MultiCompiler` class.
 # pylint: disable=import-error,no-name-in-module
 
 import inspect
+import itertools
 import traceback
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 import numpy as np
 from concrete.compiler import CompilationContext
@@ -21,6 +22,7 @@ from .artifacts import DebugManager, FunctionDebugArtifacts, ModuleDebugArtifact
 from .composition import CompositionPolicy
 from .configuration import Configuration
 from .module import FheModule
+from .profiler import CompilationProfiler
 from .status import EncryptionStatus
 from .utils import fuse
 from .wiring import Input, Output, TracedOutput, Wire, Wired, WireTracingContextManager
@@ -115,6 +117,7 @@ class FunctionDef:
         self,
         sample: Union[Any, Tuple[Any, ...]],
         artifacts: Optional[FunctionDebugArtifacts] = None,
+        profiler: Optional[CompilationProfiler] = None,
     ):
         """
         Trace the function and fuse the resulting graph with a sample input.
@@ -124,8 +127,12 @@ class FunctionDef:
                 sample to use for tracing
             artifacts: Optiona[FunctionDebugArtifacts]:
                 the object to store artifacts in
+            profiler (Optional[CompilationProfiler], default = None):
+                the object to measure the stages with
         """
 
+        profiler = profiler if profiler is not None else CompilationProfiler()
+
         if artifacts is not None:
             artifacts.add_source_code(self.function)
             for param, encryption_status in self.parameter_encryption_statuses.items():
@@ -143,11 +150,13 @@ class FunctionDef:
             )
         }
 
-        self.graph = Tracer.trace(self.function, parameters, location=self.location)
+        with profiler.stage("tracing", self.name):
+            self.graph = Tracer.trace(self.function, parameters, location=self.location)
         if artifacts is not None:
             artifacts.add_graph("initial", self.graph)
 
-        fuse(self.graph, artifacts)
+        with profiler.stage("fusing", self.name):
+            fuse(self.graph, artifacts)
 
     def evaluate(
         self,
@@ -155,6 +164,7 @@ class FunctionDef:
         inputset: Optional[Union[Iterable[Any], Iterable[Tuple[Any, ...]]]],
         configuration: Configuration,
         artifacts: FunctionDebugArtifacts,
+        profiler: Optional[CompilationProfiler] = None,
     ):
         """
         Trace, fuse, measure bounds, and update values in the resulting graph in one go.
@@ -171,58 +181,62 @@ class FunctionDef:
 
             artifacts (FunctionDebugArtifacts):
                 artifact object to store informations in
+
+            profiler (Optional[CompilationProfiler], default = None):
+                profiler object to measure the stages with
         """
 
+        profiler = profiler if profiler is not None else CompilationProfiler()
+
         if self._is_direct:
-            self.graph = Tracer.trace(
-                self.function,
-                self._parameter_values,
-                is_direct=True,
-                location=self.location,
-            )
+            with profiler.stage("tracing", self.name):
+                self.graph = Tracer.trace(
+                    self.function,
+                    self._parameter_values,
+                    is_direct=True,
+                    location=self.location,
+                )
             artifacts.add_graph("initial", self.graph)  # pragma: no cover
-            fuse(
-                self.graph,
-                artifacts,
-            )
+            with profiler.stage("fusing", self.name):
+                fuse(
+                    self.graph,
+                    artifacts,
+                )
             artifacts.add_graph("final", self.graph)  # pragma: no cover
             return
 
+        new_samples: Iterable[Any] = ()
         if inputset is not None:
-            previous_inputset_length = len(self.inputset)
-            for index, sample in enumerate(iter(inputset)):
-                self.inputset.append(sample)
-
-                if not isinstance(sample, tuple):
-                    sample = (sample,)
-
-                if len(sample) != len(self.parameter_encryption_statuses):
+            if isinstance(inputset, Iterator) and not configuration.retain_streamed_inputsets:
+                # samples of iterators (e.g., generators) are consumed in a single pass
+                # without keeping them in memory, so they are not measured in future compilations
+                new_samples = self._check_inputset(inputset)
+            else:
+                previous_inputset_length = len(self.inputset)
+                try:
+                    self.inputset.extend(self._check_inputset(inputset))
+                except ValueError:
                     self.inputset = self.inputset[:previous_inputset_length]
+                    raise
+
+        samples: Iterable[Any] = itertools.chain(self.inputset, new_samples)
 
-                    expected = (
-                        "a single value"
-                        if len(self.parameter_encryption_statuses) == 1
-                        else f"a tuple of {len(self.parameter_encryption_statuses)} values"
-                    )
-                    actual = (
-                        "a single value" if len(sample) == 1 else f"a tuple of {len(sample)} values"
-                    )
-
-                    message = (
-                        f"Input #{index} of your inputset is not well formed "
-                        f"(expected {expected} got {actual})"
-                    )
-                    raise ValueError(message)
+        if configuration.auto_adjust_rounders or configuration.auto_adjust_truncators:
+            # adjustment goes over the samples many times so they need to be in memory
+            samples = list(samples)
 
         if configuration.auto_adjust_rounders:
-            AutoRounder.adjust(self.function, self.inputset)
+            with profiler.stage("rounder-adjustment", self.name):
+                AutoRounder.adjust(self.function, samples)
 
         if configuration.auto_adjust_truncators:
-            AutoTruncator.adjust(self.function, self.inputset)
+            with profiler.stage("truncator-adjustment", self.name):
+                AutoTruncator.adjust(self.function, samples)
 
+        samples_iterator = iter(samples)
         if self.graph is None:
             try:
-                first_sample = next(iter(self.inputset))
+                first_sample = next(samples_iterator)
             except StopIteration as error:
                 message = (
                     f"{action} function '{self.function.__name__}' "
@@ -230,14 +244,61 @@ class FunctionDef:
                 )
                 raise RuntimeError(message) from error
 
-            self.trace(first_sample, artifacts)
+            self.trace(first_sample, artifacts, profiler)
             assert self.graph is not None
 
-        bounds = self.graph.measure_bounds(self.inputset)
-        self.graph.update_with_bounds(bounds)
+            samples_iterator = itertools.chain((first_sample,), samples_iterator)
+
+        with profiler.stage("bounds-measurement", self.name):
+            bounds = self.graph.measure_bounds(
+                samples_iterator,
+                batch_size=configuration.bounds_measurement_batch_size,
+                workers=configuration.bounds_measurement_workers,
+            )
+            self.graph.update_with_bounds(bounds)
 
         artifacts.add_graph("final", self.graph)
 
+    def _check_inputset(
+        self,
+        inputset: Union[Iterable[Any], Iterable[Tuple[Any, ...]]],
+    ) -> Iterator[Any]:
+        """
+        Go over the samples of an inputset, while making sure they are well formed.
+
+        Args:
+            inputset (Union[Iterable[Any], Iterable[Tuple[Any, ...]]]):
+                inputset to go over
+
+        Returns:
+            Iterator[Any]:
+                samples of the inputset
+
+        Raises:
+            ValueError:
+                if a sample doesn't have a value for each parameter of the function
+        """
+
+        for index, sample in enumerate(iter(inputset)):
+            values = sample if isinstance(sample, tuple) else (sample,)
+            if len(values) != len(self.parameter_encryption_statuses):
+                expected = (
+                    "a single value"
+                    if len(self.parameter_encryption_statuses) == 1
+                    else f"a tuple of {len(self.parameter_encryption_statuses)} values"
+                )
+                actual = (
+                    "a single value" if len(values) == 1 else f"a tuple of {len(values)} values"
+                )
+
+                message = (
+                    f"Input #{index} of your inputset is not well formed "
+                    f"(expected {expected} got {actual})"
+                )
+                raise ValueError(message)
+
+            yield sample
+
     def __call__(
         self,
         *args: Any,
@@ -397,12 +458,21 @@ class ModuleCompiler:
 
         dbg = DebugManager(configuration)
 
+        profiler = CompilationProfiler()
+        module_artifacts.add_compilation_profiler(profiler)
+
         try:
             # Trace and fuse the functions
             for name, function in self.functions.items():
                 inputset = inputsets[name] if inputsets is not None else None
                 function_artifacts = module_artifacts.functions[name]
-                function.evaluate("Compiling", inputset, configuration, function_artifacts)
+                function.evaluate(
+                    "Compiling",
+                    inputset,
+                    configuration,
+                    function_artifacts,
+                    profiler,
+                )
                 assert function.graph is not None
                 dbg.debug_computation_graph(name, function.graph)
 
@@ -420,6 +490,7 @@ class ModuleCompiler:
                 self.composition.get_rules_iter(
                     list(filter(None, [f.graph for f in self.functions.values()]))
                 ),
+                profiler,
             ).convert_many(graphs, mlir_context)
             mlir_str = str(mlir_module).strip()
             dbg.debug_mlir(mlir_str)
@@ -442,6 +513,7 @@ class ModuleCompiler:
                     self.composition.get_rules_iter(
                         list(filter(None, [f.graph for f in self.functions.values()]))
                     ),
+                    profiler,
                 )
                 module_artifacts.add_execution_runtime(output.execution_runtime)
 
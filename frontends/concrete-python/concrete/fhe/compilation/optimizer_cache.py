@@ -0,0 +1,268 @@
+"""
+Declaration of `OptimizerCache` class.
+"""
+
+# pylint: disable=import-error,no-member,no-name-in-module
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import ClassVar, Dict, Iterable, Optional, Set, Union
+
+from concrete.compiler import ProgramInfo
+from mlir._mlir_libs._concretelang._compiler import RangeRestriction
+
+from .compilation_cache import CompilationCache
+from .composition import CompositionRule
+from .configuration import Configuration, ParameterSelectionStrategy
+
+# pylint: enable=import-error,no-member,no-name-in-module
+
+DENSE_CONSTANT = re.compile(r"^(\s*)(%[\w.$-]+) = arith\.constant dense<.*> : (.*)$")
+SSA_VALUE = re.compile(r"%[\w.$-]+")
+
+
+class OptimizerCache:
+    """
+    OptimizerCache class, to reuse cryptographic parameters found by the optimizer.
+
+    Parameters are stored per optimization problem, which is the MLIR of the circuit without the
+    contents of its lookup tables, along with the options of the optimizer. So a circuit can reuse
+    the parameters of another one which only differs in its lookup tables (e.g., because of a new
+    inputset moving some bounds without changing bit-widths).
+
+    Reused parameters are given to the optimizer as the only available choices, so it still
+    checks that they satisfy the constraints of the circuit. When they don't, the optimizer is run
+    again without restrictions.
+    """
+
+    location: Path
+
+    _statistics: ClassVar[Dict[str, int]] = {"hits": 0, "misses": 0, "rejections": 0}
+    _statistics_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, location: Union[str, Path]):
+        self.location = Path(location)
+
+    @staticmethod
+    def of(configuration: Configuration) -> Optional["OptimizerCache"]:
+        """
+        Get the optimizer cache to use with a configuration.
+
+        Args:
+            configuration (Configuration):
+                configuration to get the optimizer cache of
+
+        Returns:
+            Optional[OptimizerCache]:
+                optimizer cache of the configuration
+                or None if it's disabled or if the optimizer cannot be restricted
+        """
+
+        if configuration.optimizer_cache_location is None:
+            return None
+
+        if configuration.parameter_selection_strategy == ParameterSelectionStrategy.V0:
+            return None
+
+        if configuration.keyset_restriction or configuration.range_restriction:
+            # user restrictions cannot be combined with the restrictions of the cache
+            return None
+
+        return OptimizerCache(configuration.optimizer_cache_location)
+
+    @staticmethod
+    def key(
+        mlir: str,
+        configuration: Configuration,
+        composition_rules: Iterable[CompositionRule],
+    ) -> str:
+        """
+        Compute the key of an optimization problem.
+
+        Args:
+            mlir (str):
+                mlir to compile
+
+            configuration (Configuration):
+                configuration to use
+
+            composition_rules (Iterable[CompositionRule]):
+                composition rules to be applied when compiling
+
+        Returns:
+            str:
+                key of the optimization problem
+        """
+
+        compilation_key = CompilationCache.key(
+            OptimizerCache.normalize(mlir),
+            configuration,
+            False,
+            composition_rules,
+        )
+        return hashlib.sha256(f"optimizer:{compilation_key}".encode()).hexdigest()
+
+    @staticmethod
+    def normalize(mlir: str) -> str:
+        """
+        Remove the contents of lookup tables from MLIR, as they don't affect the optimizer.
+
+        Args:
+            mlir (str):
+                mlir to normalize
+
+        Returns:
+            str:
+                normalized mlir
+        """
+
+        lines = mlir.strip().splitlines()
+
+        constants: Dict[str, int] = {}
+        for index, line in enumerate(lines):
+            match = DENSE_CONSTANT.match(line)
+            if match:
+                constants[match.group(2)] = index
+
+        not_only_used_in_lookup_tables: Set[str] = set()
+        for index, line in enumerate(lines):
+            if "lookup_table" in line:
+                continue
+            for value in SSA_VALUE.findall(line):
+                if value in constants and constants[value] != index:
+                    not_only_used_in_lookup_tables.add(value)
+
+        for value, index in constants.items():
+            if value not in not_only_used_in_lookup_tables:
+                match = DENSE_CONSTANT.match(lines[index])
+                assert match is not None
+                indentation, _, value_type = match.groups()
+                lines[index] = f"{indentation}{value} = arith.constant dense<...> : {value_type}"
+
+        return "\n".join(lines)
+
+    def lookup(self, key: str) -> Optional[RangeRestriction]:
+        """
+        Get the parameters of an optimization problem from the cache.
+
+        Args:
+            key (str):
+                key of the optimization problem
+
+        Returns:
+            Optional[RangeRestriction]:
+                restriction to the parameters of the optimization problem
+                or None if it's not in the cache
+        """
+
+        try:
+            with open(self.location / f"{key}.json", "r", encoding="utf-8") as f:
+                parameters = json.load(f)
+
+            restriction = RangeRestriction()
+            for name, values in parameters.items():
+                add = getattr(restriction, f"add_available_{name}")
+                for value in values:
+                    add(value)
+
+        except Exception:  # pylint: disable=broad-except
+            OptimizerCache._record("misses")
+            return None
+
+        OptimizerCache._record("hits")
+        return restriction
+
+    def insert(self, key: str, program_info: ProgramInfo):
+        """
+        Insert the parameters found by the optimizer to the cache.
+
+        Args:
+            key (str):
+                key of the optimization problem
+
+            program_info (ProgramInfo):
+                program info of the compilation
+        """
+
+        keyset_info = program_info.get_keyset_info()
+        bootstrap_keys = keyset_info.bootstrap_keys()
+        keyswitch_keys = keyset_info.keyswitch_keys()
+
+        if len(bootstrap_keys) == 0 or len(keyswitch_keys) == 0:
+            # parameters of circuits without table lookups are not fully determined by the keys
+            return
+
+        parameters: Dict[str, Set[int]] = {
+            "glwe_log_polynomial_size": set(),
+            "glwe_dimension": set(),
+            "internal_lwe_dimension": set(),
+            "pbs_level_count": set(),
+            "pbs_base_log": set(),
+            "ks_level_count": set(),
+            "ks_base_log": set(),
+        }
+        for bootstrap_key in bootstrap_keys:
+            parameters["glwe_log_polynomial_size"].add(
+                bootstrap_key.polynomial_size().bit_length() - 1
+            )
+            parameters["glwe_dimension"].add(bootstrap_key.glwe_dimension())
+            parameters["internal_lwe_dimension"].add(bootstrap_key.input_lwe_dimension())
+            parameters["pbs_level_count"].add(bootstrap_key.level())
+            parameters["pbs_base_log"].add(bootstrap_key.base_log())
+        for keyswitch_key in keyswitch_keys:
+            parameters["ks_level_count"].add(keyswitch_key.level())
+            parameters["ks_base_log"].add(keyswitch_key.base_log())
+
+        self.location.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=self.location,
+            prefix=f".{key}.",
+            delete=False,
+        ) as f:
+            json.dump({name: sorted(values) for name, values in parameters.items()}, f)
+
+        # files are moved in place at once so other processes never read incomplete files
+        os.replace(f.name, self.location / f"{key}.json")
+
+    @staticmethod
+    def reject():
+        """
+        Record that parameters from the cache were not valid for a circuit.
+        """
+
+        OptimizerCache._record("rejections")
+
+    @staticmethod
+    def statistics() -> Dict[str, int]:
+        """
+        Get how many times the caches were used in this process.
+
+        Returns:
+            Dict[str, int]:
+                number of "hits", "misses" and "rejections" (hits with invalid parameters)
+        """
+
+        with OptimizerCache._statistics_lock:
+            return dict(OptimizerCache._statistics)
+
+    @staticmethod
+    def reset_statistics():
+        """
+        Reset usage statistics of the caches.
+        """
+
+        with OptimizerCache._statistics_lock:
+            for name in OptimizerCache._statistics:
+                OptimizerCache._statistics[name] = 0
+
+    @staticmethod
+    def _record(event: str):
+        with OptimizerCache._statistics_lock:
+            OptimizerCache._statistics[event] += 1
@@ -0,0 +1,402 @@
+"""
+Declaration of `Pipeline` class.
+"""
+
+# pylint: disable=import-error,no-name-in-module,protected-access
+
+import queue
+from concurrent.futures import Executor, Future
+from typing import Any, List, NamedTuple, Optional, Set, Tuple, Union
+
+import numpy as np
+from concrete.compiler import TransportValue
+from concrete.compiler import Value as Value_
+
+from .client import Client
+from .composition import CompositionClause, CompositionRule
+from .evaluation_keys import EvaluationKeys
+from .scheduler import Scheduler
+from .server import Server
+from .value import Value
+
+# pylint: enable=import-error,no-name-in-module
+
+
+class PipelineOutput(NamedTuple):
+    """
+    An output of an invocation of a pipeline, or an input of the pipeline if `node` is -1.
+    """
+
+    node: int
+    position: int
+
+
+class PipelineNode:
+    """
+    PipelineNode class, to refer to an invocation of a function in a pipeline.
+
+    The node itself refers to the only output of the function, and `node[i]` refers to the output
+    `i` of the function.
+    """
+
+    pipeline: "Pipeline"
+    index: int
+    function_name: str
+    outputs: int
+
+    def __init__(self, pipeline: "Pipeline", index: int, function_name: str, outputs: int):
+        self.pipeline = pipeline
+        self.index = index
+        self.function_name = function_name
+        self.outputs = outputs
+
+    def __getitem__(self, position: int) -> PipelineOutput:
+        if not 0 <= position < self.outputs:
+            message = (
+                f"Expected output position of '{self.function_name}' "
+                f"to be in range [0, {self.outputs}) but it's {position}"
+            )
+            raise IndexError(message)
+
+        return PipelineOutput(self.index, position)
+
+
+class _Invocation(NamedTuple):
+    function_name: str
+    # each argument is either an output of a node or an input of the pipeline,
+    # or a clear argument which is prepared on the first run
+    arguments: List[Union[PipelineOutput, Any]]
+    clear_positions: List[int]
+
+
+class Pipeline:
+    """
+    Pipeline class, to evaluate a graph of function invocations of a server at once.
+
+    Invocations are wired together by passing outputs of previous invocations as arguments of next
+    ones, so the graph is always acyclic. Each wire is validated against the composition rules of
+    the server when the invocation is added, and clear arguments are prepared on the first run.
+    So, running the pipeline only calls the functions of the server, directly with the results of
+    previous calls, without wrapping them into `Value`s or checking them again.
+
+    Invocations which don't depend on each other can be evaluated concurrently on an executor.
+    """
+
+    server: Server
+    client: Optional[Client]
+    executor: Optional[Executor]
+
+    _inputs: int
+    _invocations: List[_Invocation]
+    _outputs: List[PipelineOutput]
+    _composition_rules: Set[CompositionRule]
+
+    _prepared: Optional[List[List[Any]]]
+    _dependents: Optional[List[List[int]]]
+    _dependencies: Optional[List[int]]
+
+    def __init__(
+        self,
+        server: Server,
+        client: Optional[Client] = None,
+        executor: Optional[Executor] = None,
+    ):
+        self.server = server
+        self.client = client
+        self.executor = executor
+
+        self._inputs = 0
+        self._invocations = []
+        self._outputs = []
+        self._composition_rules = set(server._composition_rules or [])
+
+        self._prepared = None
+        self._dependents = None
+        self._dependencies = None
+
+    def input(self) -> PipelineOutput:
+        """
+        Add an input to the pipeline.
+
+        Returns:
+            PipelineOutput:
+                reference to the input, to use as an argument of invocations
+                (inputs are given to `run` in the order they are added)
+        """
+
+        self._inputs += 1
+        return PipelineOutput(-1, self._inputs - 1)
+
+    def call(self, function_name: str, *args: Any) -> PipelineNode:
+        """
+        Add an invocation of a function to the pipeline.
+
+        Args:
+            function_name (str):
+                name of the function to invoke
+
+            *args (Any):
+                arguments of the invocation, each one is either an input of the pipeline,
+                an output of a previous invocation, or a clear value for a clear parameter
+
+        Returns:
+            PipelineNode:
+                reference to the invocation, to use its outputs as arguments of next invocations
+        """
+
+        circuit = self.server.program_info.get_circuit(function_name)
+        parameters = circuit.get_inputs()
+        outputs = len(circuit.get_outputs())
+
+        if len(args) != len(parameters):
+            message = (
+                f"Expected {len(parameters)} arguments for '{function_name}' "
+                f"but got {len(args)}"
+            )
+            raise ValueError(message)
+
+        arguments: List[Union[PipelineOutput, Any]] = []
+        clear_positions = []
+        for position, arg in enumerate(args):
+            if isinstance(arg, PipelineNode):
+                if arg.pipeline is not self:
+                    message = f"Expected argument {position} to be an invocation of this pipeline"
+                    raise ValueError(message)
+                if arg.outputs != 1:
+                    message = (
+                        f"Expected argument {position} to be a single output "
+                        f"but '{arg.function_name}' has {arg.outputs} outputs "
+                        f"(use `node[i]` to select one)"
+                    )
+                    raise ValueError(message)
+                arg = arg[0]
+
+            if isinstance(arg, PipelineOutput):
+                self._check_wire(arg, function_name, position)
+            elif parameters[position].get_type_info().is_plaintext():
+                clear_positions.append(position)
+            else:
+                message = (
+                    f"Expected argument {position} of '{function_name}' "
+                    f"to be an input of the pipeline or an output of an invocation"
+                )
+                raise ValueError(message)
+
+            arguments.append(arg)
+
+        self._invocations.append(_Invocation(function_name, arguments, clear_positions))
+        self._prepared = None
+
+        return PipelineNode(self, len(self._invocations) - 1, function_name, outputs)
+
+    def output(self, *outputs: Union[PipelineNode, PipelineOutput]):
+        """
+        Add outputs to the pipeline, which are returned by `run` in the order they are added.
+
+        Args:
+            *outputs (Union[PipelineNode, PipelineOutput]):
+                invocations or outputs of invocations
+        """
+
+        for output in outputs:
+            if isinstance(output, PipelineNode):
+                self._outputs.extend(output[position] for position in range(output.outputs))
+            else:
+                self._outputs.append(output)
+
+    def run(
+        self,
+        *args: Value,
+        evaluation_keys: Optional[EvaluationKeys] = None,
+        executor: Optional[Executor] = None,
+    ) -> Union[Value, Tuple[Value, ...]]:
+        """
+        Evaluate the pipeline.
+
+        Args:
+            *args (Value):
+                inputs of the pipeline
+
+            evaluation_keys (Optional[EvaluationKeys], default = None):
+                evaluation keys required for fhe execution
+                (evaluation keys of the client of the pipeline if None)
+
+            executor (Optional[Executor], default = None):
+                executor to evaluate independent invocations concurrently
+                (executor of the pipeline if None, and invocations are evaluated in order if the
+                pipeline has no executor)
+
+        Returns:
+            Union[Value, Tuple[Value, ...]]:
+                output(s) of the pipeline
+        """
+
+        if len(args) != self._inputs:
+            message = f"Expected {self._inputs} inputs but got {len(args)}"
+            raise ValueError(message)
+
+        if len(self._outputs) == 0:
+            message = "Expected the pipeline to have at least one output"
+            raise ValueError(message)
+
+        for i, arg in enumerate(args):
+            if not isinstance(arg, Value):
+                message = f"Expected input {i} to be an fhe.Value but it's {type(arg).__name__}"
+                raise ValueError(message)
+
+        if evaluation_keys is None and not self.server.is_simulated:
+            if self.client is None:
+                message = "Expected evaluation keys to be provided when not in simulation mode"
+                raise RuntimeError(message)
+            evaluation_keys = self.client.evaluation_keys
+
+        if executor is None:
+            executor = self.executor
+
+        self._prepare()
+        assert self._prepared is not None
+
+        inputs = [arg._inner for arg in args]
+        results: List[Optional[List[TransportValue]]] = [None] * len(self._invocations)
+        server_keyset = evaluation_keys.server_keyset if evaluation_keys is not None else None
+
+        def evaluate(index: int) -> int:
+            invocation = self._invocations[index]
+
+            arguments = [
+                (
+                    (
+                        inputs[arg.position]
+                        if arg.node == -1
+                        else results[arg.node][arg.position]  # type: ignore
+                    )
+                    if isinstance(arg, PipelineOutput)
+                    else arg
+                )
+                for arg in self._prepared[index]  # type: ignore
+            ]
+
+            circuit = self.server._get_server_circuit(invocation.function_name)
+            results[index] = (
+                circuit.simulate(arguments)
+                if server_keyset is None
+                else circuit.call(arguments, server_keyset)
+            )
+            return index
+
+        if executor is None:
+            for index in range(len(self._invocations)):
+                evaluate(index)
+        else:
+            self._evaluate_concurrently(evaluate, executor)
+
+        outputs = [
+            Value(
+                inputs[output.position]
+                if output.node == -1
+                else results[output.node][output.position]  # type: ignore
+            )
+            for output in self._outputs
+        ]
+        return tuple(outputs) if len(outputs) > 1 else outputs[0]
+
+    def _check_wire(self, source: PipelineOutput, function_name: str, position: int):
+        """
+        Check that an output of an invocation can be an argument of another invocation.
+        """
+
+        if source.node == -1:
+            if not 0 <= source.position < self._inputs:
+                message = f"Expected input {source.position} to be an input of this pipeline"
+                raise ValueError(message)
+            return
+
+        if not 0 <= source.node < len(self._invocations):
+            message = f"Expected invocation {source.node} to be an invocation of this pipeline"
+            raise ValueError(message)
+
+        source_function_name = self._invocations[source.node].function_name
+        rule = CompositionRule(
+            CompositionClause(source_function_name, source.position),
+            CompositionClause(function_name, position),
+        )
+        if rule not in self._composition_rules:
+            message = (
+                f"Expected output {source.position} of '{source_function_name}' "
+                f"to be composable with input {position} of '{function_name}'"
+            )
+            raise ValueError(message)
+
+    def _prepare(self):
+        """
+        Prepare clear arguments and dependencies of invocations, once.
+        """
+
+        if self._prepared is not None:
+            return
+
+        prepared = []
+        dependents: List[List[int]] = [[] for _ in self._invocations]
+        dependencies = []
+
+        for index, invocation in enumerate(self._invocations):
+            arguments = list(invocation.arguments)
+            for position in invocation.clear_positions:
+                client_circuit = self.server._get_simulated_client_circuit(invocation.function_name)
+                arg = arguments[position]
+                arguments[position] = client_circuit.simulate_prepare_input(
+                    Value_(np.array(arg) if isinstance(arg, list) else arg),
+                    position,
+                )
+            prepared.append(arguments)
+
+            sources = {
+                arg.node
+                for arg in invocation.arguments
+                if isinstance(arg, PipelineOutput) and arg.node != -1
+            }
+            for source in sources:
+                dependents[source].append(index)
+            dependencies.append(len(sources))
+
+        self._prepared = prepared
+        self._dependents = dependents
+        self._dependencies = dependencies
+
+    def _evaluate_concurrently(self, evaluate: Any, executor: Executor):
+        """
+        Evaluate invocations on an executor, as soon as their arguments are available.
+        """
+
+        assert self._dependents is not None
+        assert self._dependencies is not None
+
+        remaining = list(self._dependencies)
+        done: queue.SimpleQueue[Future] = queue.SimpleQueue()
+
+        def submit(index: int):
+            if isinstance(executor, Scheduler):
+                future = executor.submit_for(
+                    self._invocations[index].function_name,
+                    evaluate,
+                    index,
+                )
+            else:
+                future = executor.submit(evaluate, index)
+            future.add_done_callback(done.put)
+
+        pending = 0
+        for index, count in enumerate(remaining):
+            if count == 0:
+                submit(index)
+                pending += 1
+
+        while pending != 0:
+            index = done.get().result()
+            pending -= 1
+
+            for dependent in self._dependents[index]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    submit(dependent)
+                    pending += 1
@@ -0,0 +1,176 @@
+"""
+Declaration of `CompilationProfiler` class.
+"""
+
+import json
+import os
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+
+def peak_memory_mb() -> float:
+    """
+    Get the peak resident memory of the current process.
+
+    Returns:
+        float:
+            peak resident memory of the current process in megabytes
+    """
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # `ru_maxrss` is in bytes on macOS and in kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class CompilationProfiler:
+    """
+    CompilationProfiler class, to measure the time and the memory spent in each compilation stage.
+
+    Memory is measured as the peak resident memory of the process, so allocations of the compiler
+    bindings (e.g., the optimizer and LLVM) are taken into account as well.
+    """
+
+    events: List[Dict[str, Any]]
+
+    _origin: float
+    _depth: int
+
+    def __init__(self):
+        self.events = []
+
+        self._origin = time.perf_counter()
+        self._depth = 0
+
+    @contextmanager
+    def stage(self, name: str, function: Optional[str] = None) -> Iterator[None]:
+        """
+        Measure a compilation stage.
+
+        Stages can be nested (e.g., each processor within graph processing),
+        and they are recorded even if they raise.
+
+        Args:
+            name (str):
+                name of the stage
+
+            function (Optional[str], default = None):
+                name of the function the stage is performed on, if it's specific to one
+        """
+
+        memory_before = peak_memory_mb()
+        start = time.perf_counter()
+
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+
+            end = time.perf_counter()
+            memory_after = peak_memory_mb()
+
+            self.events.append(
+                {
+                    "name": name,
+                    "function": function,
+                    "depth": self._depth,
+                    "start_ms": (start - self._origin) * 1000,
+                    "duration_ms": (end - start) * 1000,
+                    "peak_memory_mb": memory_after,
+                    "peak_memory_increase_mb": memory_after - memory_before,
+                }
+            )
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize the measurements per stage and per function.
+
+        Returns:
+            Dict[str, Any]:
+                summary of the measurements, with the following keys
+                - "duration_ms": time spent in all top-level stages
+                - "peak_memory_mb": peak resident memory of the process during the stages
+                - "stages": measurements of each stage, accumulated over all functions
+                - "functions": measurements of each stage of each function
+        """
+
+        stages: Dict[str, Dict[str, float]] = {}
+        functions: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+        # events are recorded when stages end, so they are sorted to keep the order stages start
+        for event in sorted(self.events, key=lambda event: event["start_ms"]):
+            targets = [stages]
+            if event["function"] is not None:
+                targets.append(functions.setdefault(event["function"], {}))
+
+            for target in targets:
+                measurements = target.setdefault(
+                    event["name"],
+                    {"duration_ms": 0.0, "peak_memory_mb": 0.0, "peak_memory_increase_mb": 0.0},
+                )
+                measurements["duration_ms"] += event["duration_ms"]
+                measurements["peak_memory_mb"] = max(
+                    measurements["peak_memory_mb"],
+                    event["peak_memory_mb"],
+                )
+                measurements["peak_memory_increase_mb"] += event["peak_memory_increase_mb"]
+
+        top_level_events = [event for event in self.events if event["depth"] == 0]
+        return {
+            "duration_ms": sum(event["duration_ms"] for event in top_level_events),
+            "peak_memory_mb": max((event["peak_memory_mb"] for event in self.events), default=0.0),
+            "stages": stages,
+            "functions": functions,
+        }
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """
+        Convert the measurements to the Chrome trace event format.
+
+        Returns:
+            Dict[str, Any]:
+                measurements which can be viewed in `chrome://tracing` or Perfetto
+        """
+
+        pid = os.getpid()
+        trace_events = []
+
+        for event in sorted(self.events, key=lambda event: (event["start_ms"], event["depth"])):
+            arguments = {
+                "peak_memory_mb": event["peak_memory_mb"],
+                "peak_memory_increase_mb": event["peak_memory_increase_mb"],
+            }
+            if event["function"] is not None:
+                arguments["function"] = event["function"]
+
+            trace_events.append(
+                {
+                    "name": event["name"],
+                    "cat": "compilation",
+                    "ph": "X",
+                    "ts": event["start_ms"] * 1000,
+                    "dur": event["duration_ms"] * 1000,
+                    "pid": pid,
+                    "tid": 0,
+                    "args": arguments,
+                }
+            )
+
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: Union[str, Path]):
+        """
+        Export the measurements to a file in the Chrome trace event format.
+
+        Args:
+            path (Union[str, Path]):
+                path of the JSON file to export to
+        """
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f, indent=4)
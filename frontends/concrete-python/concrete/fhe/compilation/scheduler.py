@@ -0,0 +1,300 @@
+"""
+Declaration of `Scheduler` class.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Deque, Dict, List, Mapping, NamedTuple, Optional, Union
+
+
+class _Evaluation(NamedTuple):
+    future: Future
+    work: Callable
+    args: tuple
+    kwargs: dict
+    submitted_at: float
+
+
+class Scheduler(Executor):
+    """
+    Scheduler class, to evaluate functions of a module in a bounded pool of threads.
+
+    Evaluations are queued per function. Workers always take the next evaluation of the function
+    with the highest priority, and functions with the same priority take turns, so a burst of
+    evaluations of one function doesn't delay the evaluations of the other functions until it's
+    over. When the queues hold `max_queue_depth` evaluations, submitting a new one either blocks
+    until a worker takes an evaluation from the queues, or raises a `RuntimeError`.
+    """
+
+    max_workers: int
+    max_queue_depth: Optional[int]
+    reject_when_full: bool
+    priorities: Dict[str, int]
+
+    _lock: threading.Lock
+    _not_empty: threading.Condition
+    _not_full: threading.Condition
+
+    _queues: Dict[Optional[str], Deque[_Evaluation]]
+    _turns: Deque[Optional[str]]
+    _queue_depth: int
+
+    _workers: List[threading.Thread]
+    _idle_workers: int
+    _shutdown: bool
+
+    _statistics: Dict[str, Union[int, float]]
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queue_depth: Optional[int] = None,
+        reject_when_full: bool = False,
+        priorities: Optional[Mapping[str, int]] = None,
+    ):
+        if max_workers is None:
+            # same default as `concurrent.futures.ThreadPoolExecutor`
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+
+        if max_workers <= 0:
+            message = f"Expected max_workers to be positive but it's {max_workers}"
+            raise ValueError(message)
+        if max_queue_depth is not None and max_queue_depth <= 0:
+            message = f"Expected max_queue_depth to be positive but it's {max_queue_depth}"
+            raise ValueError(message)
+
+        self.max_workers = max_workers
+        self.max_queue_depth = max_queue_depth
+        self.reject_when_full = reject_when_full
+        self.priorities = dict(priorities) if priorities is not None else {}
+
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+        self._queues = {}
+        self._turns = deque()
+        self._queue_depth = 0
+
+        self._workers = []
+        self._idle_workers = 0
+        self._shutdown = False
+
+        self._statistics = {
+            "submitted": 0,
+            "rejected": 0,
+            "completed": 0,
+            "running": 0,
+            "max_queue_depth": 0,
+            "total_wait_time": 0.0,
+            "max_wait_time": 0.0,
+        }
+
+    def submit(self, fn: Callable, /, *args: Any, **kwargs: Any) -> Future:
+        """
+        Schedule an evaluation which is not tied to a function of the module.
+
+        Such evaluations have the default priority (0), and take turns with the functions.
+
+        Args:
+            fn (Callable):
+                work to evaluate
+
+            *args (Any):
+                positional arguments of the work
+
+            **kwargs (Any):
+                keyword arguments of the work
+
+        Returns:
+            Future:
+                future of the result of the work
+        """
+
+        return self.submit_for(None, fn, *args, **kwargs)
+
+    def submit_for(
+        self,
+        function_name: Optional[str],
+        fn: Callable,
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Future:
+        """
+        Schedule an evaluation of a function of the module.
+
+        Args:
+            function_name (Optional[str]):
+                name of the function, which determines the priority and the turn of the evaluation
+
+            fn (Callable):
+                work to evaluate
+
+            *args (Any):
+                positional arguments of the work
+
+            **kwargs (Any):
+                keyword arguments of the work
+
+        Returns:
+            Future:
+                future of the result of the work
+        """
+
+        future: Future = Future()
+
+        with self._lock:
+            while True:
+                if self._shutdown:
+                    message = "Cannot schedule new evaluations after shutdown"
+                    raise RuntimeError(message)
+
+                if self.max_queue_depth is None or self._queue_depth < self.max_queue_depth:
+                    break
+
+                if self.reject_when_full:
+                    self._statistics["rejected"] += 1
+                    message = (
+                        f"Cannot schedule the evaluation "
+                        f"as {self._queue_depth} evaluations are already waiting"
+                    )
+                    raise RuntimeError(message)
+
+                self._not_full.wait()
+
+            queue = self._queues.get(function_name)
+            if queue is None:
+                queue = self._queues[function_name] = deque()
+            if len(queue) == 0:
+                self._turns.append(function_name)
+
+            queue.append(_Evaluation(future, fn, args, kwargs, time.perf_counter()))
+            self._queue_depth += 1
+
+            self._statistics["submitted"] += 1
+            self._statistics["max_queue_depth"] = max(
+                self._statistics["max_queue_depth"],
+                self._queue_depth,
+            )
+
+            # idle workers will each take one of the waiting evaluations
+            if self._idle_workers < self._queue_depth and len(self._workers) < self.max_workers:
+                worker = threading.Thread(target=self._work, daemon=True)
+                self._workers.append(worker)
+                self._idle_workers += 1
+                worker.start()
+
+            self._not_empty.notify()
+
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        """
+        Stop accepting new evaluations, and stop the workers once the queues are empty.
+
+        Args:
+            wait (bool, default = True):
+                whether to wait for the queued and running evaluations to finish
+
+            cancel_futures (bool, default = False):
+                whether to cancel the queued evaluations
+        """
+
+        with self._lock:
+            self._shutdown = True
+
+            if cancel_futures:
+                for queue in self._queues.values():
+                    for evaluation in queue:
+                        evaluation.future.cancel()
+
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+            workers = list(self._workers)
+
+        if wait:
+            for worker in workers:
+                worker.join()
+
+    def statistics(self) -> Dict[str, Union[int, float]]:
+        """
+        Get usage statistics of the scheduler.
+
+        Returns:
+            Dict[str, Union[int, float]]:
+                number of evaluations "submitted", "rejected" (as the queues were full), "completed"
+                and "running", current and maximum number of evaluations waiting in the queues
+                ("queue_depth" and "max_queue_depth"), and total and maximum number of seconds
+                evaluations waited in the queues before a worker took them
+                ("total_wait_time" and "max_wait_time")
+        """
+
+        with self._lock:
+            result = dict(self._statistics)
+            result["queue_depth"] = self._queue_depth
+            return result
+
+    def _priority(self, function_name: Optional[str]) -> int:
+        return self.priorities.get(function_name, 0) if function_name is not None else 0
+
+    def _take(self) -> _Evaluation:
+        """
+        Take the next evaluation from the queues, while holding the lock.
+        """
+
+        highest_priority = max(self._priority(function_name) for function_name in self._turns)
+        for function_name in self._turns:
+            if self._priority(function_name) == highest_priority:
+                break
+
+        # function goes to the back of the line, so functions with the same priority take turns
+        self._turns.remove(function_name)
+
+        queue = self._queues[function_name]
+        evaluation = queue.popleft()
+        if len(queue) != 0:
+            self._turns.append(function_name)
+
+        self._queue_depth -= 1
+        return evaluation
+
+    def _work(self):
+        while True:
+            with self._lock:
+                while self._queue_depth == 0 and not self._shutdown:
+                    self._not_empty.wait()
+
+                if self._queue_depth == 0:
+                    self._idle_workers -= 1
+                    return
+
+                evaluation = self._take()
+                self._idle_workers -= 1
+
+                wait_time = time.perf_counter() - evaluation.submitted_at
+                self._statistics["total_wait_time"] += wait_time
+                self._statistics["max_wait_time"] = max(
+                    self._statistics["max_wait_time"],
+                    wait_time,
+                )
+                self._statistics["running"] += 1
+
+                self._not_full.notify()
+
+            if evaluation.future.set_running_or_notify_cancel():
+                try:
+                    result = evaluation.work(*evaluation.args, **evaluation.kwargs)
+                except BaseException as error:  # pylint: disable=broad-exception-caught
+                    evaluation.future.set_exception(error)
+                else:
+                    evaluation.future.set_result(result)
+
+            with self._lock:
+                self._statistics["running"] -= 1
+                self._statistics["completed"] += 1
+                self._idle_workers += 1
@@ -4,11 +4,16 @@ Declaration of `Server` class.
 
 # pylint: disable=import-error,no-member,no-name-in-module
 
+import hashlib
 import json
+import os
 import shutil
+import stat
 import tempfile
+import threading
+import zipfile
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple, Union
+from typing import IO, Dict, Iterable, List, Optional, Tuple, Union
 
 # mypy: disable-error-code=attr-defined
 import concrete.compiler
@@ -16,6 +21,7 @@ import jsonpickle
 import numpy as np
 from concrete.compiler import (
     Backend,
+    ClientCircuit,
     ClientProgram,
     CompilationContext,
     CompilationOptions,
@@ -28,12 +34,21 @@ from concrete.compiler import (
     Parameter,
     PrimitiveOperation,
     ProgramInfo,
+    ServerCircuit,
     ServerProgram,
 )
 from concrete.compiler import Value as Value_
 from concrete.compiler import lookup_runtime_lib, set_compiler_logging, set_llvm_debug_flag
 from mlir.ir import Module as MlirModule
 
+from .compilation_cache import (
+    STAGING_PREFIX,
+    CompilationCache,
+    is_lock_of_directory,
+    lock_directory,
+    remove_directory,
+    remove_if_leftover,
+)
 from .composition import CompositionClause, CompositionRule
 from .configuration import (
     DEFAULT_GLOBAL_P_ERROR,
@@ -43,8 +58,9 @@ from .configuration import (
     ParameterSelectionStrategy,
 )
 from .evaluation_keys import EvaluationKeys
+from .optimizer_cache import OptimizerCache
 from .specs import ClientSpecs
-from .utils import Lazy, friendly_type_format
+from .utils import friendly_type_format
 from .value import Value
 
 # pylint: enable=import-error,no-member,no-name-in-module
@@ -61,6 +77,14 @@ class Server:
     _configuration: Optional[Configuration]
     _composition_rules: Optional[List[CompositionRule]]
 
+    _program_info: Optional[ProgramInfo]
+    _server_program: Optional[ServerProgram]
+    _server_program_lock: threading.Lock
+    _circuit_handles: threading.local
+
+    _extracted_directory: Optional[Path]
+    _extraction_lease: Optional[IO]
+
     def __init__(
         self,
         library: Library,
@@ -72,12 +96,20 @@ class Server:
         self._mlir = None
         self._composition_rules = composition_rules
 
+        self._program_info = None
+        self._server_program = None
+        self._server_program_lock = threading.Lock()
+        self._circuit_handles = threading.local()
+
+        self._extracted_directory = None
+        self._extraction_lease = None
+
     @property
     def client_specs(self) -> ClientSpecs:
         """
         Return the associated client specs.
         """
-        return ClientSpecs(self._library.get_program_info())
+        return ClientSpecs(self.program_info)
 
     @staticmethod
     def create(
@@ -107,6 +139,86 @@ class Server:
                 composition rules to be applied when compiling
         """
 
+        composition_rules = list(composition_rules) if composition_rules else []
+
+        if configuration.auto_parallelize or configuration.dataflow_parallelize:
+            # pylint: disable=c-extension-no-member,no-member
+            concrete.compiler.init_dfr()
+            # pylint: enable=c-extension-no-member,no-member
+
+        mlir_str = str(mlir).strip()
+
+        cache = CompilationCache.of(configuration)
+        cache_key = CompilationCache.key(mlir_str, configuration, is_simulated, composition_rules)
+
+        library = cache.lookup(cache_key) if cache is not None else None
+        if library is None:
+            output_dir_path = (
+                cache.staging_directory() if cache is not None else Path(tempfile.mkdtemp())
+            )
+
+            try:
+                if configuration.compiler_debug_mode:  # pragma: no cover
+                    set_llvm_debug_flag(True)
+                if configuration.compiler_verbose_mode:  # pragma: no cover
+                    set_compiler_logging(True)
+
+                library = Server._compile(
+                    mlir,
+                    configuration,
+                    is_simulated,
+                    compilation_context,
+                    composition_rules,
+                    output_dir_path,
+                )
+            except Exception:
+                if cache is not None:
+                    shutil.rmtree(output_dir_path, ignore_errors=True)
+                raise
+            finally:
+                set_llvm_debug_flag(False)
+                set_compiler_logging(False)
+
+            if cache is not None:
+                library = cache.insert(cache_key, output_dir_path)
+
+        composition_rules = composition_rules if composition_rules else None
+
+        result = Server(
+            library=library, is_simulated=is_simulated, composition_rules=composition_rules
+        )
+
+        # pylint: disable=protected-access
+        result._mlir = mlir_str
+        result._configuration = configuration
+        # pylint: enable=protected-access
+
+        return result
+
+    @staticmethod
+    def _compilation_options(
+        configuration: Configuration,
+        is_simulated: bool,
+        composition_rules: List[CompositionRule],
+    ) -> CompilationOptions:
+        """
+        Get the options to give to the compiler.
+
+        Args:
+            configuration (Configuration):
+                configuration to use
+
+            is_simulated (bool):
+                whether to compile in simulation mode or not
+
+            composition_rules (List[CompositionRule]):
+                composition rules to be applied when compiling
+
+        Returns:
+            CompilationOptions:
+                options to give to the compiler
+        """
+
         backend = Backend.GPU if configuration.use_gpu else Backend.CPU
         options = CompilationOptions(backend)
         options.simulation(is_simulated)
@@ -119,15 +231,9 @@ class Server:
             configuration.detect_overflow_in_simulation
         )
         options.set_composable(configuration.composable)
-        composition_rules = list(composition_rules) if composition_rules else []
         for rule in composition_rules:
             options.add_composition(rule.from_.func, rule.from_.pos, rule.to.func, rule.to.pos)
 
-        if configuration.auto_parallelize or configuration.dataflow_parallelize:
-            # pylint: disable=c-extension-no-member,no-member
-            concrete.compiler.init_dfr()
-            # pylint: enable=c-extension-no-member,no-member
-
         global_p_error_is_set = configuration.global_p_error is not None
         p_error_is_set = configuration.p_error is not None
 
@@ -188,51 +294,93 @@ class Server:
 
         options.set_security_level(configuration.security_level)
 
-        try:
-            if configuration.compiler_debug_mode:  # pragma: no cover
-                set_llvm_debug_flag(True)
-            if configuration.compiler_verbose_mode:  # pragma: no cover
-                set_compiler_logging(True)
-
-            output_dir = tempfile.mkdtemp()
-            output_dir_path = Path(output_dir)
-
-            compiler = Compiler(
-                str(output_dir_path),
-                lookup_runtime_lib(),
-                generate_shared_lib=True,
-                generate_program_info=True,
-                generate_compilation_feedback=True,
-            )
-            if isinstance(mlir, str):
-                library = compiler.compile(mlir, options)
-            else:  # MlirModule
-                assert (
-                    compilation_context is not None
-                ), "must provide compilation context when compiling MlirModule"
-                library = compiler.compile(
-                    mlir._CAPIPtr, options, compilation_context  # pylint: disable=protected-access
-                )
-        finally:
-            set_llvm_debug_flag(False)
-            set_compiler_logging(False)
+        return options
 
-        composition_rules = composition_rules if composition_rules else None
+    @staticmethod
+    def _compile(
+        mlir: Union[str, MlirModule],
+        configuration: Configuration,
+        is_simulated: bool,
+        compilation_context: Optional[CompilationContext],
+        composition_rules: List[CompositionRule],
+        output_dir_path: Path,
+    ) -> Library:
+        """
+        Compile MLIR into a library.
 
-        result = Server(
-            library=library, is_simulated=is_simulated, composition_rules=composition_rules
+        Args:
+            mlir (Union[str, MlirModule]):
+                mlir to compile
+
+            configuration (Configuration):
+                configuration to use
+
+            is_simulated (bool):
+                whether to compile in simulation mode or not
+
+            compilation_context (Optional[CompilationContext]):
+                context to use for the Compiler
+
+            composition_rules (List[CompositionRule]):
+                composition rules to be applied when compiling
+
+            output_dir_path (Path):
+                directory to compile into
+
+        Returns:
+            Library:
+                compiled library
+        """
+
+        compiler = Compiler(
+            str(output_dir_path),
+            lookup_runtime_lib(),
+            generate_shared_lib=True,
+            generate_program_info=True,
+            generate_compilation_feedback=True,
         )
 
-        # pylint: disable=protected-access
-        result._mlir = str(mlir).strip()
-        result._configuration = configuration
-        # pylint: enable=protected-access
+        optimizer_cache = OptimizerCache.of(configuration)
+        optimizer_cache_key = (
+            OptimizerCache.key(str(mlir), configuration, composition_rules)
+            if optimizer_cache is not None
+            else ""
+        )
 
-        return result
+        restriction = (
+            optimizer_cache.lookup(optimizer_cache_key) if optimizer_cache is not None else None
+        )
+        if restriction is not None:
+            options = Server._compilation_options(configuration, is_simulated, composition_rules)
+            options.set_range_restriction(restriction)
+            try:
+                return compiler.compile(str(mlir), options)
+            except RuntimeError:
+                # parameters of the cache don't satisfy the constraints of this circuit
+                OptimizerCache.reject()
+
+        options = Server._compilation_options(configuration, is_simulated, composition_rules)
+        if isinstance(mlir, str) or restriction is not None:
+            # modules might be modified by the compiler, so they are compiled again from text
+            library = compiler.compile(str(mlir), options)
+        else:  # MlirModule
+            assert (
+                compilation_context is not None
+            ), "must provide compilation context when compiling MlirModule"
+            library = compiler.compile(
+                mlir._CAPIPtr,  # pylint: disable=protected-access
+                options,
+                compilation_context,
+            )
+
+        if optimizer_cache is not None:
+            optimizer_cache.insert(optimizer_cache_key, library.get_program_info())
+
+        return library
 
-    def save(self, path: Union[str, Path], via_mlir: bool = False):
+    def save(self, path: Union[str, Path], via_mlir: bool = False, layout: str = "zip"):
         """
-        Save the server into the given path in zip format.
+        Save the server into the given path.
 
         Args:
             path (Union[str, Path]):
@@ -241,10 +389,18 @@ class Server:
             via_mlir (bool, default = False):
                 export using the MLIR code of the program,
                 this will make the export cross-platform
+
+            layout (str, default = "zip"):
+                "zip" to save the server as a zip archive with uncompressed entries,
+                "directory" to save the server as a plain directory which can be loaded in place
         """
 
+        if layout not in ["zip", "directory"]:
+            message = f"Expected layout to be 'zip' or 'directory' but it's '{layout}'"
+            raise ValueError(message)
+
         path = str(path)
-        if path.endswith(".zip"):
+        if layout == "zip" and path.endswith(".zip"):
             path = path[: len(path) - 4]
 
         if via_mlir:
@@ -265,33 +421,39 @@ class Server:
                 with open(Path(tmp) / "composition_rules.json", "w", encoding="utf-8") as f:
                     f.write(json.dumps(self._composition_rules))
 
-                shutil.make_archive(path, "zip", tmp)
+                _export(Path(tmp), Path(path), layout)
 
             return
 
         # Note that the shared library, program info and more are already in the output directory.
         # We just add a few things related to concrete-python here.
-        with open(Path(self._library.get_output_dir_path()) / "client.specs.json", "wb") as f:
-            f.write(self.client_specs.serialize())
-
-        with open(
-            Path(self._library.get_output_dir_path()) / "is_simulated", "w", encoding="utf-8"
-        ) as f:
-            f.write("1" if self.is_simulated else "0")
-
-        with open(
-            Path(self._library.get_output_dir_path()) / "composition_rules.json",
-            "w",
-            encoding="utf-8",
-        ) as f:
-            f.write(json.dumps(self._composition_rules))
+        # The output directory can be shared by many processes through the compilation cache,
+        # so files are written to temporary files first and then moved in place at once.
+        output_dir_path = Path(self._library.get_output_dir_path())
+        files = {
+            "client.specs.json": self.client_specs.serialize(),
+            "is_simulated": ("1" if self.is_simulated else "0").encode("utf-8"),
+            "composition_rules.json": json.dumps(self._composition_rules).encode("utf-8"),
+        }
+        for name, content in files.items():
+            with tempfile.NamedTemporaryFile(
+                dir=output_dir_path,
+                prefix=f".{name}.",
+                delete=False,
+            ) as f:
+                f.write(content)
+            os.replace(f.name, output_dir_path / name)
 
-        shutil.make_archive(path, "zip", self._library.get_output_dir_path())
+        _export(output_dir_path, Path(path), layout)
 
     @staticmethod
     def load(path: Union[str, Path], **kwargs) -> "Server":
         """
-        Load the server from the given path in zip format.
+        Load the server from the given path.
+
+        Servers saved as a directory are used in place. Servers saved as a zip archive are
+        extracted once per user, into a private directory named after the contents of the archive,
+        which is then shared by all processes of the user loading the same archive.
 
         Args:
             path (Union[str, Path]):
@@ -306,12 +468,33 @@ class Server:
                 server loaded from the filesystem
         """
 
-        # pylint: disable=consider-using-with
-        output_dir = tempfile.mkdtemp()
-        output_dir_path = Path(output_dir)
-        # pylint: enable=consider-using-with
+        path = Path(path)
+        extraction_lease = None
+        if path.is_dir():
+            output_dir_path = path
+        else:
+            output_dir_path, extraction_lease = _extract(path)
+
+        try:
+            result = Server._load(output_dir_path, **kwargs)
+        except Exception:
+            if extraction_lease is not None:
+                extraction_lease.close()
+            raise
+
+        if output_dir_path != path:
+            # pylint: disable=protected-access
+            result._extracted_directory = output_dir_path
+            result._extraction_lease = extraction_lease
+            # pylint: enable=protected-access
+
+        return result
 
-        shutil.unpack_archive(path, str(output_dir_path), "zip")
+    @staticmethod
+    def _load(output_dir_path: Path, **kwargs) -> "Server":
+        """
+        Load the server from a directory, see `Server.load` for the arguments.
+        """
 
         with open(output_dir_path / "is_simulated", "r", encoding="utf-8") as f:
             is_simulated = f.read() == "1"
@@ -403,7 +586,7 @@ Provide a `function_name` keyword argument to disambiguate."
 
                 if not isinstance(arg, Value):
                     if (
-                        not self.client_specs.program_info.get_circuit(function_name)
+                        not self.program_info.get_circuit(function_name)
                         .get_inputs()[i]
                         .get_type_info()
                         .is_plaintext()
@@ -414,14 +597,7 @@ Provide a `function_name` keyword argument to disambiguate."
                         )
                         raise ValueError(message)
 
-        server_program = ServerProgram(self._library, self.is_simulated)
-        server_circuit = server_program.get_server_circuit(function_name)
-
-        def init_simulated_client_circuit():
-            client_program = ClientProgram.create_simulated(self.client_specs.program_info)
-            return client_program.get_client_circuit(function_name)
-
-        simulated_client_circuit = Lazy(init_simulated_client_circuit)
+        server_circuit = self._get_server_circuit(function_name)
 
         unwrapped_args = []
         for i, arg in enumerate(flattened_args):
@@ -429,11 +605,15 @@ Provide a `function_name` keyword argument to disambiguate."
                 unwrapped_args.append(arg._inner)  # pylint: disable=protected-access
             elif isinstance(arg, list):
                 unwrapped_args.append(
-                    simulated_client_circuit.val.simulate_prepare_input(Value_(np.array(arg)), i)
+                    self._get_simulated_client_circuit(function_name).simulate_prepare_input(
+                        Value_(np.array(arg)), i
+                    )
                 )
             else:
                 unwrapped_args.append(
-                    simulated_client_circuit.val.simulate_prepare_input(Value_(arg), i)
+                    self._get_simulated_client_circuit(function_name).simulate_prepare_input(
+                        Value_(arg), i
+                    )
                 )
 
         if self.is_simulated:
@@ -445,20 +625,96 @@ Provide a `function_name` keyword argument to disambiguate."
         result = [Value(r) for r in result]
         return tuple(result) if len(result) > 1 else result[0]
 
+    def _get_server_program(self) -> ServerProgram:
+        """
+        Get the server program of the server, loading it on first use.
+
+        The server program is shared by all threads as it's only used to create circuits.
+        """
+
+        if self._server_program is None:
+            with self._server_program_lock:
+                if self._server_program is None:
+                    self._server_program = ServerProgram(self._library, self.is_simulated)
+        return self._server_program
+
+    def _get_server_circuit(self, function_name: str) -> ServerCircuit:
+        """
+        Get the server circuit of a function, creating it on first use.
+
+        Server circuits hold their own argument and result buffers, so they are cached per thread
+        to allow concurrent runs of the same function.
+
+        Args:
+            function_name (str):
+                name of the function
+
+        Returns:
+            ServerCircuit:
+                server circuit of the function for the current thread
+        """
+
+        server_circuits = self._circuit_handles.__dict__.setdefault("server_circuits", {})
+        server_circuit = server_circuits.get(function_name)
+        if server_circuit is None:
+            server_circuit = self._get_server_program().get_server_circuit(function_name)
+            server_circuits[function_name] = server_circuit
+        return server_circuit
+
+    def _get_simulated_client_circuit(self, function_name: str) -> ClientCircuit:
+        """
+        Get the simulated client circuit of a function, creating it on first use.
+
+        It's used to prepare clear arguments, and it's cached per thread like server circuits.
+
+        Args:
+            function_name (str):
+                name of the function
+
+        Returns:
+            ClientCircuit:
+                simulated client circuit of the function for the current thread
+        """
+
+        client_circuits = self._circuit_handles.__dict__.setdefault("client_circuits", {})
+        client_circuit = client_circuits.get(function_name)
+        if client_circuit is None:
+            client_program = ClientProgram.create_simulated(self.program_info)
+            client_circuit = client_program.get_client_circuit(function_name)
+            client_circuits[function_name] = client_circuit
+        return client_circuit
+
     def cleanup(self):
         """
-        Cleanup the temporary library output directory.
+        Cleanup the directory the server was extracted to, unless other processes still use it.
         """
 
-        # if self._output_dir is not None:
-        #     shutil.rmtree(Path(self._output_dir).resolve())
+        if self._extracted_directory is None:
+            return
+
+        if self._extraction_lease is not None:
+            self._extraction_lease.close()
+            self._extraction_lease = None
+
+            lock = lock_directory(self._extracted_directory, shared=False)
+            if lock is not None:
+                with lock:
+                    if is_lock_of_directory(lock, self._extracted_directory):
+                        remove_directory(self._extracted_directory)
+        else:
+            # the directory is private to the server
+            shutil.rmtree(self._extracted_directory, ignore_errors=True)
+
+        self._extracted_directory = None
 
     @property
     def program_info(self) -> ProgramInfo:
         """
         The program info associated with the server.
         """
-        return self._library.get_program_info()
+        if self._program_info is None:
+            self._program_info = self._library.get_program_info()
+        return self._program_info
 
     @property
     def size_of_secret_keys(self) -> int:
@@ -839,3 +1095,191 @@ Provide a `function_name` keyword argument to disambiguate."
             key_types={KeyType.SECRET},
             program_info=self.program_info,
         )
+
+
+SERVER_EXTRACTION_DIRECTORY_NAME = "concrete-python-servers"
+SERVER_EXTRACTION_MARKER_NAME = ".extracted"
+
+
+def _export(directory: Path, path: Path, layout: str):
+    """
+    Export the files of a directory, except the temporary ones, to a zip archive or a directory.
+    """
+
+    files = []
+    for root, _, names in os.walk(directory):
+        for name in names:
+            if not name.startswith("."):
+                file = Path(root) / name
+                files.append((file, file.relative_to(directory)))
+
+    if layout == "directory":
+        for file, relative in files:
+            (path / relative).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(file, path / relative)
+        return
+
+    # entries are stored uncompressed so extracting them is as cheap as copying them
+    with zipfile.ZipFile(f"{path}.zip", "w", compression=zipfile.ZIP_STORED) as archive:
+        for file, relative in sorted(files, key=lambda entry: str(entry[1])):
+            archive.write(file, str(relative))
+
+
+def _extraction_location() -> Optional[Path]:
+    """
+    Get the directory of the current user to extract zip archives to, creating it if necessary.
+
+    None is returned if the directory cannot be trusted (e.g., if it was created by another user),
+    as the shared libraries extracted to it are loaded into the process.
+    """
+
+    location = Path(tempfile.gettempdir()) / f"{SERVER_EXTRACTION_DIRECTORY_NAME}-{os.getuid()}"
+    try:
+        location.mkdir(mode=0o700, exist_ok=True)
+        location_stat = location.lstat()
+    except OSError:  # pragma: no cover
+        return None
+
+    if (
+        not stat.S_ISDIR(location_stat.st_mode)
+        or location_stat.st_uid != os.getuid()
+        or location_stat.st_mode & 0o077 != 0
+    ):
+        return None
+
+    return location
+
+
+def _is_extraction_of(directory: Path, archive: zipfile.ZipFile, key: str) -> bool:
+    """
+    Get whether a directory is a complete extraction of a zip archive, which still has its files.
+
+    Files are not read, so checking the extraction of large libraries is as fast as checking small
+    ones. Instead, a marker is written once the extraction is complete, and sizes of files are
+    checked to detect files which were removed or truncated since (e.g., by a temporary file
+    cleaner).
+    """
+
+    try:
+        if (directory / SERVER_EXTRACTION_MARKER_NAME).read_text(encoding="utf-8") != key:
+            return False
+
+        for entry in archive.infolist():
+            if entry.is_dir():
+                continue
+            if (directory / entry.filename).stat().st_size != entry.file_size:
+                return False
+    except OSError:
+        return False
+
+    return True
+
+
+def _remove_leftovers(location: Path):
+    """
+    Remove directories left by processes which were interrupted while extracting or removing them.
+    """
+
+    try:
+        paths = list(location.iterdir())
+    except OSError:  # pragma: no cover
+        return
+
+    for path in paths:
+        try:
+            path_stat = path.lstat()
+        except OSError:  # pragma: no cover
+            continue
+
+        if stat.S_ISDIR(path_stat.st_mode):
+            remove_if_leftover(path, path_stat)
+
+
+def _extract(path: Path) -> Tuple[Path, Optional[IO]]:
+    """
+    Extract a zip archive to a directory shared by all processes of the user extracting it.
+
+    The directory is returned with a shared lock on it, which prevents other processes from
+    removing it while it's used, or without a lock if it's private to the caller.
+    """
+
+    with zipfile.ZipFile(path) as archive:
+        location = _extraction_location()
+        if location is None:
+            return _extract_privately(archive), None
+
+        _remove_leftovers(location)
+
+        # names, sizes and checksums of entries are in the index of the archive,
+        # so the contents of the archive are identified without reading all of it
+        entries = sorted(
+            (entry.filename, entry.file_size, entry.CRC) for entry in archive.infolist()
+        )
+        key = hashlib.sha256(json.dumps(entries).encode()).hexdigest()
+
+        output_dir_path = location / key
+        if output_dir_path.is_dir():
+            lease = lock_directory(output_dir_path, shared=True)
+            if (
+                lease is not None
+                and is_lock_of_directory(lease, output_dir_path)
+                and _is_extraction_of(output_dir_path, archive, key)
+            ):
+                return output_dir_path, lease
+
+            if lease is not None:
+                lease.close()
+
+            # the directory is incomplete (e.g., partially removed by a cleaner of temporary files)
+            # so it's replaced, but only if no other process uses it
+            lock = lock_directory(output_dir_path, shared=False)
+            if lock is None:
+                return _extract_privately(archive), None
+
+            with lock:
+                if not is_lock_of_directory(lock, output_dir_path):  # pragma: no cover
+                    # another process replaced it in the meantime
+                    return _extract(path)
+                remove_directory(output_dir_path)
+
+        staging_dir_path = Path(tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=location))
+        try:
+            archive.extractall(staging_dir_path)
+            # marker is written last, so directories without it are known to be incomplete
+            (staging_dir_path / SERVER_EXTRACTION_MARKER_NAME).write_text(key, encoding="utf-8")
+        except Exception:
+            shutil.rmtree(staging_dir_path, ignore_errors=True)
+            raise
+
+        # the lock is taken before the directory is visible so it cannot be removed before it's used
+        lease = lock_directory(staging_dir_path, shared=True)
+        if lease is None:  # pragma: no cover
+            # the directory cannot be shared safely without a lock, so it's kept private
+            return staging_dir_path, None
+
+        # directories are moved in place at once so other processes never use incomplete ones
+        try:
+            staging_dir_path.rename(output_dir_path)
+        except OSError:
+            # another process extracted the same archive first, so we use theirs
+            if lease is not None:
+                lease.close()
+            shutil.rmtree(staging_dir_path, ignore_errors=True)
+            return _extract(path)
+
+    return output_dir_path, lease
+
+
+def _extract_privately(archive: zipfile.ZipFile) -> Path:
+    """
+    Extract a zip archive to a new directory, which is private to the caller.
+    """
+
+    output_dir_path = Path(tempfile.mkdtemp())
+    try:
+        archive.extractall(output_dir_path)
+    except Exception:
+        shutil.rmtree(output_dir_path, ignore_errors=True)
+        raise
+
+    return output_dir_path
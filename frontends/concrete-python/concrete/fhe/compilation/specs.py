@@ -4,14 +4,35 @@ Declaration of `ClientSpecs` class.
 
 # pylint: disable=import-error,no-member,no-name-in-module
 
-from typing import Any
+import json
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
 
 # mypy: disable-error-code=attr-defined
 from concrete.compiler import ProgramInfo
 
+from ..dtypes import SignedInteger, UnsignedInteger
+from ..values import ValueDescription
+
 # pylint: enable=import-error,no-member,no-name-in-module
 
 
+class InputSpec(NamedTuple):
+    """
+    InputSpec class, to describe the expected value of an input of a function.
+    """
+
+    position: int
+    is_encrypted: bool
+    is_signed: bool
+    width: int
+    shape: Tuple[int, ...]
+
+    min: int
+    max: int
+
+
 class ClientSpecs:
     """
     ClientSpecs class, to create Client objects.
@@ -19,12 +40,100 @@ class ClientSpecs:
 
     program_info: ProgramInfo
 
+    _circuits: Optional[Dict[str, Dict[str, Any]]]
+    _input_specs: Dict[str, List[InputSpec]]
+
     def __init__(self, program_info: ProgramInfo):
         self.program_info = program_info
 
+        self._circuits = None
+        self._input_specs = {}
+
     def __eq__(self, other: Any):  # pragma: no cover
         return self.program_info.serialize() == other.program_info.serialize()
 
+    def input_specs(self, function_name: str) -> List[InputSpec]:
+        """
+        Get the expected values of the inputs of a function.
+
+        Input specs are computed from the program info on first use and cached afterwards.
+
+        Args:
+            function_name (str):
+                name of the function
+
+        Returns:
+            List[InputSpec]:
+                input specs of the function, ordered by position
+
+        Raises:
+            ValueError:
+                if the function is not in the program
+        """
+
+        input_specs = self._input_specs.get(function_name)
+        if input_specs is not None:
+            return input_specs
+
+        if self._circuits is None:
+            self._circuits = {
+                circuit["name"]: circuit
+                for circuit in json.loads(self.program_info.serialize())["circuits"]
+            }
+
+        circuit = self._circuits.get(function_name)
+        if circuit is None:
+            message = f"Function `{function_name}` is not in the module"
+            raise ValueError(message)
+
+        assert "inputs" in circuit
+
+        input_specs = []
+        for position, spec in enumerate(circuit["inputs"]):
+            if "lweCiphertext" in spec["typeInfo"].keys():
+                type_info = spec["typeInfo"]["lweCiphertext"]
+                is_encrypted = True
+                shape = tuple(type_info["abstractShape"]["dimensions"])
+                assert "integer" in type_info["encoding"].keys()
+                width = type_info["encoding"]["integer"]["width"]
+                is_signed = type_info["encoding"]["integer"]["isSigned"]
+            elif "plaintext" in spec["typeInfo"].keys():
+                type_info = spec["typeInfo"]["plaintext"]
+                is_encrypted = False
+                width = type_info["integerPrecision"]
+                is_signed = type_info["isSigned"]
+                shape = tuple(type_info["shape"]["dimensions"])
+            else:
+                message = f"Expected a valid type in {spec['typeInfo'].keys()}"
+                raise ValueError(message)
+
+            if is_signed:
+                min_value = -(2 ** (width - 1))
+                max_value = (2 ** (width - 1)) - 1
+            else:
+                min_value = 0
+                max_value = (2**width) - 1
+
+            if not is_encrypted:
+                # clear integers are signless
+                # (e.g., 8-bit clear integer can be in range -128, 255)
+                min_value = -(max_value // 2) - 1
+
+            input_specs.append(
+                InputSpec(
+                    position,
+                    is_encrypted,
+                    is_signed,
+                    width,
+                    shape,
+                    min_value,
+                    max_value,
+                )
+            )
+
+        self._input_specs[function_name] = input_specs
+        return input_specs
+
     def serialize(self) -> bytes:
         """
         Serialize client specs into a string representation.
@@ -52,3 +161,61 @@ class ClientSpecs:
 
         program_info = ProgramInfo.deserialize(serialized_client_specs)
         return ClientSpecs(program_info)
+
+
+def validate_input_args(
+    client_specs: ClientSpecs,
+    *args: Optional[Union[int, np.ndarray, List]],
+    function_name: str,
+) -> List[Optional[Union[int, np.ndarray]]]:
+    """Validate input arguments.
+
+    Args:
+        client_specs (ClientSpecs):
+            client specification
+        *args (Optional[Union[int, np.ndarray, List]]):
+            argument(s) for evaluation
+        function_name (str): name of the function to verify
+
+    Returns:
+        List[Optional[Union[int, np.ndarray]]]: ordered validated args
+    """
+
+    input_specs = client_specs.input_specs(function_name)
+    if len(args) != len(input_specs):
+        message = f"Expected {len(input_specs)} inputs but got {len(args)}"
+        raise ValueError(message)
+
+    sanitized_args: List[Optional[Union[int, np.ndarray]]] = []
+    for arg, spec in zip(args, input_specs):
+        if arg is None:
+            sanitized_args.append(None)
+            continue
+
+        if isinstance(arg, list):
+            arg = np.array(arg)
+
+        if isinstance(arg, (int, np.integer)):
+            is_valid = spec.shape == () and spec.min <= arg <= spec.max
+        elif isinstance(arg, np.ndarray) and np.issubdtype(arg.dtype, np.integer):
+            is_valid = arg.shape == spec.shape and arg.min() >= spec.min and arg.max() <= spec.max
+        else:
+            is_valid = False
+
+        if not is_valid:
+            expected_dtype = (
+                SignedInteger(spec.width) if spec.is_signed else UnsignedInteger(spec.width)
+            )
+            expected_value = ValueDescription(expected_dtype, spec.shape, spec.is_encrypted)
+            try:
+                actual_value = str(ValueDescription.of(arg, is_encrypted=spec.is_encrypted))
+            except ValueError:
+                actual_value = type(arg).__name__
+            message = (
+                f"Expected argument {spec.position} to be {expected_value} but it's {actual_value}"
+            )
+            raise ValueError(message)
+
+        sanitized_args.append(arg)
+
+    return sanitized_args
@@ -4,6 +4,8 @@ Declaration of `Value` class.
 
 # pylint: disable=import-error,no-name-in-module
 
+from typing import Any
+
 from concrete.compiler import TransportValue
 
 
@@ -24,8 +26,48 @@ class Value:
         """
         return Value(TransportValue.deserialize(buffer))
 
+    @staticmethod
+    def from_buffer(buffer: Any) -> "Value":
+        """
+        Deserialize a Value from a buffer, without copying the buffer first.
+
+        Args:
+            buffer (Any):
+                contiguous object supporting the buffer protocol
+                (e.g., bytes, bytearray, memoryview, mmap)
+                with a serialized value at its beginning
+
+        Returns:
+            Value:
+                deserialized value
+        """
+        return Value(TransportValue.deserialize(buffer))
+
     def serialize(self) -> bytes:
         """
         Serialize a Value to bytes.
         """
         return self._inner.serialize()
+
+    @property
+    def serialized_size(self) -> int:
+        """
+        Get the size of the serialized value in bytes.
+        """
+        return self._inner.serialized_size()
+
+    def serialize_into(self, buffer: Any) -> int:
+        """
+        Serialize a Value into a buffer, without creating intermediate bytes.
+
+        Args:
+            buffer (Any):
+                writable contiguous object supporting the buffer protocol
+                (e.g., bytearray, memoryview, mmap) of at least `serialized_size` bytes,
+                to write the serialized value at its beginning
+
+        Returns:
+            int:
+                number of bytes written
+        """
+        return self._inner.serialize_into(buffer)
@@ -0,0 +1,414 @@
+"""
+Declaration of `ValueBatch` class.
+"""
+
+import io
+import mmap
+import struct
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .value import Value
+
+MAGIC = b"CNCRTVBT"
+VERSION = 1
+
+# magic, version, length of the function name (0 if there is none, otherwise length + 1),
+# number of samples and number of entries
+PREAMBLE = struct.Struct("<8sIIQQ")
+
+# values are aligned to capnp words, so they can be read in place
+ALIGNMENT = 8
+
+# streams are read in chunks of at most this size, so sizes read from an untrusted header never
+# result in allocating more memory than what the stream actually has
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+class ValueBatch:
+    """
+    ValueBatch class, to send a batch of argument tuples between client and server in one buffer.
+
+    The buffer starts with a header, which has the name of the function, the number of arguments
+    of each sample, and the sample, the position, the offset and the size of each value. Values
+    follow the header, in order, each one aligned to 8 bytes. So, values of a batch can be
+    deserialized lazily, in any order, in place from memory mapped files, or while they are read
+    from a stream.
+    """
+
+    function_name: Optional[str]
+
+    _buffer: Any
+    _arities: np.ndarray
+    _entries: np.ndarray
+    _sample_starts: np.ndarray
+
+    def __init__(
+        self,
+        buffer: Any,
+        function_name: Optional[str],
+        arities: np.ndarray,
+        entries: np.ndarray,
+    ):
+        self.function_name = function_name
+
+        self._buffer = buffer
+        self._arities = arities
+        self._entries = entries
+        self._sample_starts = np.searchsorted(entries[:, 0], np.arange(len(arities) + 1))
+
+    @staticmethod
+    def serialize(
+        batch: Sequence[Any],
+        function_name: Optional[str] = None,
+    ) -> bytes:
+        """
+        Serialize a batch of samples to bytes.
+
+        Args:
+            batch (Sequence[Any]):
+                samples of the batch (e.g., encrypted arguments of many samples), where each sample
+                is a tuple of values, or a single value for functions with a single argument
+                (values can be None, for arguments which are not part of the batch)
+                (a single tuple of values needs to be wrapped, as a batch of one sample)
+
+            function_name (Optional[str], default = None):
+                name of the function the values are the arguments of
+
+        Returns:
+            bytes:
+                serialized batch
+        """
+
+        result = io.BytesIO()
+        ValueBatch.write(result, batch, function_name)
+        return result.getvalue()
+
+    @staticmethod
+    def write(
+        file: BinaryIO,
+        batch: Sequence[Any],
+        function_name: Optional[str] = None,
+    ) -> int:
+        """
+        Serialize a batch of samples into a file or a stream.
+
+        Values are written one at a time, so the serialized batch is never in memory at once.
+
+        Args:
+            file (BinaryIO):
+                file or stream to write the serialized batch to
+
+            batch (Sequence[Any]):
+                samples of the batch (see `serialize`)
+
+            function_name (Optional[str], default = None):
+                name of the function the values are the arguments of
+
+        Returns:
+            int:
+                number of bytes written
+        """
+
+        header, values = ValueBatch._header(batch, function_name)
+        file.write(header)
+
+        offset = len(header)
+        buffer = bytearray()
+        for value in values:
+            padding = _align(offset) - offset
+            if padding != 0:
+                file.write(bytes(padding))
+                offset += padding
+
+            size = value.serialized_size
+            if len(buffer) < size:
+                buffer = bytearray(size)
+
+            value.serialize_into(buffer)
+            file.write(memoryview(buffer)[:size])
+            offset += size
+
+        return offset
+
+    @staticmethod
+    def from_buffer(buffer: Any) -> "ValueBatch":
+        """
+        Read a batch from a buffer, without copying the buffer nor deserializing its values.
+
+        Args:
+            buffer (Any):
+                object supporting the buffer protocol (e.g., bytes, bytearray, memoryview, mmap)
+                with a serialized batch at its beginning
+
+        Returns:
+            ValueBatch:
+                batch, with values deserialized on access
+        """
+
+        view = memoryview(buffer).cast("B")
+        function_name, arities, entries, _ = ValueBatch._parse_header(view)
+
+        if len(entries) != 0 and int(entries[-1, 2]) + int(entries[-1, 3]) > len(view):
+            message = "Expected a serialized batch of values but it ended unexpectedly"
+            raise ValueError(message)
+
+        return ValueBatch(view, function_name, arities, entries)
+
+    @staticmethod
+    def load(path: Union[str, Path]) -> "ValueBatch":
+        """
+        Read a batch from a file, which is memory mapped instead of read.
+
+        Args:
+            path (Union[str, Path]):
+                path of the serialized batch
+
+        Returns:
+            ValueBatch:
+                batch, with values deserialized on access
+        """
+
+        with open(path, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return ValueBatch.from_buffer(mapping)
+
+    @staticmethod
+    def stream(file: BinaryIO) -> Iterator[Tuple[Optional[Value], ...]]:
+        """
+        Read the samples of a batch from a file or a stream, one at a time.
+
+        Only the header and the values of one sample are in memory at once, so it's suitable for
+        very large batches, or for batches which are received over the network.
+
+        Args:
+            file (BinaryIO):
+                file or stream to read the serialized batch from
+
+        Yields:
+            Tuple[Optional[Value], ...]:
+                values of each sample of the batch, in order
+        """
+
+        preamble = _read_exactly(file, PREAMBLE.size)
+        rest_of_header_size = ValueBatch._header_size(preamble) - len(preamble)
+        header = preamble + _read_exactly(file, rest_of_header_size)
+
+        _, arities, entries, offset = ValueBatch._parse_header(memoryview(header))
+
+        entry_index = 0
+        for sample, arity in enumerate(arities):
+            values: List[Optional[Value]] = [None] * int(arity)
+            while entry_index < len(entries) and entries[entry_index, 0] == sample:
+                _, position, value_offset, size = (int(x) for x in entries[entry_index])
+
+                _read_exactly(file, value_offset - offset)
+                values[position] = Value.from_buffer(_read_exactly(file, size))
+
+                offset = value_offset + size
+                entry_index += 1
+
+            yield tuple(values)
+
+    def __len__(self) -> int:
+        return len(self._arities)
+
+    def __getitem__(self, sample: int) -> Tuple[Optional[Value], ...]:
+        """
+        Deserialize the values of a sample of the batch.
+
+        Args:
+            sample (int):
+                index of the sample
+
+        Returns:
+            Tuple[Optional[Value], ...]:
+                values of the sample
+        """
+
+        if sample < 0:
+            sample += len(self)
+        if not 0 <= sample < len(self):
+            message = f"Sample {sample} is out of range for a batch of {len(self)} samples"
+            raise IndexError(message)
+
+        values: List[Optional[Value]] = [None] * int(self._arities[sample])
+        for _, position, offset, size in self._entries[
+            self._sample_starts[sample] : self._sample_starts[sample + 1]
+        ]:
+            values[int(position)] = Value.from_buffer(
+                self._buffer[int(offset) : int(offset) + int(size)]
+            )
+        return tuple(values)
+
+    def __iter__(self) -> Iterator[Tuple[Optional[Value], ...]]:
+        for sample in range(len(self)):
+            yield self[sample]
+
+    @staticmethod
+    def _header(
+        batch: Sequence[Any],
+        function_name: Optional[str],
+    ) -> Tuple[bytes, List[Value]]:
+        """
+        Create the header of a batch, and get the values to write after it in order.
+        """
+
+        batch = [(sample,) if isinstance(sample, Value) else sample for sample in batch]
+        for sample_index, sample in enumerate(batch):
+            if not isinstance(sample, (tuple, list)):
+                message = (
+                    f"Expected all samples of the batch to be Value or tuple of values "
+                    f"but sample {sample_index} is {type(sample).__name__}"
+                )
+                raise TypeError(message)
+
+        arities = np.array([len(sample) for sample in batch], dtype=np.uint64)
+
+        encoded_function_name = function_name.encode("utf-8") if function_name is not None else b""
+        function_name_length = len(encoded_function_name) + 1 if function_name is not None else 0
+
+        values = []
+        entries = []
+        for sample_index, sample in enumerate(batch):
+            for position, value in enumerate(sample):
+                if value is None:
+                    continue
+                if not isinstance(value, Value):
+                    message = (
+                        f"Expected all values of the batch to be Value or None "
+                        f"but sample {sample_index} has {type(value).__name__} "
+                        f"at position {position}"
+                    )
+                    raise TypeError(message)
+                values.append(value)
+                entries.append([sample_index, position, 0, value.serialized_size])
+
+        entries_array = np.array(entries, dtype=np.uint64).reshape(-1, 4)
+
+        preamble = PREAMBLE.pack(MAGIC, VERSION, function_name_length, len(batch), len(entries))
+        header_size = ValueBatch._header_size(preamble)
+
+        offset = header_size
+        for entry in entries_array:
+            offset = _align(offset)
+            entry[2] = offset
+            offset += int(entry[3])
+
+        header = bytearray(header_size)
+        header[: PREAMBLE.size] = preamble
+
+        cursor = PREAMBLE.size
+        header[cursor : cursor + len(encoded_function_name)] = encoded_function_name
+        cursor = _align(cursor + function_name_length)
+
+        header[cursor : cursor + arities.nbytes] = arities.tobytes()
+        cursor += arities.nbytes
+
+        header[cursor : cursor + entries_array.nbytes] = entries_array.tobytes()
+
+        return bytes(header), values
+
+    @staticmethod
+    def _header_size(preamble: bytes) -> int:
+        """
+        Get the size of the header of a batch from its preamble.
+        """
+
+        magic, version, function_name_length, samples, entries = PREAMBLE.unpack(preamble)
+        if magic != MAGIC:
+            message = "Expected a serialized batch of values"
+            raise ValueError(message)
+        if version != VERSION:
+            message = f"Expected a serialized batch of values of version {VERSION} not {version}"
+            raise ValueError(message)
+
+        return _align(PREAMBLE.size + function_name_length) + (samples + (entries * 4)) * 8
+
+    @staticmethod
+    def _parse_header(
+        buffer: memoryview,
+    ) -> Tuple[Optional[str], np.ndarray, np.ndarray, int]:
+        """
+        Parse the header of a batch.
+        """
+
+        if len(buffer) < PREAMBLE.size:
+            message = "Expected a serialized batch of values but the header is incomplete"
+            raise ValueError(message)
+
+        preamble = bytes(buffer[: PREAMBLE.size])
+        header_size = ValueBatch._header_size(preamble)
+        _, _, function_name_length, samples, entries = PREAMBLE.unpack(preamble)
+
+        if len(buffer) < header_size:
+            message = "Expected a serialized batch of values but the header is incomplete"
+            raise ValueError(message)
+
+        function_name = (
+            bytes(buffer[PREAMBLE.size : PREAMBLE.size + function_name_length - 1]).decode("utf-8")
+            if function_name_length != 0
+            else None
+        )
+
+        position = _align(PREAMBLE.size + function_name_length)
+        arities = np.frombuffer(buffer, dtype=np.uint64, count=samples, offset=position)
+        position += arities.nbytes
+
+        entries_array = np.frombuffer(
+            buffer, dtype=np.uint64, count=entries * 4, offset=position
+        ).reshape(-1, 4)
+
+        ValueBatch._check_entries(arities, entries_array, header_size)
+        return function_name, arities, entries_array, header_size
+
+    @staticmethod
+    def _check_entries(arities: np.ndarray, entries: np.ndarray, header_size: int):
+        """
+        Check that the entries of a batch are consistent with its header.
+
+        Entries need to be sorted by sample and position, with values following the header in order
+        without overlapping, so values can be read in place or from a stream.
+        """
+
+        sample_indices, positions, offsets, sizes = entries.T
+
+        valid = bool(np.all(sample_indices < len(arities)))
+        if valid and len(entries) != 0:
+            ends = offsets + sizes
+            same_sample = sample_indices[1:] == sample_indices[:-1]
+            valid = (
+                bool(np.all(positions < arities[sample_indices]))
+                and bool(np.all(sizes <= np.iinfo(np.uint64).max - offsets))
+                and bool(np.all(sample_indices[1:] >= sample_indices[:-1]))
+                and bool(np.all(~same_sample | (positions[1:] > positions[:-1])))
+                and int(offsets[0]) >= header_size
+                and bool(np.all(offsets[1:] >= ends[:-1]))
+            )
+
+        if not valid:
+            message = "Expected a serialized batch of values but the header is invalid"
+            raise ValueError(message)
+
+
+def _read_exactly(file: BinaryIO, size: int) -> bytes:
+    """
+    Read exactly `size` bytes from a file or a stream.
+    """
+
+    result = bytearray()
+    while len(result) < size:
+        chunk = file.read(min(size - len(result), READ_CHUNK_SIZE))
+        if not chunk:
+            message = "Expected a serialized batch of values but it ended unexpectedly"
+            raise ValueError(message)
+        result += chunk
+
+    return bytes(result)
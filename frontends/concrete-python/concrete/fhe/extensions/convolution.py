@@ -7,13 +7,15 @@ from copy import deepcopy
 from typing import Callable, List, Optional, Tuple, Union, cast
 
 import numpy as np
-import torch
 
-from ..internal.utils import assert_that
+from ..internal.utils import assert_that, lazy_import
 from ..representation import Node
 from ..tracing import Tracer
 from ..values import EncryptedTensor
 
+# torch is only loaded when a convolution is evaluated
+torch = lazy_import("torch")
+
 SUPPORTED_AUTO_PAD = {
     "NOTSET",
 }
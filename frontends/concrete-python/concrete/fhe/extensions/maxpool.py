@@ -6,13 +6,15 @@ from copy import deepcopy
 from typing import List, Optional, Tuple, Union
 
 import numpy as np
-import torch
 
-from ..internal.utils import assert_that
+from ..internal.utils import assert_that, lazy_import
 from ..representation import Node
 from ..tracing import Tracer
 from ..values import ValueDescription
 
+# torch is only loaded when a maxpool is evaluated
+torch = lazy_import("torch")
+
 # pylint: disable=too-many-branches,too-many-statements
 
 
@@ -47,16 +49,12 @@ SUPPORTED_STORAGE_ORDER = {
 }
 
 
-# pylint: disable=no-member
-
 _EVALUATORS = {
-    1: torch.max_pool1d,
-    2: torch.max_pool2d,
-    3: torch.max_pool3d,
+    1: "max_pool1d",
+    2: "max_pool2d",
+    3: "max_pool3d",
 }
 
-# pylint: enable=no-member
-
 
 def maxpool(
     x: Union[np.ndarray, Tracer],
@@ -321,7 +319,7 @@ def _evaluate(
     dims = x.ndim - 2
     assert_that(dims in {1, 2, 3})
 
-    evaluator = _EVALUATORS[dims]
+    evaluator = getattr(torch, _EVALUATORS[dims])
     result = (
         evaluator(
             torch.from_numpy(x.astype(np.float64)),  # torch only supports float maxpools
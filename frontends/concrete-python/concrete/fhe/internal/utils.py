@@ -2,6 +2,14 @@
 Declaration of various functions and constants related to the entire project.
 """
 
+import ast
+import importlib
+import importlib.util
+import sys
+import threading
+from types import ModuleType
+from typing import Any, Callable, List, Tuple
+
 
 def assert_that(condition: bool, message: str = ""):
     """
@@ -30,3 +38,139 @@ def unreachable():
 
     message = "Entered unreachable code"
     raise RuntimeError(message)
+
+
+class _LazyModule(ModuleType):
+    """
+    Proxy of a module, which imports the module when one of its attributes is accessed.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for attributes which are not copied from the actual module yet
+        # importing is done under a lock as `importlib.util.LazyLoader` is not thread-safe
+        with _LAZY_IMPORT_LOCK:
+            module = importlib.import_module(self.__name__)
+            self.__dict__.update(vars(module))
+        return getattr(module, name)
+
+
+_LAZY_IMPORT_LOCK = threading.Lock()
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Import a module, which is only loaded when one of its attributes is accessed for the first time.
+
+    Args:
+        name (str):
+            name of the module to import
+
+    Returns:
+        ModuleType:
+            module if it's already loaded, proxy of the module which loads it on first use otherwise
+
+    Raises:
+        ModuleNotFoundError:
+            if the module cannot be found
+    """
+
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        message = f"No module named '{name}'"
+        raise ModuleNotFoundError(message, name=name)
+
+    return _LazyModule(name)
+
+
+def lazy_exports(
+    package: str,
+    module: str,
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Create `__getattr__` and `__dir__` of a package, to export attributes of a module lazily.
+
+    The module is only imported when one of its attributes is accessed through the package for
+    the first time, so the submodules of the package can be imported without it.
+
+    Args:
+        package (str):
+            name of the package
+
+        module (str):
+            name of the module with the exports of the package, relative to the package
+
+    Returns:
+        Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+            `__getattr__` and `__dir__` of the package
+    """
+
+    def load() -> dict:
+        namespace = vars(sys.modules[package])
+        exports = importlib.import_module(module, package)
+
+        # exports are copied to the package, so they are only looked up once
+        for name, value in vars(exports).items():
+            if not name.startswith("_"):
+                namespace.setdefault(name, value)
+
+        return namespace
+
+    def getattr_(name: str) -> Any:
+        namespace = load() if not name.startswith("__") else {}
+        if name not in namespace:
+            message = f"module '{package}' has no attribute '{name}'"
+            raise AttributeError(message)
+        return namespace[name]
+
+    def dir_() -> List[str]:
+        return sorted(load())
+
+    return getattr_, dir_
+
+
+def export_names(package: str, module: str) -> List[str]:
+    """
+    Get the names a package exports lazily from a module, to use as `__all__` of the package.
+
+    Names are read from the source of the module without importing it, so star imports of the
+    package go through its lazy `__getattr__`, and they stay in sync with the module.
+
+    Args:
+        package (str):
+            name of the package
+
+        module (str):
+            name of the module with the exports of the package, relative to the package
+
+    Returns:
+        List[str]:
+            names of the public attributes of the module
+    """
+
+    spec = importlib.util.find_spec(module, package)
+    source = spec.loader.get_source(spec.name) if spec is not None and spec.loader else None
+
+    if source is None:  # pragma: no cover
+        # module is only available compiled, so it needs to be imported to get its attributes
+        names = list(vars(importlib.import_module(module, package)))
+    else:
+        names = []
+        for statement in ast.parse(source).body:
+            if isinstance(statement, (ast.Import, ast.ImportFrom)):
+                names.extend(
+                    alias.asname or alias.name.split(".")[0]
+                    for alias in statement.names
+                    if alias.name != "*"
+                )
+            elif isinstance(statement, (ast.FunctionDef, ast.ClassDef)):
+                names.append(statement.name)
+            elif isinstance(statement, ast.Assign):
+                names.extend(
+                    target.id for target in statement.targets if isinstance(target, ast.Name)
+                )
+
+    return sorted({name for name in names if not name.startswith("_")})
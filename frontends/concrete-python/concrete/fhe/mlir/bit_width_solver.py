@@ -0,0 +1,319 @@
+"""
+Declaration of `BitWidth`, `BitWidthConstraint` and `BitWidthSolver` classes.
+"""
+
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple, Union
+
+OPERATORS: Dict[str, Callable] = {
+    "==": lambda x, y: x == y,
+    "!=": lambda x, y: x != y,
+    ">=": lambda x, y: x >= y,
+    ">": lambda x, y: x > y,
+    "<=": lambda x, y: x <= y,
+    "<": lambda x, y: x < y,
+}
+
+# operators to use when operands of a constraint are swapped
+FLIPPED_OPERATORS: Dict[str, str] = {
+    "==": "==",
+    "!=": "!=",
+    ">=": "<=",
+    ">": "<",
+    "<=": ">=",
+    "<": ">",
+}
+
+
+class BitWidth:
+    """
+    BitWidth class, to represent the symbolic bit-width of a node during bit-width assignment.
+
+    Comparing a bit-width to another bit-width or to an integer creates a constraint,
+    which is then added to the solver the bit-width belongs to.
+    """
+
+    name: str
+    index: int
+
+    def __init__(self, name: str, index: int):
+        self.name = name
+        self.index = index
+
+    def __str__(self) -> str:
+        return self.name
+
+    def __repr__(self) -> str:
+        return self.name
+
+    __hash__ = object.__hash__
+
+    # pylint: disable=unexpected-special-method-signature
+
+    def __eq__(self, other: Union["BitWidth", int]) -> "BitWidthConstraint":  # type: ignore
+        return BitWidthConstraint(self, "==", other)
+
+    def __ne__(self, other: Union["BitWidth", int]) -> "BitWidthConstraint":  # type: ignore
+        return BitWidthConstraint(self, "!=", other)
+
+    def __ge__(self, other: Union["BitWidth", int]) -> "BitWidthConstraint":
+        return BitWidthConstraint(self, ">=", other)
+
+    def __gt__(self, other: Union["BitWidth", int]) -> "BitWidthConstraint":
+        return BitWidthConstraint(self, ">", other)
+
+    def __le__(self, other: Union["BitWidth", int]) -> "BitWidthConstraint":
+        return BitWidthConstraint(self, "<=", other)
+
+    def __lt__(self, other: Union["BitWidth", int]) -> "BitWidthConstraint":
+        return BitWidthConstraint(self, "<", other)
+
+    # pylint: enable=unexpected-special-method-signature
+
+
+class BitWidthConstraint:
+    """
+    BitWidthConstraint class, to represent a comparison between a bit-width and another operand.
+    """
+
+    left: BitWidth
+    operator: str
+    right: Union[BitWidth, int]
+
+    def __init__(self, left: BitWidth, operator: str, right: Union[BitWidth, int]):
+        self.left = left
+        self.operator = operator
+        self.right = right
+
+    def __str__(self) -> str:
+        return f"{self.left} {self.operator} {self.right}"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class BitWidthSolver:
+    """
+    BitWidthSolver class, to find the smallest bit-widths satisfying a set of constraints.
+
+    Constraints of bit-width assignment are lower bounds (e.g., `x >= 3`, `x >= y`) and equalities
+    (e.g., `x == y`). Such systems have a unique least solution, which is the solution minimizing
+    the sum of the bit-widths. It's found without a general purpose solver: bit-widths which are
+    equal are merged into classes using union-find, and lower bounds are propagated between the
+    classes until all of them are satisfied.
+
+    Systems with other constraints (e.g., upper bounds) are solved using z3.
+    """
+
+    variables: List[BitWidth]
+    constraints: List[BitWidthConstraint]
+
+    _variables_by_name: Dict[str, BitWidth]
+    _minimized: List[bool]
+
+    _parents: List[int]
+    _lower_bounds: List[int]
+    # (source, target, offset) means `target >= source + offset`
+    _edges: List[Tuple[int, int, int]]
+
+    _is_supported: bool
+
+    def __init__(self):
+        self.variables = []
+        self.constraints = []
+
+        self._variables_by_name = {}
+        self._minimized = []
+
+        self._parents = []
+        self._lower_bounds = []
+        self._edges = []
+
+        self._is_supported = True
+
+    def variable(self, name: str, minimize: bool = True) -> BitWidth:
+        """
+        Get the bit-width with a name, or create it if it doesn't exist yet.
+
+        Args:
+            name (str):
+                name of the bit-width
+
+            minimize (bool, default = True):
+                whether the bit-width is a part of the sum to minimize
+
+        Returns:
+            BitWidth:
+                bit-width with the name
+        """
+
+        variable = self._variables_by_name.get(name)
+        if variable is not None:
+            return variable
+
+        variable = BitWidth(name, len(self.variables))
+
+        self.variables.append(variable)
+        self._variables_by_name[name] = variable
+        self._minimized.append(minimize)
+
+        self._parents.append(variable.index)
+        self._lower_bounds.append(0)
+
+        return variable
+
+    def add(self, constraint: BitWidthConstraint):
+        """
+        Add a constraint to the solver.
+
+        Args:
+            constraint (BitWidthConstraint):
+                constraint to add
+        """
+
+        self.constraints.append(constraint)
+        if not self._is_supported:
+            return
+
+        left, operation, right = constraint.left, constraint.operator, constraint.right
+        if operation in {"<=", "<"} and isinstance(right, BitWidth):
+            left, operation, right = right, FLIPPED_OPERATORS[operation], left
+
+        if operation == "==" and isinstance(right, BitWidth):
+            self._union(left.index, right.index)
+
+        elif operation in {">=", ">"}:
+            offset = 1 if operation == ">" else 0
+            if isinstance(right, BitWidth):
+                self._edges.append((right.index, left.index, offset))
+            else:
+                root = self._find(left.index)
+                self._lower_bounds[root] = max(self._lower_bounds[root], int(right) + offset)
+
+        else:
+            self._is_supported = False
+
+    def solve(self) -> Dict[str, int]:
+        """
+        Find the smallest bit-widths satisfying the constraints.
+
+        Returns:
+            Dict[str, int]:
+                bit-width of each variable by its name
+        """
+
+        if not self._is_supported:
+            return self.solve_with_z3()
+
+        values = self._propagate()
+        if values is None:
+            # constraints are contradictory, so let z3 report it
+            return self.solve_with_z3()
+
+        return {variable.name: values[self._find(variable.index)] for variable in self.variables}
+
+    def solve_with_z3(self) -> Dict[str, int]:
+        """
+        Find the bit-widths satisfying the constraints with the smallest sum using z3.
+
+        Returns:
+            Dict[str, int]:
+                bit-width of each variable by its name
+        """
+
+        # pylint: disable=import-outside-toplevel
+
+        # z3 is only loaded when it's needed, as it's slow to import
+        import z3
+
+        # pylint: enable=import-outside-toplevel
+
+        optimizer = z3.Optimize()
+        variables = [z3.Int(variable.name) for variable in self.variables]
+
+        for constraint in self.constraints:
+            left = variables[constraint.left.index]
+            right = (
+                variables[constraint.right.index]
+                if isinstance(constraint.right, BitWidth)
+                else constraint.right
+            )
+            optimizer.add(OPERATORS[constraint.operator](left, right))
+
+        optimizer.minimize(
+            sum(
+                variable
+                for variable, is_minimized in zip(variables, self._minimized)
+                if is_minimized
+            )
+        )
+
+        assert optimizer.check() == z3.sat
+        model = optimizer.model()
+
+        return {
+            variable.name: model.eval(z3_variable, model_completion=True).as_long()
+            for variable, z3_variable in zip(self.variables, variables)
+        }
+
+    def _find(self, index: int) -> int:
+        parents = self._parents
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    def _union(self, first: int, second: int):
+        first = self._find(first)
+        second = self._find(second)
+        if first == second:
+            return
+
+        if first > second:
+            first, second = second, first
+
+        self._parents[second] = first
+        self._lower_bounds[first] = max(self._lower_bounds[first], self._lower_bounds[second])
+
+    def _propagate(self) -> Optional[List[int]]:
+        """
+        Propagate lower bounds between the classes, or return None if they can't be satisfied.
+        """
+
+        values = list(self._lower_bounds)
+
+        successors: Dict[int, List[Tuple[int, int]]] = {}
+        for source, target, offset in self._edges:
+            source = self._find(source)
+            target = self._find(target)
+            if source == target:
+                if offset > 0:
+                    return None
+                continue
+            successors.setdefault(source, []).append((target, offset))
+
+        # without contradictions, the value of a class is increased at most once per other class
+        maximum_updates = len(self.variables)
+        updates = [0] * len(self.variables)
+
+        worklist: Deque[int] = deque(successors)
+        in_worklist = set(successors)
+
+        while len(worklist) != 0:
+            source = worklist.popleft()
+            in_worklist.remove(source)
+
+            for target, offset in successors[source]:
+                if values[target] >= values[source] + offset:
+                    continue
+
+                values[target] = values[source] + offset
+                updates[target] += 1
+                if updates[target] > maximum_updates:
+                    return None
+
+                if target in successors and target not in in_worklist:
+                    worklist.append(target)
+                    in_worklist.add(target)
+
+        return values
@@ -6,11 +6,10 @@ Declaration of `Converter` class.
 
 import math
 import sys
-from typing import Dict, Iterable, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union
 
 import concrete.lang
 import concrete.lang.dialects.tracing
-import networkx as nx
 import numpy as np
 from mlir.dialects import func
 from mlir.ir import Context as MlirContext
@@ -20,6 +19,8 @@ from mlir.ir import Module as MlirModule
 
 from ..compilation.composition import CompositionRule
 from ..compilation.configuration import Configuration, Exactness, ParameterSelectionStrategy
+from ..compilation.profiler import CompilationProfiler
+from ..internal.utils import lazy_import
 from ..representation import Graph, GraphProcessor, MultiGraphProcessor, Node, Operation
 from ..tfhers.dtypes import TFHERSIntegerType
 from .context import Context
@@ -27,6 +28,12 @@ from .conversion import Conversion
 from .processors import *  # pylint: disable=wildcard-import
 from .utils import MAXIMUM_TLU_BIT_WIDTH, construct_deduplicated_tables
 
+if TYPE_CHECKING:
+    import networkx as nx  # pragma: no cover
+else:
+    # networkx is only loaded when a graph is created
+    nx = lazy_import("networkx")
+
 # pylint: enable=import-error,no-name-in-module
 
 
@@ -37,14 +44,17 @@ class Converter:
 
     configuration: Configuration
     composition_rules: List[CompositionRule]
+    profiler: CompilationProfiler
 
     def __init__(
         self,
         configuration: Configuration,
         composition_rules: Optional[Iterable[CompositionRule]] = None,
+        profiler: Optional[CompilationProfiler] = None,
     ):
         self.configuration = configuration
         self.composition_rules = list(composition_rules) if composition_rules else []
+        self.profiler = profiler if profiler is not None else CompilationProfiler()
 
     def convert_many(
         self,
@@ -73,70 +83,72 @@ class Converter:
             module = MlirModule.create()
             with MlirInsertionPoint(module.body):
                 for name, graph in graphs.items():
-                    # pylint: disable=cell-var-from-loop
-                    # ruff: noqa: B023
-                    ctx = Context(context, graph, self.configuration)
-
-                    # if using tfhers integers, parameter selection strategy has to be
-                    # multi-parameters. We try to catch this early, although the compiler
-                    # will also fail without it.
-                    if (
-                        any(
-                            isinstance(node.output.dtype, TFHERSIntegerType)
-                            for node in graph.ordered_inputs()
-                        )
-                        and self.configuration.parameter_selection_strategy
-                        != ParameterSelectionStrategy.MULTI
-                    ):
-                        msg = (
-                            "Can't use tfhers integers with "
-                            f"{self.configuration.parameter_selection_strategy} parameters. "
-                            "Please use `ParameterSelectionStrategy.MULTI` as the parameter "
-                            "selection strategy instead."
-                        )
-                        raise RuntimeError(msg)
-
-                    input_types = [ctx.typeof(node).mlir for node in graph.ordered_inputs()]
-
-                    location = graph.location.split(":")
-                    with MlirLocation.file(
-                        location[0], line=int(location[1]), col=0, context=context
-                    ):
-
-                        @func.FuncOp.from_py_func(*input_types, name=name)
-                        def main(*args):
-                            for index, node in enumerate(graph.ordered_inputs()):
-                                conversion = Conversion(node, args[index])
-                                if "original_bit_width" in node.properties:
-                                    conversion.set_original_bit_width(
-                                        node.properties["original_bit_width"]
-                                    )
-                                ctx.conversions[node] = conversion
-
-                            ordered_nodes = [
-                                node
-                                for node in nx.lexicographical_topological_sort(graph.graph)
-                                if node.operation != Operation.Input
-                            ]
+                    with self.profiler.stage("mlir-generation", name):
+                        # pylint: disable=cell-var-from-loop
+                        # ruff: noqa: B023
+                        ctx = Context(context, graph, self.configuration)
+
+                        # if using tfhers integers, parameter selection strategy has to be
+                        # multi-parameters. We try to catch this early, although the compiler
+                        # will also fail without it.
+                        if (
+                            any(
+                                isinstance(node.output.dtype, TFHERSIntegerType)
+                                for node in graph.ordered_inputs()
+                            )
+                            and self.configuration.parameter_selection_strategy
+                            != ParameterSelectionStrategy.MULTI
+                        ):
+                            msg = (
+                                "Can't use tfhers integers with "
+                                f"{self.configuration.parameter_selection_strategy} parameters. "
+                                "Please use `ParameterSelectionStrategy.MULTI` as the parameter "
+                                "selection strategy instead."
+                            )
+                            raise RuntimeError(msg)
+
+                        input_types = [ctx.typeof(node).mlir for node in graph.ordered_inputs()]
+
+                        location = graph.location.split(":")
+                        with MlirLocation.file(
+                            location[0], line=int(location[1]), col=0, context=context
+                        ):
+
+                            @func.FuncOp.from_py_func(*input_types, name=name)
+                            def main(*args):
+                                for index, node in enumerate(graph.ordered_inputs()):
+                                    conversion = Conversion(node, args[index])
+                                    if "original_bit_width" in node.properties:
+                                        conversion.set_original_bit_width(
+                                            node.properties["original_bit_width"]
+                                        )
+                                    ctx.conversions[node] = conversion
+
+                                ordered_nodes = [
+                                    node
+                                    for node in nx.lexicographical_topological_sort(graph.graph)
+                                    if node.operation != Operation.Input
+                                ]
 
-                            for progress_index, node in enumerate(ordered_nodes):
+                                for progress_index, node in enumerate(ordered_nodes):
+                                    self.trace_progress(
+                                        self.configuration, progress_index, ordered_nodes
+                                    )
+                                    preds = [
+                                        ctx.conversions[pred]
+                                        for pred in graph.ordered_preds_of(node)
+                                    ]
+                                    self.node(ctx, node, preds)
                                 self.trace_progress(
-                                    self.configuration, progress_index, ordered_nodes
+                                    self.configuration, len(ordered_nodes), ordered_nodes
                                 )
-                                preds = [
-                                    ctx.conversions[pred] for pred in graph.ordered_preds_of(node)
-                                ]
-                                self.node(ctx, node, preds)
-                            self.trace_progress(
-                                self.configuration, len(ordered_nodes), ordered_nodes
-                            )
 
-                            outputs = []
-                            for node in graph.ordered_outputs():
-                                assert node in ctx.conversions
-                                outputs.append(ctx.conversions[node].result)
+                                outputs = []
+                                for node in graph.ordered_outputs():
+                                    assert node in ctx.conversions
+                                    outputs.append(ctx.conversions[node].result)
 
-                            return tuple(outputs)
+                                return tuple(outputs)
 
         return module
 
@@ -273,13 +285,18 @@ class Converter:
             ]
         )
 
-        for processor in pipeline:
-            assert isinstance(processor, GraphProcessor)
-            if isinstance(processor, MultiGraphProcessor):
-                processor.apply_many(graphs)
-            else:
-                for graph in graphs.values():
-                    processor.apply(graph)
+        with self.profiler.stage("processing"):
+            for processor in pipeline:
+                assert isinstance(processor, GraphProcessor)
+
+                stage = f"processing.{type(processor).__name__}"
+                if isinstance(processor, MultiGraphProcessor):
+                    with self.profiler.stage(stage):
+                        processor.apply_many(graphs)
+                else:
+                    for name, graph in graphs.items():
+                        with self.profiler.stage(stage, name):
+                            processor.apply(graph)
 
     def node(self, ctx: Context, node: Node, preds: List[Conversion]) -> Conversion:
         """
@@ -4,8 +4,6 @@ Declaration of `AssignBitWidths` graph processor.
 
 from typing import Dict, List
 
-import z3
-
 from ...compilation.composition import CompositionRule
 from ...compilation.configuration import (
     BitwiseStrategy,
@@ -15,6 +13,7 @@ from ...compilation.configuration import (
 )
 from ...dtypes import Integer
 from ...representation import Graph, MultiGraphProcessor, Node, Operation
+from ..bit_width_solver import BitWidth, BitWidthConstraint, BitWidthSolver
 
 
 class AssignBitWidths(MultiGraphProcessor):
@@ -57,12 +56,12 @@ class AssignBitWidths(MultiGraphProcessor):
         self.min_max_strategy_preference = min_max_strategy_preference
 
     def apply_many(self, graphs: Dict[str, Graph]):
-        optimizer = z3.Optimize()
+        optimizer = BitWidthSolver()
 
-        bit_widths: Dict[Node, z3.Int] = {}
+        bit_widths: Dict[Node, BitWidth] = {}
 
         for graph_name, graph in graphs.items():
-            max_bit_width: z3.Int = z3.Int(f"{graph_name}.max")
+            max_bit_width = optimizer.variable(f"{graph_name}.max", minimize=False)
 
             additional_constraints = AdditionalConstraints(
                 optimizer,
@@ -84,7 +83,7 @@ class AssignBitWidths(MultiGraphProcessor):
                 if bit_width_hint is not None:
                     required_bit_width = max(required_bit_width, bit_width_hint)
 
-                bit_width = z3.Int(f"{graph_name}.%{i}")
+                bit_width = optimizer.variable(f"{graph_name}.%{i}")
                 bit_widths[node] = bit_width
 
                 base_constraint = bit_width >= required_bit_width
@@ -105,14 +104,11 @@ class AssignBitWidths(MultiGraphProcessor):
                 to_node = graphs[compo.to.func].ordered_inputs()[compo.to.pos]
                 optimizer.add(bit_widths[from_node] == bit_widths[to_node])
 
-        optimizer.minimize(sum(bit_width for bit_width in bit_widths.values()))
-
-        assert optimizer.check() == z3.sat
-        model = optimizer.model()
+        model = optimizer.solve()
 
         for node, bit_width in bit_widths.items():
             assert isinstance(node.output.dtype, Integer)
-            new_bit_width = model[bit_width].as_long()
+            new_bit_width = model[bit_width.name]
             original_bit_width = node.properties.get(
                 "bit_width_hint",
                 node.output.dtype.bit_width,
@@ -133,9 +129,9 @@ class AdditionalConstraints:
     AdditionalConstraints class to customize bit-width assignment step easily.
     """
 
-    optimizer: z3.Optimize
+    optimizer: BitWidthSolver
     graph: Graph
-    bit_widths: Dict[Node, z3.Int]
+    bit_widths: Dict[Node, BitWidth]
 
     comparison_strategy_preference: List[ComparisonStrategy]
     bitwise_strategy_preference: List[BitwiseStrategy]
@@ -144,15 +140,15 @@ class AdditionalConstraints:
     min_max_strategy_preference: List[MinMaxStrategy]
 
     node: Node
-    bit_width: z3.Int
+    bit_width: BitWidth
 
     # pylint: disable=missing-function-docstring,unused-argument
 
     def __init__(
         self,
-        optimizer: z3.Optimize,
+        optimizer: BitWidthSolver,
         graph: Graph,
-        bit_widths: Dict[Node, z3.Int],
+        bit_widths: Dict[Node, BitWidth],
         comparison_strategy_preference: List[ComparisonStrategy],
         bitwise_strategy_preference: List[BitwiseStrategy],
         shifts_with_promotion: bool,
@@ -169,7 +165,7 @@ class AdditionalConstraints:
         self.multivariate_strategy_preference = multivariate_strategy_preference
         self.min_max_strategy_preference = min_max_strategy_preference
 
-    def generate_for(self, node: Node, bit_width: z3.Int):
+    def generate_for(self, node: Node, bit_width: BitWidth):
         """
         Generate additional constraints for a node.
 
@@ -177,7 +173,7 @@ class AdditionalConstraints:
             node (Node):
                 node to generate constraints for
 
-            bit_width (z3.Int):
+            bit_width (BitWidth):
                 symbolic bit-width which will be assigned to node once constraints are solved
         """
 
@@ -225,7 +221,7 @@ class AdditionalConstraints:
                 )
                 raise ValueError(message)
 
-    def constraint(self, node: Node, constraint: z3.BoolRef):
+    def constraint(self, node: Node, constraint: BitWidthConstraint):
         node.bit_width_constraints.append(constraint)
         self.optimizer.add(constraint)
 
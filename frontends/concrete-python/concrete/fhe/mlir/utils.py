@@ -8,7 +8,7 @@ from collections import defaultdict, deque
 from copy import deepcopy
 from enum import IntEnum
 from itertools import chain, product
-from typing import Any, DefaultDict, List, Optional, Tuple, Union, cast
+from typing import Any, DefaultDict, Dict, List, Optional, Tuple, Union, cast
 
 import numpy as np
 from mlir.dialects import tensor
@@ -28,6 +28,8 @@ from ..representation import Node, Operation
 
 # pylint: enable=import-error,no-name-in-module
 
+MAXIMUM_NUMBER_OF_ELEMENTS_TO_EVALUATE_AT_ONCE = 2**20
+
 
 class HashableNdarray:
     """
@@ -77,6 +79,92 @@ def flood_replace_none_values(table: list):
     assert_that(all(value is not None for value in table))
 
 
+def evaluate_on_candidates(
+    node: Node,
+    args: List[Any],
+    candidates: Dict[int, np.ndarray],
+) -> List[Optional[Union[int, np.bool_, np.integer, np.floating, np.ndarray]]]:
+    """
+    Evaluate a node for each candidate value of its variable inputs, to fill a lookup table.
+
+    Candidates are evaluated at once when the node supports it and one by one otherwise.
+
+    Args:
+        node (Node):
+            node to evaluate
+
+        args (List[Any]):
+            arguments of the node, values of variable inputs are ignored
+
+        candidates (Dict[int, np.ndarray]):
+            candidate values of each variable input, all with the same length,
+            each value is broadcasted to the shape of the corresponding input
+
+    Returns:
+        List[Optional[Union[int, np.bool_, np.integer, np.floating, np.ndarray]]]:
+            evaluation of each candidate, which is an integer if all of its elements are the same,
+            or None if it couldn't be evaluated
+    """
+
+    def table_entry(
+        evaluation: Union[np.bool_, np.integer, np.floating, np.ndarray],
+        minimum: Union[np.bool_, np.integer, np.floating],
+        maximum: Union[np.bool_, np.integer, np.floating],
+    ) -> Optional[Union[int, np.bool_, np.integer, np.floating, np.ndarray]]:
+        try:
+            # if evaluation consist a single value, we can use
+            # the value instead of the full tensor to save memory
+            return evaluation if minimum != maximum else int(minimum)
+        except Exception:  # pylint: disable=broad-except
+            return None
+
+    args = list(args)
+    number_of_candidates = len(next(iter(candidates.values())))
+
+    number_of_elements = max(int(np.prod(node.output.shape)), 1)
+    batch_size = max(MAXIMUM_NUMBER_OF_ELEMENTS_TO_EVALUATE_AT_ONCE // number_of_elements, 1)
+
+    table: List[Optional[Union[int, np.bool_, np.integer, np.floating, np.ndarray]]] = []
+    for start in range(0, number_of_candidates, batch_size):
+        end = min(start + batch_size, number_of_candidates)
+        size = end - start
+
+        stacked_args = list(args)
+        stacked = [False] * len(args)
+        for index, values in candidates.items():
+            shape = node.inputs[index].shape
+            candidate_values = values[start:end].reshape((size,) + ((1,) * len(shape)))
+            stacked_args[index] = np.ones((size, *shape), dtype=np.int64) * candidate_values
+            stacked[index] = True
+
+        try:
+            evaluations = node.evaluate_stacked(size, stacked_args, stacked)
+        except Exception:  # pylint: disable=broad-except
+            evaluations = None
+
+        if evaluations is not None:
+            flat_evaluations = evaluations.reshape((size, -1))
+            minimums = flat_evaluations.min(axis=1)
+            maximums = flat_evaluations.max(axis=1)
+            for evaluation, minimum, maximum in zip(evaluations, minimums, maximums):
+                table.append(table_entry(evaluation, minimum, maximum))
+            continue
+
+        for position in range(start, end):
+            try:
+                for index, values in candidates.items():
+                    shape = node.inputs[index].shape
+                    args[index] = np.ones(shape, dtype=np.int64) * values[position]
+                evaluation = node(*args)
+                table.append(table_entry(evaluation, evaluation.min(), evaluation.max()))
+            except Exception:  # pylint: disable=broad-except
+                # here we try our best to fill the table
+                # if it fails, we append None and let flooding algorithm replace None values
+                table.append(None)
+
+    return table
+
+
 def construct_table_multivariate(node: Node, preds: List[Node]) -> List[Any]:
     """
     Construct the lookup table for a multivariate node.
@@ -99,39 +187,27 @@ def construct_table_multivariate(node: Node, preds: List[Node]) -> List[Any]:
     )
 
     packing_bit_width = sum(pred.properties["original_bit_width"] for pred in preds)
-    packed_values = range(0, 2**packing_bit_width)
+    packed_values = np.arange(0, 2**packing_bit_width, dtype=np.int64)
 
-    np.seterr(divide="ignore")
-
-    table: List[Optional[Union[int, np.bool_, np.integer, np.floating, np.ndarray]]] = []
-    for packed_value in packed_values:
-        inputs = []
+    candidates: Dict[int, np.ndarray] = {}
 
-        shift = 0
-        for description, pred in zip(node.inputs, preds):
-            assert isinstance(description.dtype, Integer)
+    shift = 0
+    for index, (description, pred) in enumerate(zip(node.inputs, preds)):
+        assert isinstance(description.dtype, Integer)
 
-            bit_width = pred.properties["original_bit_width"]
-            is_signed = description.dtype.is_signed
+        bit_width = pred.properties["original_bit_width"]
+        is_signed = description.dtype.is_signed
 
-            value = (packed_value >> shift) & ((2**bit_width) - 1)
-            shift += bit_width
+        values = (packed_values >> shift) & ((2**bit_width) - 1)
+        shift += bit_width
 
-            if is_signed:
-                value -= 2 ** (bit_width - 1)
+        if is_signed:
+            values -= 2 ** (bit_width - 1)
 
-            inputs.append(np.ones(description.shape, dtype=np.int64) * value)
-
-        try:
-            evaluation = node(*inputs)
-            table.append(
-                evaluation if evaluation.min() != evaluation.max() else int(evaluation.min())
-            )
-        except Exception:  # pylint: disable=broad-except  # pragma: no cover
-            # here we try our best to fill the table
-            # if it fails, we append None and let flooding algorithm replace None values below
-            table.append(None)
+        candidates[index] = values
 
+    np.seterr(divide="ignore")
+    table = evaluate_on_candidates(node, [None] * len(preds), candidates)
     np.seterr(divide="warn")
 
     flood_replace_none_values(table)
@@ -171,7 +247,6 @@ def construct_table(node: Node, preds: List[Node], configuration: Configuration)
     variable_input = preds[variable_input_index]
 
     variable_input_dtype = variable_input.output.dtype
-    variable_input_shape = variable_input.output.shape
 
     assert_that(isinstance(variable_input_dtype, Integer))
     variable_input_dtype = deepcopy(cast(Integer, variable_input_dtype))
@@ -249,22 +324,11 @@ def construct_table(node: Node, preds: List[Node], configuration: Configuration)
     np.seterr(divide="ignore")
 
     inputs: List[Any] = [pred() if pred.operation == Operation.Constant else None for pred in preds]
-    table: List[Optional[Union[int, np.bool_, np.integer, np.floating, np.ndarray]]] = []
-    for value in values:
-        try:
-            inputs[variable_input_index] = np.ones(variable_input_shape, dtype=np.int64) * value
-            evaluation = node(*inputs)
-            table.append(
-                # if evaluation consist a single value, we can use
-                # the value instead of the full tensor to save memory
-                evaluation
-                if evaluation.min() != evaluation.max()
-                else int(evaluation.min())
-            )
-        except Exception:  # pylint: disable=broad-except
-            # here we try our best to fill the table
-            # if it fails, we append None and let flooding algorithm replace None values below
-            table.append(None)
+    table = evaluate_on_candidates(
+        node,
+        inputs,
+        {variable_input_index: np.fromiter(values, dtype=np.int64)},
+    )
 
     np.seterr(divide="warn")
 
@@ -2,33 +2,82 @@
 Declaration of `Graph` class.
 """
 
+import itertools
 import math
+import multiprocessing
 import os
 import re
+import sys
 import tempfile
+import threading
+import warnings
 from abc import ABC, abstractmethod
+from collections import deque
 from copy import deepcopy
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
-import networkx as nx
 import numpy as np
-import scipy.special
-import z3
 
 from ..dtypes import Float, Integer, UnsignedInteger
+from ..internal.utils import lazy_import
 from .node import Node
 from .operation import Operation
 
+if TYPE_CHECKING:
+    import networkx as nx  # pragma: no cover
+
+    from ..mlir.bit_width_solver import BitWidthSolver  # pragma: no cover
+    from .versioned_graph import VersionedMultiDiGraph  # pragma: no cover
+else:
+    # networkx is only loaded when a graph is created
+    nx = lazy_import("networkx")
+
 P_ERROR_PER_ERROR_SIZE_CACHE: Dict[float, Dict[int, float]] = {}
 
+# number of batches of samples sent to a worker process at once during bounds measurement
+BATCHES_PER_BOUNDS_MEASUREMENT_TASK = 4
+
+
+class ExecutionPlan(NamedTuple):
+    """
+    ExecutionPlan class, to evaluate a graph without analyzing its structure each time.
+    """
+
+    # version of the graph the plan is created for
+    version: int
+
+    # nodes of the graph in topological order
+    nodes: List[Node]
+
+    # positions of the ordered predecessors of each node in `nodes`
+    preds: List[List[int]]
+
+    # whether each node needs its own copy of its arguments
+    copies: List[bool]
+
 
 class Graph:
     """
     Graph class, to represent computation graphs.
     """
 
-    graph: nx.MultiDiGraph
+    _graph: "VersionedMultiDiGraph"
+    _execution_plan: Optional[ExecutionPlan]
 
     input_nodes: Dict[int, Node]
     output_nodes: Dict[int, Node]
@@ -37,8 +86,8 @@ class Graph:
 
     is_direct: bool
 
-    bit_width_constraints: Optional[z3.Optimize]
-    bit_width_assignments: Optional[z3.Model]
+    bit_width_constraints: Optional["BitWidthSolver"]
+    bit_width_assignments: Optional[Dict[str, int]]
 
     name: str
 
@@ -46,7 +95,7 @@ class Graph:
 
     def __init__(
         self,
-        graph: nx.MultiDiGraph,
+        graph: "nx.MultiDiGraph",
         input_nodes: Dict[int, Node],
         output_nodes: Dict[int, Node],
         name: str,
@@ -70,6 +119,68 @@ class Graph:
 
         self.prune_useless_nodes()
 
+    @property
+    def graph(self) -> "nx.MultiDiGraph":
+        """
+        Get the underlying networkx graph.
+
+        Returns:
+            nx.MultiDiGraph:
+                underlying networkx graph
+        """
+
+        return self._graph
+
+    @graph.setter
+    def graph(self, graph: "nx.MultiDiGraph"):
+        """
+        Set the underlying networkx graph.
+
+        Args:
+            graph (nx.MultiDiGraph):
+                new underlying networkx graph
+        """
+
+        # pylint: disable=import-outside-toplevel
+
+        # it's a subclass of a networkx class, so it's only defined once networkx is loaded
+        from .versioned_graph import VersionedMultiDiGraph
+
+        # pylint: enable=import-outside-toplevel
+
+        if not isinstance(graph, VersionedMultiDiGraph):
+            graph = VersionedMultiDiGraph(graph)
+
+        self._graph = graph
+        self._execution_plan = None
+
+    @property
+    def execution_plan(self) -> ExecutionPlan:
+        """
+        Get the execution plan of the graph, which is created again only if the graph changes.
+
+        Returns:
+            ExecutionPlan:
+                execution plan of the graph
+        """
+
+        plan = self._execution_plan
+        if plan is not None and plan.version == self._graph.version:
+            return plan
+
+        nodes = list(nx.topological_sort(self._graph))
+        positions = {node: position for position, node in enumerate(nodes)}
+
+        plan = ExecutionPlan(
+            version=self._graph.version,
+            nodes=nodes,
+            preds=[[positions[pred] for pred in self.ordered_preds_of(node)] for node in nodes],
+            copies=[node.may_mutate_inputs for node in nodes],
+        )
+
+        self._execution_plan = plan
+        return plan
+
     def __call__(
         self,
         *args: Any,
@@ -82,7 +193,11 @@ class Graph:
         Tuple[Union[np.bool_, np.integer, np.floating, np.ndarray], ...],
     ]:
         evaluation = self.evaluate(*args, p_error=p_error)
-        result = tuple(evaluation[node] for node in self.ordered_outputs())
+
+        # values of nodes might share memory with each other or with constants of the graph
+        # so outputs are copied to make sure they can be modified safely
+        result = tuple(deepcopy(evaluation[node]) for node in self.ordered_outputs())
+
         return result if len(result) > 1 else result[0]
 
     def evaluate(
@@ -103,6 +218,7 @@ class Graph:
         Returns:
             Dict[Node, Union[np.bool\_, np.integer, np.floating, np.ndarray]]:
                 nodes and their values during computation
+                (values are not copied unless necessary so they might share memory)
         """
 
         # pylint: disable=no-member,too-many-nested-blocks,too-many-branches,too-many-statements
@@ -112,23 +228,29 @@ class Graph:
 
         assert isinstance(p_error, float)
 
-        node_results: Dict[Node, Union[np.bool_, np.integer, np.floating, np.ndarray]] = {}
-        for node in nx.topological_sort(self.graph):
+        plan = self.execution_plan
+
+        results: List[Any] = [None] * len(plan.nodes)
+        for position, node in enumerate(plan.nodes):
             if node.operation == Operation.Input:
-                node_results[node] = node(args[self.input_indices[node]])
+                results[position] = node(args[self.input_indices[node]])
                 continue
 
-            pred_results = [deepcopy(node_results[pred]) for pred in self.ordered_preds_of(node)]
+            preds = plan.preds[position]
+            if plan.copies[position]:
+                pred_results = [deepcopy(results[pred]) for pred in preds]
+            else:
+                pred_results = [results[pred] for pred in preds]
 
             if p_error > 0.0 and node.converted_to_table_lookup:  # pragma: no cover
                 variable_input_indices = [
                     idx
-                    for idx, pred in enumerate(self.ordered_preds_of(node))
-                    if pred.operation != Operation.Constant
+                    for idx, pred in enumerate(preds)
+                    if plan.nodes[pred].operation != Operation.Constant
                 ]
 
                 for index in variable_input_indices:
-                    pred_node = self.ordered_preds_of(node)[index]
+                    pred_node = plan.nodes[preds[index]]
                     if pred_node.operation != Operation.Input:
                         dtype = node.inputs[index].dtype
                         if isinstance(dtype, Integer):
@@ -136,6 +258,11 @@ class Graph:
                             # to learn more about the distribution of error
 
                             if p_error not in P_ERROR_PER_ERROR_SIZE_CACHE:
+                                # pylint: disable=import-outside-toplevel
+                                import scipy.special
+
+                                # pylint: enable=import-outside-toplevel
+
                                 std_score = math.sqrt(2) * scipy.special.erfcinv(p_error)
                                 p_error_per_error_size = {}
 
@@ -195,7 +322,7 @@ class Graph:
                             pred_results[index] = new_result
 
             try:
-                node_results[node] = node(*pred_results)
+                results[position] = node(*pred_results)
             except Exception as error:
                 raise RuntimeError(
                     "Evaluation of the graph failed\n\n"
@@ -205,7 +332,7 @@ class Graph:
                     )
                 ) from error
 
-        return node_results
+        return dict(zip(plan.nodes, results))
 
     def draw(
         self,
@@ -582,7 +709,7 @@ class Graph:
             if len(node.bit_width_constraints) > 0:
                 result += f"%{i}:\n"
                 for constraint in node.bit_width_constraints:
-                    result += f"    {constraint.arg(0)} {constraint.decl()} {constraint.arg(1)}\n"
+                    result += f"    {constraint}\n"
         return result[:-1]
 
     def format_bit_width_assignments(self) -> str:
@@ -595,9 +722,8 @@ class Graph:
         """
 
         lines = []
-        for variable in self.bit_width_assignments.decls():  # type: ignore
-            if variable.name().startswith(f"{self.name}.") or variable.name() == "input_output":
-                width = self.bit_width_assignments.get_interp(variable)  # type: ignore
+        for variable, width in self.bit_width_assignments.items():  # type: ignore
+            if variable.startswith(f"{self.name}.") or variable == "input_output":
                 lines.append(f"{variable} = {width}")
 
         def sorter(line: str) -> int:
@@ -628,6 +754,8 @@ class Graph:
     def measure_bounds(
         self,
         inputset: Union[Iterable[Any], Iterable[Tuple[Any, ...]]],
+        batch_size: int = 1,
+        workers: int = 1,
     ) -> Dict[Node, Dict[str, Union[np.integer, np.floating]]]:
         """
         Evaluate the `Graph` using an inputset and measure bounds.
@@ -652,49 +780,257 @@ class Graph:
             def g(x, y):
                 ...
 
+        samples are evaluated in batches of `batch_size`, elementwise nodes are evaluated once
+        per batch on samples stacked along a leading axis, and other nodes are evaluated sample by
+        sample, which results in the same bounds as evaluating the samples one by one
+
+        if `workers` is greater than one, the inputset is split into chunks, which are measured
+        in forked worker processes, and the bounds of the chunks are merged in order, which results
+        in the same bounds as measuring in the current process (processes are only forked on Linux,
+        and only if no other thread is running, as forking a process with running threads
+        can deadlock, otherwise bounds are measured in the current process with a warning)
+
         Args:
             inputset (Union[Iterable[Any], Iterable[Tuple[Any, ...]]]):
                 inputset to use
 
+            batch_size (int, default = 1):
+                maximum number of samples to evaluate at once
+
+            workers (int, default = 1):
+                number of processes to measure bounds with
+                (ignored if processes cannot be forked safely)
+
         Returns:
             Dict[Node, Dict[str, Union[np.integer, np.floating]]]:
                 bounds of each node in the `Graph`
         """
 
-        bounds = {}
+        if batch_size < 1:
+            message = f"Expected batch_size to be positive but it's {batch_size}"
+            raise ValueError(message)
+        if workers < 1:
+            message = f"Expected workers to be positive but it's {workers}"
+            raise ValueError(message)
+
+        bounds: Dict[Node, Dict[str, Union[np.integer, np.floating]]] = {}
+
+        if workers > 1 and _can_fork_bounds_measurement_workers(workers):
+            self._measure_bounds_in_processes(bounds, inputset, batch_size, workers)
+        else:
+            self._measure_bounds_in_this_process(bounds, inputset, batch_size)
+
+        return bounds
+
+    def _measure_bounds_in_this_process(
+        self,
+        bounds: Dict[Node, Dict[str, Union[np.integer, np.floating]]],
+        inputset: Union[Iterable[Any], Iterable[Tuple[Any, ...]]],
+        batch_size: int,
+        first_index: int = 0,
+    ):
+        """
+        Measure bounds of the `Graph` using an inputset in the current process.
+
+        Args:
+            bounds (Dict[Node, Dict[str, Union[np.integer, np.floating]]]):
+                bounds to update
+
+            inputset (Union[Iterable[Any], Iterable[Tuple[Any, ...]]]):
+                inputset to use
+
+            batch_size (int):
+                maximum number of samples to evaluate at once
+
+            first_index (int, default = 0):
+                index of the first sample of `inputset` in the whole inputset, for error messages
+        """
 
         inputset_iterator = iter(inputset)
 
-        sample = next(inputset_iterator)
-        if not isinstance(sample, tuple):
-            sample = (sample,)
+        index = first_index
+        while True:
+            # errors of the inputset itself (e.g., malformed samples) are not wrapped
+            batch = [
+                sample if isinstance(sample, tuple) else (sample,)
+                for sample in itertools.islice(inputset_iterator, batch_size)
+            ]
+            if len(batch) == 0:
+                break
+
+            try:
+                evaluation = self._evaluate_batch(batch) if len(batch) > 1 else None
+                if evaluation is not None:
+                    for node, value in evaluation.items():
+                        _update_bounds(bounds, node, value.min(), value.max())
+                    index += len(batch)
+                    continue
+
+                for sample in batch:
+                    for node, value in self.evaluate(*sample).items():
+                        _update_bounds(bounds, node, value.min(), value.max())
+                    index += 1
+
+            except Exception as error:
+                message = f"Bound measurement using inputset[{index}] failed"
+                raise RuntimeError(message) from error
+
+    def _measure_bounds_in_processes(
+        self,
+        bounds: Dict[Node, Dict[str, Union[np.integer, np.floating]]],
+        inputset: Union[Iterable[Any], Iterable[Tuple[Any, ...]]],
+        batch_size: int,
+        workers: int,
+    ):
+        """
+        Measure bounds of the `Graph` using an inputset in forked worker processes.
+
+        Args:
+            bounds (Dict[Node, Dict[str, Union[np.integer, np.floating]]]):
+                bounds to update
+
+            inputset (Union[Iterable[Any], Iterable[Tuple[Any, ...]]]):
+                inputset to use
 
-        index = 0
+            batch_size (int):
+                maximum number of samples to evaluate at once
+
+            workers (int):
+                number of worker processes
+        """
+
+        chunk_size = batch_size * BATCHES_PER_BOUNDS_MEASUREMENT_TASK
+        nodes = self.execution_plan.nodes
+
+        # workers are forked so they have the graph without it being pickled
+        # which is important as graphs can have arbitrary python functions in them
+        _BOUNDS_MEASUREMENT_CONTEXT["graph"] = self
+        _BOUNDS_MEASUREMENT_CONTEXT["batch_size"] = batch_size
         try:
-            evaluation = self.evaluate(*sample)
-            for node, value in evaluation.items():
-                bounds[node] = {
-                    "min": value.min(),
-                    "max": value.max(),
-                }
-
-            for sample in inputset_iterator:
-                index += 1
-                if not isinstance(sample, tuple):
-                    sample = (sample,)
-
-                evaluation = self.evaluate(*sample)
-                for node, value in evaluation.items():
-                    bounds[node] = {
-                        "min": np.minimum(bounds[node]["min"], value.min()),
-                        "max": np.maximum(bounds[node]["max"], value.max()),
-                    }
-
-        except Exception as error:
-            message = f"Bound measurement using inputset[{index}] failed"
-            raise RuntimeError(message) from error
+            with multiprocessing.get_context("fork").Pool(workers) as pool:
+                # only a few chunks are in flight at any time
+                # so the inputset is not loaded into memory at once when it's streamed
+                in_flight: Deque[Tuple[List[Any], Any]] = deque()
+                index = 0
+
+                def merge_oldest_chunk():
+                    nonlocal index
+
+                    chunk, task = in_flight.popleft()
+                    chunk_bounds = task.get()
+
+                    if chunk_bounds is None:
+                        # measure the chunk again in this process to raise the actual error
+                        self._measure_bounds_in_this_process(bounds, chunk, batch_size, index)
+                    else:
+                        for node, (minimum, maximum) in zip(nodes, chunk_bounds):
+                            _update_bounds(bounds, node, minimum, maximum)
+
+                    index += len(chunk)
+
+                inputset_iterator = iter(inputset)
+                while True:
+                    chunk = list(itertools.islice(inputset_iterator, chunk_size))
+                    if len(chunk) == 0:
+                        break
+
+                    in_flight.append((chunk, pool.apply_async(_measure_bounds_of_chunk, (chunk,))))
+                    if len(in_flight) >= 2 * workers:
+                        merge_oldest_chunk()
+
+                while len(in_flight) > 0:
+                    merge_oldest_chunk()
+        finally:
+            _BOUNDS_MEASUREMENT_CONTEXT.clear()
+
+    def _evaluate_batch(self, samples: List[Tuple[Any, ...]]) -> Optional[Dict[Node, Any]]:
+        """
+        Evaluate the `Graph` on many samples at once.
 
-        return bounds
+        Args:
+            samples (List[Tuple[Any, ...]]):
+                samples to evaluate
+
+        Returns:
+            Optional[Dict[Node, Any]]:
+                values of nodes stacked along a leading axis if they depend on the inputs,
+                values of nodes as is otherwise,
+                or None if the samples cannot be evaluated together
+                (e.g., samples have different dtypes, evaluation of a sample fails)
+        """
+
+        try:
+            args = {
+                node: _stack([node(sample[index]) for sample in samples])
+                for index, node in self.input_nodes.items()
+            }
+            values, _ = self._evaluate_stacked(len(samples), args)
+        except Exception:  # pylint: disable=broad-except
+            return None
+
+        return values
+
+    def _evaluate_stacked(
+        self,
+        size: int,
+        args: Dict[Node, np.ndarray],
+    ) -> Tuple[Dict[Node, Any], Set[Node]]:
+        """
+        Evaluate the `Graph` on inputs stacked along a leading axis.
+
+        Args:
+            size (int):
+                number of stacked samples
+
+            args (Dict[Node, np.ndarray]):
+                stacked values of input nodes
+
+        Returns:
+            Tuple[Dict[Node, Any], Set[Node]]:
+                values of nodes and the set of nodes whose values are stacked
+        """
+
+        values: Dict[Node, Any] = {}
+        stacked: Set[Node] = set()
+
+        plan = self.execution_plan
+        for position, node in enumerate(plan.nodes):
+            if node.operation == Operation.Input:
+                values[node] = args[node]
+                stacked.add(node)
+                continue
+
+            preds = [plan.nodes[pred] for pred in plan.preds[position]]
+            copies = plan.copies[position]
+
+            if not any(pred in stacked for pred in preds):
+                values[node] = node(
+                    *[deepcopy(values[pred]) if copies else values[pred] for pred in preds]
+                )
+                continue
+
+            def pred_results_of_sample(
+                index: int,
+                preds: List[Node] = preds,
+                copies: bool = copies,
+            ) -> List[Any]:
+                pred_results = [
+                    values[pred][index] if pred in stacked else values[pred] for pred in preds
+                ]
+                return [deepcopy(result) for result in pred_results] if copies else pred_results
+
+            result = node.evaluate_stacked(
+                size,
+                [values[pred] for pred in preds],
+                [pred in stacked for pred in preds],
+            )
+            if result is None:
+                result = _stack([node(*pred_results_of_sample(index)) for index in range(size)])
+
+            values[node] = result
+            stacked.add(node)
+
+        return values, stacked
 
     def update_with_bounds(self, bounds: Dict[Node, Dict[str, Union[np.integer, np.floating]]]):
         """
@@ -1058,3 +1394,134 @@ class MultiGraphProcessor(GraphProcessor):
         Process a single graph.
         """
         return self.apply_many({graph.name: graph})  # pragma: no cover
+
+
+def _stack(values: List[Any]) -> np.ndarray:
+    """
+    Stack values of samples along a leading axis.
+
+    Args:
+        values (List[Any]):
+            values to stack
+
+    Returns:
+        np.ndarray:
+            stacked values
+
+    Raises:
+        ValueError:
+            if values cannot be stacked without changing their shape or their dtype
+    """
+
+    if not all(isinstance(value, (np.generic, np.ndarray)) for value in values):
+        message = "Only numpy values can be stacked"
+        raise ValueError(message)
+
+    if len({value.dtype for value in values}) != 1:
+        message = "Values with different dtypes cannot be stacked"
+        raise ValueError(message)
+
+    return np.stack(values)
+
+
+def _update_bounds(
+    bounds: Dict[Node, Dict[str, Union[np.integer, np.floating]]],
+    node: Node,
+    minimum: Union[np.integer, np.floating],
+    maximum: Union[np.integer, np.floating],
+):
+    """
+    Update bounds of a node with newly measured minimum and maximum values.
+
+    Args:
+        bounds (Dict[Node, Dict[str, Union[np.integer, np.floating]]]):
+            bounds to update
+
+        node (Node):
+            node whose bounds are measured
+
+        minimum (Union[np.integer, np.floating]):
+            measured minimum value of the node
+
+        maximum (Union[np.integer, np.floating]):
+            measured maximum value of the node
+    """
+
+    if node not in bounds:
+        bounds[node] = {
+            "min": minimum,
+            "max": maximum,
+        }
+    else:
+        bounds[node] = {
+            "min": np.minimum(bounds[node]["min"], minimum),
+            "max": np.maximum(bounds[node]["max"], maximum),
+        }
+
+
+def _can_fork_bounds_measurement_workers(workers: int) -> bool:
+    """
+    Determine whether bounds measurement worker processes can be forked safely.
+
+    Forking is only safe on Linux (e.g., macOS frameworks are not fork-safe), and only if no other
+    thread is running, as locks held by other threads (e.g., of thread pools of clients or of the
+    compiler) would stay locked forever in the forked processes.
+
+    Args:
+        workers (int):
+            number of worker processes which are requested
+
+    Returns:
+        bool:
+            whether worker processes can be forked
+    """
+
+    if not sys.platform.startswith("linux"):  # pragma: no cover
+        return False
+
+    if threading.active_count() > 1:
+        message = (
+            f"Bounds are measured in the current process instead of {workers} worker processes "
+            f"as forking a process with {threading.active_count() - 1} other running thread(s) "
+            f"can deadlock"
+        )
+        warnings.warn(message, RuntimeWarning, stacklevel=3)
+        return False
+
+    return True
+
+
+# graph and batch size to use in bounds measurement worker processes
+_BOUNDS_MEASUREMENT_CONTEXT: Dict[str, Any] = {}
+
+
+def _measure_bounds_of_chunk(
+    chunk: List[Any],
+) -> Optional[List[Tuple[Union[np.integer, np.floating], Union[np.integer, np.floating]]]]:
+    """
+    Measure bounds of the graph of the bounds measurement context using a chunk of the inputset.
+
+    Args:
+        chunk (List[Any]):
+            chunk of the inputset
+
+    Returns:
+        Optional[List[Tuple[Union[np.integer, np.floating], Union[np.integer, np.floating]]]]:
+            minimum and maximum values of the nodes in the order of the execution plan
+            or None if bounds measurement failed
+    """
+
+    graph: Graph = _BOUNDS_MEASUREMENT_CONTEXT["graph"]
+    batch_size: int = _BOUNDS_MEASUREMENT_CONTEXT["batch_size"]
+
+    bounds: Dict[Node, Dict[str, Union[np.integer, np.floating]]] = {}
+    try:
+        graph._measure_bounds_in_this_process(  # pylint: disable=protected-access
+            bounds,
+            chunk,
+            batch_size,
+        )
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+    return [(bounds[node]["min"], bounds[node]["max"]) for node in graph.execution_plan.nodes]
@@ -6,10 +6,9 @@ import os
 import time
 import traceback
 from copy import deepcopy
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
-import z3
 
 from ..internal.utils import assert_that
 from ..values import ValueDescription
@@ -17,11 +16,15 @@ from .evaluator import ConstantEvaluator, GenericEvaluator, GenericTupleEvaluato
 from .operation import Operation
 from .utils import (
     KWARGS_IGNORED_IN_FORMATTING,
+    NODES_THAT_DONT_MUTATE_THEIR_INPUTS,
     NODES_THAT_HAVE_TLU_WHEN_ALL_INPUTS_ARE_ENCRYPTED,
     format_constant,
     format_indexing_element,
 )
 
+if TYPE_CHECKING:
+    from ..mlir.bit_width_solver import BitWidthConstraint  # pragma: no cover
+
 
 class Node:
     """
@@ -41,7 +44,7 @@ class Node:
     tag: str
     created_at: float
 
-    bit_width_constraints: List[z3.Bool]
+    bit_width_constraints: List["BitWidthConstraint"]
 
     @staticmethod
     def constant(constant: Any) -> "Node":
@@ -277,6 +280,84 @@ class Node:
 
         return result
 
+    def evaluate_stacked(
+        self,
+        size: int,
+        args: List[Any],
+        stacked: List[bool],
+    ) -> Optional[np.ndarray]:
+        """
+        Evaluate the `Node` on many samples at once.
+
+        Stacked arguments have one value per sample along their leading axis,
+        other arguments are shared by all samples.
+
+        Args:
+            size (int):
+                number of samples
+
+            args (List[Any]):
+                arguments of the node
+
+            stacked (List[bool]):
+                whether each argument is stacked
+
+        Returns:
+            Optional[np.ndarray]:
+                results of the samples stacked along a leading axis
+                or None if the node cannot be evaluated this way
+        """
+
+        if not self.is_elementwise or len(args) != len(self.inputs):
+            return None
+
+        if self.properties["name"] == "subgraph":
+            if not all(stacked):
+                return None
+
+            subgraph = self.properties["kwargs"]["subgraph"]
+            terminal_node = self.properties["kwargs"]["terminal_node"]
+
+            subgraph_values, subgraph_stacked = subgraph._evaluate_stacked(
+                size,
+                {subgraph.input_nodes[index]: arg for index, arg in enumerate(args)},
+            )
+            if terminal_node not in subgraph_stacked:
+                return None
+
+            result = subgraph_values[terminal_node]
+        else:
+            # stacked operands are expanded to the dimensions of the output
+            # so that the leading axis is not broadcasted with an actual axis of another operand
+            output_dimensions = len(self.output.shape)
+
+            operands = []
+            for arg, is_stacked, input_ in zip(args, stacked, self.inputs):
+                if is_stacked:
+                    padding = (1,) * (output_dimensions - len(input_.shape))
+                    arg = np.reshape(arg, (size, *padding, *input_.shape))
+                operands.append(arg)
+
+            result = self.evaluator(*operands)
+
+        if not isinstance(result, np.ndarray) or result.shape != (size, *self.output.shape):
+            return None
+
+        # dtypes might be promoted differently when operating on arrays instead of scalars
+        # so the result is used only if it's the same as evaluating the first and the last samples
+        for index in sorted({0, size - 1}):
+            expected = self(
+                *[arg[index] if is_stacked else arg for arg, is_stacked in zip(args, stacked)]
+            )
+            if result.dtype != expected.dtype or not np.array_equal(
+                result[index],
+                expected,
+                equal_nan=np.issubdtype(result.dtype, np.floating),
+            ):
+                return None
+
+        return result
+
     def format(self, predecessors: List[str], maximum_constant_length: int = 45) -> str:
         """
         Get the textual representation of the `Node` (dependent to preds).
@@ -514,5 +595,69 @@ class Node:
             "zeros",
         ]
 
+    @property
+    def is_elementwise(self) -> bool:
+        """
+        Get whether the node is computed element by element following numpy broadcasting rules.
+
+        Such nodes can be evaluated on many samples at once, stacked along a leading axis.
+
+        Returns:
+            bool:
+                True if the node is computed element by element, False otherwise
+        """
+
+        if self.operation != Operation.Generic or len(self.properties["args"]) != 0:
+            return False
+
+        name = self.properties["name"]
+        kwargs = self.properties["kwargs"]
+
+        if name == "subgraph":
+            subgraph = kwargs["subgraph"]
+            return all(
+                node.is_elementwise
+                for node in subgraph.graph.nodes
+                if node.operation == Operation.Generic
+            )
+
+        if name == "astype":
+            return set(kwargs) == {"dtype"}
+
+        # functions of extensions (e.g., `fhe.univariate`) are not necessarily computed
+        # element by element, and a wrong result cannot be detected without evaluating
+        # all samples one by one, so only ufuncs are considered to be elementwise
+        return (
+            isinstance(self.evaluator, GenericEvaluator)
+            and isinstance(self.evaluator.operation, np.ufunc)
+            and len(kwargs) == 0
+        )
+
+    @property
+    def may_mutate_inputs(self) -> bool:
+        """
+        Get whether evaluating the node might modify its arguments in place.
+
+        Returns:
+            bool:
+                False if the node is known to leave its arguments untouched, True otherwise
+        """
+
+        if self.operation != Operation.Generic:
+            return False
+
+        if self.properties["name"] in NODES_THAT_DONT_MUTATE_THEIR_INPUTS:
+            return False
+
+        # numpy functions (e.g., np.add, np.reshape) never modify their arguments
+        # unless they are explicitly asked to (e.g., with `out` keyword argument)
+        operation = getattr(self.evaluator, "operation", None)
+        return not (
+            "out" not in self.properties["kwargs"]
+            and (
+                isinstance(operation, np.ufunc) or getattr(operation, "__module__", None) == "numpy"
+            )
+        )
+
     def __lt__(self, other) -> bool:
         return self.created_at < other.created_at
@@ -60,6 +60,30 @@ NODES_THAT_HAVE_TLU_WHEN_ALL_INPUTS_ARE_ENCRYPTED = [
     "truncate_bit_pattern",
 ]
 
+NODES_THAT_DONT_MUTATE_THEIR_INPUTS: Set[str] = {
+    "array",
+    "astype",
+    "conv1d",
+    "conv2d",
+    "conv3d",
+    "dynamic_tlu",
+    "extract_bit_pattern",
+    "identity",
+    "index_dynamic",
+    "index_static",
+    "maxpool",
+    "ones",
+    "reinterpret",
+    "relu",
+    "round_bit_pattern",
+    "subgraph",
+    "tfhers_from_native",
+    "tfhers_to_native",
+    "tlu",
+    "truncate_bit_pattern",
+    "zeros",
+}
+
 
 def format_constant(constant: Any, maximum_length: int = 45, keep_newlines: bool = False) -> str:
     """
@@ -0,0 +1,40 @@
+"""
+Declaration of `VersionedMultiDiGraph` class.
+"""
+
+import functools
+from typing import Callable
+
+import networkx as nx
+
+
+def _changes_structure(method: Callable) -> Callable:
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class VersionedMultiDiGraph(nx.MultiDiGraph):
+    """
+    VersionedMultiDiGraph class, to know when data derived from the structure of a graph is stale.
+
+    `version` is incremented each time nodes or edges are added or removed.
+    """
+
+    version: int = 0
+
+    add_node = _changes_structure(nx.MultiDiGraph.add_node)
+    add_nodes_from = _changes_structure(nx.MultiDiGraph.add_nodes_from)
+    remove_node = _changes_structure(nx.MultiDiGraph.remove_node)
+    remove_nodes_from = _changes_structure(nx.MultiDiGraph.remove_nodes_from)
+
+    add_edge = _changes_structure(nx.MultiDiGraph.add_edge)
+    add_edges_from = _changes_structure(nx.MultiDiGraph.add_edges_from)
+    remove_edge = _changes_structure(nx.MultiDiGraph.remove_edge)
+    remove_edges_from = _changes_structure(nx.MultiDiGraph.remove_edges_from)
+
+    clear = _changes_structure(nx.MultiDiGraph.clear)
+    clear_edges = _changes_structure(nx.MultiDiGraph.clear_edges)
@@ -143,31 +143,27 @@ class TFHERSIntegerType(Integer):
         Returns:
             np.ndarray: encoded scalar or tensor
         """
-        bit_width = self.bit_width
-        msg_width = self.msg_width
-        if isinstance(value, (int, np.integer)):
-            if self.is_signed and value < 0:
-                value_bin = bin(2**bit_width + value)[2:].zfill(bit_width)
-            else:
-                value_bin = bin(value)[2:].zfill(bit_width)
-            # lsb first
-            return np.array(
-                [int(value_bin[i : i + msg_width], 2) for i in range(0, bit_width, msg_width)][::-1]
-            )
-
         if isinstance(value, list):  # pragma: no cover
             try:
                 value = np.array(value)
             except Exception:  # pylint: disable=broad-except
                 pass  # pragma: no cover
 
-        if isinstance(value, np.ndarray):
-            return np.array([self.encode(int(v)) for v in value.flatten()]).reshape(
-                value.shape + (bit_width // msg_width,)
-            )
+        if not isinstance(value, (int, np.integer, np.ndarray)):
+            msg = f"can only encode int, np.integer, list or ndarray, but got {type(value)}"
+            raise TypeError(msg)
 
-        msg = f"can only encode int, np.integer, list or ndarray, but got {type(value)}"
-        raise TypeError(msg)
+        try:
+            # two's complement representation of negative values is kept when shifting
+            values = np.asarray(value).astype(np.int64)
+        except OverflowError:  # pragma: no cover
+            values = np.asarray(value).astype(object)
+
+        # lsb first
+        shifts = np.arange(self.bit_width // self.msg_width) * self.msg_width
+        mask = (1 << self.msg_width) - 1
+
+        return ((values[..., np.newaxis] >> shifts) & mask).astype(np.int64)
 
     def decode(self, value: Union[list, np.ndarray]) -> Union[int, np.ndarray]:
         """Decode a tfhers-encoded integer (scalar or tensor).
@@ -202,15 +198,20 @@ class TFHERSIntegerType(Integer):
             )
             raise ValueError(msg)
 
+        # decoded values might not fit in 64-bits when the type is large
+        dtype = np.int64 if bit_width < 63 else object
+
+        # lsb first
+        shifts = np.arange(expected_ct_shape).astype(dtype) * msg_width
+        decoded = (value.astype(dtype) << shifts).sum(axis=-1)
+
+        if self.is_signed:
+            decoded = np.where(decoded >= 2 ** (bit_width - 1), decoded - 2**bit_width, decoded)
+
         if len(value.shape) == 1:
-            # lsb first
-            decoded = sum(int(v) << (i * msg_width) for i, v in enumerate(value))
-            if self.is_signed and decoded >= 2 ** (bit_width - 1):
-                decoded = decoded - 2**bit_width
-            return decoded
-
-        cts = value.reshape((-1, expected_ct_shape))
-        return np.array([self.decode(ct) for ct in cts]).reshape(value.shape[:-1])
+            return int(decoded)
+
+        return decoded if dtype is np.int64 else np.array(decoded.tolist())
 
 
 int8 = partial(TFHERSIntegerType, True, 8)
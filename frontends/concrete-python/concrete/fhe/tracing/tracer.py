@@ -4,18 +4,36 @@ Declaration of `Tracer` class.
 
 import inspect
 from copy import deepcopy
-from typing import Any, Callable, ClassVar, Dict, List, Optional, Set, Tuple, Type, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
-import networkx as nx
 import numpy as np
 from numpy.typing import DTypeLike
 
 from ..dtypes import BaseDataType, Float, Integer
-from ..internal.utils import assert_that
+from ..internal.utils import assert_that, lazy_import
 from ..representation import Graph, Node, Operation
 from ..representation.utils import format_indexing_element
 from ..values import ValueDescription
 
+if TYPE_CHECKING:
+    import networkx as nx  # pragma: no cover
+else:
+    # networkx is only loaded when a graph is created
+    nx = lazy_import("networkx")
+
 
 class Tracer:
     """
@@ -46,6 +46,9 @@ def test_artifacts_export(helpers):
         assert (tmpdir / "mlir.txt").exists()
         assert (tmpdir / "client_parameters.json").exists()
 
+        assert (tmpdir / "compilation_profile.json").exists()
+        assert (tmpdir / "compilation_trace.json").exists()
+
         artifacts.export()
 
         assert (tmpdir / "environment.txt").exists()
@@ -61,3 +64,6 @@ def test_artifacts_export(helpers):
 
         assert (tmpdir / "mlir.txt").exists()
         assert (tmpdir / "client_parameters.json").exists()
+
+        assert (tmpdir / "compilation_profile.json").exists()
+        assert (tmpdir / "compilation_trace.json").exists()
@@ -2,7 +2,11 @@
 Tests of `Circuit` class.
 """
 
+import json
+import os
 import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
@@ -12,6 +16,7 @@ from mlir.ir import Module as MlirModule
 
 from concrete import fhe
 from concrete.fhe import Client, ClientSpecs, EvaluationKeys, LookupTable, Server, Value
+from concrete.fhe.compilation.server import _extract
 
 
 def test_circuit_statistics(helpers):
@@ -33,6 +38,58 @@ def test_circuit_statistics(helpers):
     assert "size_of_inputs" in stat  # from circuit
 
 
+def test_circuit_compilation_profile(helpers):
+    """
+    Test `compilation_profile` property and `export_compilation_profile` method of `Circuit` class.
+    """
+
+    configuration = helpers.configuration()
+
+    @fhe.compiler({"x": "encrypted"})
+    def f(x):
+        return fhe.univariate(lambda x: x // 2)(x + 10)
+
+    inputset = range(100)
+    circuit = f.compile(inputset, configuration.fork(fhe_execution=True))
+
+    profile = circuit.compilation_profile
+    assert set(profile["stages"]).issuperset(
+        {
+            "tracing",
+            "fusing",
+            "bounds-measurement",
+            "processing",
+            "processing.CheckIntegerOnly",
+            "processing.AssignBitWidths",
+            "processing.ProcessRounding",
+            "mlir-generation",
+            "compilation",
+        }
+    )
+    assert set(profile["functions"]["f"]).issuperset(
+        {
+            "tracing",
+            "fusing",
+            "bounds-measurement",
+            "processing.CheckIntegerOnly",
+            "mlir-generation",
+        }
+    )
+    assert profile["duration_ms"] >= profile["stages"]["compilation"]["duration_ms"]
+    assert profile["peak_memory_mb"] > 0
+
+    with tempfile.TemporaryDirectory() as path:
+        trace_path = Path(path) / "trace.json"
+        circuit.export_compilation_profile(trace_path)
+
+        with open(trace_path, encoding="utf-8") as file:
+            trace = json.load(file)
+
+    names = [event["name"] for event in trace["traceEvents"]]
+    assert names.index("tracing") < names.index("mlir-generation") < names.index("compilation")
+    assert all(event["ph"] == "X" for event in trace["traceEvents"])
+
+
 def test_circuit_str(helpers):
     """
     Test `__str__` method of `Circuit` class.
@@ -355,6 +412,127 @@ def test_client_server_api_run_with_clear(helpers):
     assert str(excinfo.value) == "Tried to transform plaintext value with incompatible shape."
 
 
+def test_client_specs_input_specs(helpers):
+    """
+    Test input specs of client specs.
+    """
+
+    configuration = helpers.configuration()
+
+    @fhe.compiler({"x": "encrypted", "y": "clear"})
+    def function(x, y):
+        return x + y
+
+    inputset = fhe.inputset(fhe.int3, fhe.tensor[fhe.uint3, 2, 2])  # type: ignore
+    circuit = function.compile(inputset, configuration.fork())
+
+    client_specs = circuit.client.specs
+    x_spec, y_spec = client_specs.input_specs("function")
+
+    assert x_spec.position == 0
+    assert x_spec.is_encrypted
+    assert x_spec.shape == ()
+    assert x_spec.min == -(2 ** (x_spec.width - 1))
+    assert x_spec.max == (2 ** (x_spec.width - 1)) - 1
+
+    assert y_spec.position == 1
+    assert not y_spec.is_encrypted
+    assert y_spec.shape == (2, 2)
+    assert y_spec.min == -(y_spec.max // 2) - 1
+
+    assert client_specs.input_specs("function") is client_specs.input_specs("function")
+
+    with pytest.raises(ValueError) as excinfo:
+        client_specs.input_specs("foo")
+
+    assert str(excinfo.value) == "Function `foo` is not in the module"
+
+
+@pytest.mark.parametrize("max_workers", [None, 4])
+def test_client_batch_api(max_workers, helpers):
+    """
+    Test batched encryption and decryption of client.
+    """
+
+    configuration = helpers.configuration()
+
+    @fhe.compiler({"x": "encrypted"})
+    def single(x):
+        return x + 1
+
+    @fhe.compiler({"x": "encrypted", "y": "encrypted"})
+    def double(x, y):
+        return x * y
+
+    single_circuit = single.compile(fhe.inputset(fhe.tensor[fhe.uint3, 2]), configuration.fork())
+    double_circuit = double.compile(fhe.inputset(fhe.uint3, fhe.uint3), configuration.fork())
+
+    samples = np.random.randint(0, 2**3, size=(10, 2))
+
+    client = single_circuit.client
+    server = single_circuit.server
+
+    encrypted = client.encrypt_batch(samples, max_workers=max_workers)
+    ran = (server.run(arg, evaluation_keys=client.evaluation_keys) for arg in encrypted)
+    decrypted = list(client.decrypt_batch(ran, max_workers=max_workers))
+
+    assert len(decrypted) == len(samples)
+    for sample, result in zip(samples, decrypted):
+        assert np.array_equal(result, sample + 1)
+
+    client = double_circuit.client
+    server = double_circuit.server
+
+    encrypted = client.encrypt_batch(
+        (tuple(sample) for sample in samples),
+        function_name="double",
+        max_workers=max_workers,
+    )
+    ran = (server.run(*args, evaluation_keys=client.evaluation_keys) for args in encrypted)
+    decrypted = list(client.decrypt_batch(ran, function_name="double", max_workers=max_workers))
+
+    assert decrypted == [x * y for x, y in samples]
+
+    with pytest.raises(ValueError) as excinfo:
+        list(client.encrypt_batch([(1, 2, 3)], max_workers=max_workers))
+
+    assert str(excinfo.value) == "Expected 2 inputs but got 3"
+
+
+def test_server_run_from_multiple_threads(helpers):
+    """
+    Test running the same server from multiple threads.
+    """
+
+    configuration = helpers.configuration()
+
+    @fhe.compiler({"x": "encrypted", "y": "clear"})
+    def function(x, y):
+        return x + y
+
+    inputset = fhe.inputset(fhe.uint4, fhe.uint4)
+    circuit = function.compile(inputset, configuration.fork())
+
+    client = circuit.client
+    server = circuit.server
+    evaluation_keys = client.evaluation_keys
+
+    def run(sample):
+        x, y = sample
+        encrypted_x, _ = client.encrypt(x, None)
+        return client.decrypt(server.run(encrypted_x, y, evaluation_keys=evaluation_keys))
+
+    samples = [(x, y) for x in range(0, 16, 3) for y in range(0, 16, 5)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(run, samples))
+
+    assert results == [x + y for x, y in samples]
+
+    # pylint: disable=protected-access
+    assert server._get_server_circuit("function") is server._get_server_circuit("function")
+    # pylint: enable=protected-access
+
+
 def test_client_server_api_crt(helpers):
     """
     Test client/server API on a CRT circuit.
@@ -406,6 +584,172 @@ def test_client_server_api_crt(helpers):
             assert np.array_equal(output, [100**2, 150**2, 10**2])
 
 
+def test_client_server_api_layouts(helpers):
+    """
+    Test saving and loading servers as directories and uncompressed zip archives.
+    """
+
+    configuration = helpers.configuration()
+
+    @fhe.compiler({"x": "encrypted"})
+    def function(x):
+        return x + 42
+
+    inputset = [np.random.randint(0, 10, size=(3,)) for _ in range(10)]
+    circuit = function.compile(inputset, configuration.fork())
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir_path = Path(tmp_dir)
+
+        directory_path = tmp_dir_path / "server"
+        circuit.server.save(directory_path, layout="directory")
+        assert (directory_path / "client.specs.json").exists()
+
+        server_from_directory = Server.load(directory_path)
+        assert Path(server_from_directory._library.get_output_dir_path()) == directory_path
+
+        zip_path = tmp_dir_path / "server.zip"
+        circuit.server.save(zip_path)
+        with zipfile.ZipFile(zip_path) as archive:
+            assert all(entry.compress_type == zipfile.ZIP_STORED for entry in archive.infolist())
+
+        server_from_zip = Server.load(zip_path)
+        server_from_zip_again = Server.load(zip_path)
+        assert (
+            server_from_zip._library.get_output_dir_path()
+            == server_from_zip_again._library.get_output_dir_path()
+        )
+
+        for server in [server_from_directory, server_from_zip]:
+            arg = circuit.client.encrypt([3, 8, 1])
+            result = server.run(arg, evaluation_keys=circuit.client.evaluation_keys)
+            assert np.array_equal(circuit.client.decrypt(result), [45, 50, 43])
+
+        # extracted directories are removed once they are not used anymore
+        extracted_directory = Path(server_from_zip._library.get_output_dir_path())
+
+        server_from_zip.cleanup()
+        assert extracted_directory.exists()
+
+        server_from_zip_again.cleanup()
+        assert not extracted_directory.exists()
+
+        with pytest.raises(ValueError) as excinfo:
+            circuit.server.save(zip_path, layout="tar")
+
+        assert str(excinfo.value) == "Expected layout to be 'zip' or 'directory' but it's 'tar'"
+
+
+def test_server_extraction(tmp_path, monkeypatch):
+    """
+    Test extracting servers saved as zip archives.
+    """
+
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+    zip_path = tmp_path / "server.zip"
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_STORED) as archive:
+        archive.writestr("client.specs.json", "{}")
+        archive.writestr("lib/sharedlib.so", "library")
+
+    location = tmp_path / f"concrete-python-servers-{os.getuid()}"
+
+    directory, lease = _extract(zip_path)
+    assert directory.parent == location
+    assert location.stat().st_mode & 0o777 == 0o700
+    assert (directory / "lib" / "sharedlib.so").read_text() == "library"
+
+    # extracted directories are shared
+    directory_again, lease_again = _extract(zip_path)
+    assert directory_again == directory
+
+    # they are complete once they have a marker
+    assert (directory / ".extracted").exists()
+
+    # but they are not replaced while other processes use them, even if they are incomplete
+    lease_again.close()
+    (directory / ".extracted").unlink()
+
+    private_directory, private_lease = _extract(zip_path)
+    assert private_directory.parent != location
+    assert private_lease is None
+    assert (private_directory / "lib" / "sharedlib.so").read_text() == "library"
+    assert directory.exists()
+
+    # and they are replaced if they don't match the archive once they are not used
+    lease.close()
+    (directory / "lib" / "sharedlib.so").write_text("tampered")
+
+    directory, lease = _extract(zip_path)
+    assert directory.parent == location
+    assert (directory / "lib" / "sharedlib.so").read_text() == "library"
+    lease.close()
+
+    # directories left by interrupted processes are removed
+    (location / ".evicted-interrupted").mkdir()
+    (location / ".staging-interrupted").mkdir()
+    (location / ".staging-abandoned").mkdir()
+    os.utime(location / ".staging-abandoned", (0, 0))
+
+    directory, lease = _extract(zip_path)
+    lease.close()
+    assert sorted(path.name for path in location.iterdir() if path.name.startswith(".")) == [
+        ".staging-interrupted"
+    ]
+
+    # locations which can be modified by other users are not used
+    location.chmod(0o777)
+
+    directory, lease = _extract(zip_path)
+    assert directory.parent != location
+    assert lease is None
+    assert (directory / "lib" / "sharedlib.so").read_text() == "library"
+
+
+def test_client_server_api_buffers(helpers):
+    """
+    Test serializing values into and deserializing values from buffers.
+    """
+
+    configuration = helpers.configuration()
+
+    @fhe.compiler({"x": "encrypted"})
+    def function(x):
+        return x + 42
+
+    inputset = [np.random.randint(0, 10, size=(3,)) for _ in range(10)]
+    circuit = function.compile(inputset, configuration.fork())
+
+    arg = circuit.encrypt([3, 8, 1])
+    serialized_arg = arg.serialize()
+    assert arg.serialized_size == len(serialized_arg)
+
+    buffer = bytearray(arg.serialized_size + 10)
+    assert arg.serialize_into(memoryview(buffer)[3:]) == arg.serialized_size
+    assert buffer[3 : 3 + arg.serialized_size] == serialized_arg
+
+    # buffers are read from their beginning, whether they are aligned or not
+    for deserialized_arg in [
+        Value.from_buffer(memoryview(buffer)[3:]),
+        Value.from_buffer(bytearray(serialized_arg)),
+        Value.deserialize(serialized_arg),
+    ]:
+        result = circuit.run(deserialized_arg)
+        assert np.array_equal(circuit.decrypt(result), [45, 50, 43])
+
+    with pytest.raises(RuntimeError):
+        arg.serialize_into(bytearray(arg.serialized_size - 1))
+
+    # buffers which are not contiguous are rejected instead of being accessed out of their bounds
+    reversed_buffer = memoryview(bytearray(arg.serialized_size))[::-1]
+    with pytest.raises(ValueError, match="Expected a contiguous buffer"):
+        arg.serialize_into(reversed_buffer)
+
+    strided_buffer = memoryview(bytearray(serialized_arg) * 2)[::2]
+    with pytest.raises(ValueError, match="Expected a contiguous buffer"):
+        Value.from_buffer(strided_buffer)
+
+
 def test_client_server_api_via_mlir(helpers):
     """
     Test client/server API.
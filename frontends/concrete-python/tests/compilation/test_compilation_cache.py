@@ -0,0 +1,122 @@
+"""
+Tests of `CompilationCache` class.
+"""
+
+import fcntl
+import os
+from pathlib import Path
+
+import numpy as np
+
+from concrete import fhe
+from concrete.fhe.compilation import CompositionClause, CompositionRule
+from concrete.fhe.compilation.compilation_cache import LOCK_FILE_NAME, CompilationCache
+from concrete.fhe.compilation.configuration import SecurityLevel
+
+
+def test_compilation_cache_hit(helpers, tmp_path):
+    """
+    Test compiling the same function twice with the compilation cache.
+    """
+
+    configuration = helpers.configuration().fork(compilation_cache_location=tmp_path)
+
+    def f(x):
+        return (x * 3) % 7
+
+    inputset = range(10)
+
+    circuit1 = fhe.Compiler(f, {"x": "encrypted"}).compile(inputset, configuration)
+    output_dir1 = Path(circuit1.server._library.get_output_dir_path())
+    assert output_dir1.parent == tmp_path
+
+    circuit2 = fhe.Compiler(f, {"x": "encrypted"}).compile(inputset, configuration)
+    output_dir2 = Path(circuit2.server._library.get_output_dir_path())
+    assert output_dir2 == output_dir1
+
+    assert [path.name for path in tmp_path.iterdir()] == [output_dir1.name]
+
+    for sample in [0, 5, 9]:
+        assert circuit2.encrypt_run_decrypt(sample) == f(sample)
+
+    circuit3 = fhe.Compiler(f, {"x": "encrypted"}).compile(range(100), configuration)
+    output_dir3 = Path(circuit3.server._library.get_output_dir_path())
+    assert output_dir3 != output_dir1
+    assert output_dir3.parent == tmp_path
+
+
+def test_compilation_cache_key(helpers):
+    """
+    Test keys of compilations.
+    """
+
+    configuration = helpers.configuration()
+    mlir = "module {}"
+    rules = [CompositionRule(CompositionClause("f", 0), CompositionClause("f", 0))]
+
+    key = CompilationCache.key(mlir, configuration, False, [])
+
+    assert key == CompilationCache.key(mlir, configuration.fork(), False, [])
+    assert key == CompilationCache.key(mlir, configuration.fork(show_progress=True), False, [])
+
+    assert key != CompilationCache.key("module { }", configuration, False, [])
+    assert key != CompilationCache.key(mlir, configuration, True, [])
+    assert key != CompilationCache.key(mlir, configuration, False, rules)
+    assert key != CompilationCache.key(mlir, configuration.fork(p_error=0.1), False, [])
+    assert key != CompilationCache.key(
+        mlir, configuration.fork(security_level=SecurityLevel.SECURITY_132_BITS), False, []
+    )
+
+
+def test_compilation_cache_eviction(tmp_path):
+    """
+    Test eviction of least recently used entries.
+    """
+
+    cache = CompilationCache(tmp_path, max_size=250)
+
+    for index, name in enumerate(["a", "b", "c", "d"]):
+        entry = tmp_path / name
+        entry.mkdir()
+        (entry / "data").write_bytes(np.zeros(100, dtype=np.uint8).tobytes())
+        os.utime(entry, (index, index))
+
+    # "a" is the least recently used entry, but it's kept explicitly
+    cache.evict(keep="a")
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["a", "d"]
+
+    cache.evict()
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["a", "d"]
+
+    cache.max_size = 150
+    cache.evict()
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["d"]
+
+
+def test_compilation_cache_eviction_of_used_entries(tmp_path):
+    """
+    Test eviction skips entries which are used, possibly by other processes.
+    """
+
+    cache = CompilationCache(tmp_path, max_size=150)
+
+    for index, name in enumerate(["a", "b"]):
+        entry = tmp_path / name
+        entry.mkdir()
+        (entry / "data").write_bytes(np.zeros(100, dtype=np.uint8).tobytes())
+        os.utime(entry, (index, index))
+
+    # servers using an entry hold a shared lock on it until their process exits
+    with open(tmp_path / "a" / LOCK_FILE_NAME, "a", encoding="utf-8") as lock:
+        fcntl.flock(lock, fcntl.LOCK_SH)
+
+        cache.evict()
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["a"]
+        assert (tmp_path / "a" / "data").exists()
+
+    cache.evict()
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["a"]
+
+    cache.max_size = 50
+    cache.evict()
+    assert sorted(path.name for path in tmp_path.iterdir()) == []
@@ -496,3 +496,62 @@ module {
         circuit3.mlir.strip(),
     )
     compiler.reset()
+
+
+def test_compiler_streamed_inputset(helpers):
+    """
+    Test tracing using inputsets given as iterators.
+    """
+
+    def f(x):
+        return x * 2
+
+    configuration = helpers.configuration()
+
+    # streamed samples are not kept by default
+    # ----------------------------------------
+
+    compiler = fhe.Compiler(f, {"x": "encrypted"})
+
+    graph = compiler.trace((x for x in range(10)), configuration)
+    assert graph.maximum_integer_bit_width() == 5
+    assert compiler._func_def.inputset == []
+
+    graph = compiler.trace((x for x in range(3)), configuration)
+    assert graph.maximum_integer_bit_width() == 3
+
+    # streamed samples are kept when requested
+    # ----------------------------------------
+
+    configuration = configuration.fork(retain_streamed_inputsets=True)
+    compiler = fhe.Compiler(f, {"x": "encrypted"})
+
+    graph = compiler.trace((x for x in range(10)), configuration)
+    assert graph.maximum_integer_bit_width() == 5
+    assert compiler._func_def.inputset == list(range(10))
+
+    graph = compiler.trace((x for x in range(3)), configuration)
+    assert graph.maximum_integer_bit_width() == 5
+
+    # malformed streamed samples are reported
+    # ---------------------------------------
+
+    compiler = fhe.Compiler(f, {"x": "encrypted"})
+
+    with pytest.raises(ValueError) as excinfo:
+        compiler.trace(iter([1, 2, (3, 4)]), helpers.configuration())
+
+    assert str(excinfo.value) == (
+        "Input #2 of your inputset is not well formed "
+        "(expected a single value got a tuple of 2 values)"
+    )
+
+    # empty streamed inputset is reported
+    # -----------------------------------
+
+    compiler = fhe.Compiler(f, {"x": "encrypted"})
+
+    with pytest.raises(RuntimeError) as excinfo:
+        compiler.trace(iter([]), helpers.configuration())
+
+    assert str(excinfo.value) == "Tracing function 'f' without an inputset is not supported"
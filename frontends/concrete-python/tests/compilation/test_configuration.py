@@ -200,6 +200,24 @@ FORK_NAME = "fork" if sys.version_info < (3, 10) else "Configuration.fork"
                 "(expected 'Optional[List[GraphProcessor]]', got 'str')"
             ),
         ),
+        pytest.param(
+            {"auto_schedule_priorities": {"f": "high"}},
+            TypeError,
+            (
+                "Unexpected type for keyword argument 'auto_schedule_priorities' "
+                "(expected 'Optional[Dict[str, int]]', got 'dict')"
+            ),
+        ),
+        pytest.param(
+            {"bounds_measurement_batch_size": 0},
+            ValueError,
+            "Expected bounds_measurement_batch_size to be positive but it's 0",
+        ),
+        pytest.param(
+            {"bounds_measurement_workers": -1},
+            ValueError,
+            "Expected bounds_measurement_workers to be positive but it's -1",
+        ),
     ],
 )
 def test_configuration_bad_fork(kwargs, expected_error, expected_message):
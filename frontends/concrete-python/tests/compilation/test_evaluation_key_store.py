@@ -0,0 +1,104 @@
+"""
+Tests of `EvaluationKeyStore` class.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from concrete import fhe
+from concrete.fhe.compilation.evaluation_keys import EvaluationKeys
+
+
+def test_evaluation_key_store(helpers, tmp_path):
+    """
+    Test serving many clients within a memory budget.
+    """
+
+    @fhe.compiler({"x": "encrypted"})
+    def f(x):
+        return x**2
+
+    inputset = range(10)
+    circuit = f.compile(inputset, helpers.configuration())
+    server = circuit.server
+
+    clients = {}
+    for identifier in ["alice", "bob", "carol"]:
+        clients[identifier] = fhe.Client(server.client_specs)
+        clients[identifier].keys.generate()
+
+    size_of_evaluation_keys = server.size_of_bootstrap_keys + server.size_of_keyswitch_keys
+    assert size_of_evaluation_keys > 0
+
+    store = fhe.EvaluationKeyStore(server, tmp_path, memory_budget=2 * size_of_evaluation_keys)
+    assert store.size_of_evaluation_keys == size_of_evaluation_keys
+
+    for identifier, client in clients.items():
+        store.add(identifier, client.evaluation_keys)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "alice.keys",
+        "bob.keys",
+        "carol.keys",
+    ]
+    assert store.statistics() == {
+        "hits": 0,
+        "misses": 0,
+        "evictions": 1,
+        "resident": 2,
+        "memory": 2 * size_of_evaluation_keys,
+    }
+
+    for identifier in ["carol", "alice", "bob", "carol"]:
+        client = clients[identifier]
+        result = store.run(identifier, client.encrypt(5))
+        assert client.decrypt(result) == 25
+
+    # carol is a hit, then alice, bob and carol are misses, each evicting the least recently used
+    statistics = store.statistics()
+    assert statistics["hits"] == 1
+    assert statistics["misses"] == 3
+    assert statistics["evictions"] == 4
+    assert statistics["resident"] == 2
+
+    store.remove("carol")
+    assert not (tmp_path / "carol.keys").exists()
+
+    with pytest.raises(ValueError) as excinfo:
+        store.get("carol")
+
+    helpers.check_str("Evaluation keys of 'carol' are not in the store", str(excinfo.value))
+
+    with pytest.raises(ValueError) as excinfo:
+        store.get("../carol")
+
+    helpers.check_str(
+        "Expected identifier to be a valid file name but it's '../carol'",
+        str(excinfo.value),
+    )
+
+
+def test_evaluation_key_store_removal_during_loading(tmp_path, monkeypatch):
+    """
+    Test removing evaluation keys of a client while they are being loaded.
+    """
+
+    server = SimpleNamespace(size_of_bootstrap_keys=1, size_of_keyswitch_keys=1)
+    store = fhe.EvaluationKeyStore(server, tmp_path, memory_budget=10)
+
+    (tmp_path / "alice.keys").write_bytes(b"")
+    loaded_evaluation_keys = object()
+
+    def deserialize(path):
+        assert path == tmp_path / "alice.keys"
+        store.remove("alice")
+        return loaded_evaluation_keys
+
+    monkeypatch.setattr(EvaluationKeys, "deserialize", staticmethod(deserialize))
+
+    assert store.get("alice") is loaded_evaluation_keys
+    assert store.statistics()["resident"] == 0
+
+    with pytest.raises(ValueError):
+        store.get("alice")
@@ -130,6 +130,56 @@ def test_keys_bad_seed(helpers):
         client1.keys.generate(encryption_seed=-1)
     assert str(excinfo.value) == "encryption_seed must be a positive 128 bits integer"
 
+    with pytest.raises(ValueError) as excinfo:
+        client1.keys.generate(threads=0)
+    assert str(excinfo.value) == "threads must be a positive integer"
+
+
+def test_keys_generate_concurrently(helpers):
+    """
+    Test generating keys on many threads with progress reporting.
+    """
+
+    @fhe.compiler({"x": "encrypted", "y": "encrypted"})
+    def f(x, y):
+        return (x**2) + (y // 3)
+
+    inputset = [(x, y) for x in range(10) for y in range(40)]
+    configuration = helpers.configuration().fork(
+        use_insecure_key_cache=False,
+        parameter_selection_strategy=fhe.ParameterSelectionStrategy.MULTI,
+    )
+
+    circuit = f.compile(inputset, configuration)
+    server = circuit.server
+
+    default = fhe.Client(server.client_specs)
+    default.keys.generate(secret_seed=42, encryption_seed=24)
+
+    sequential = fhe.Client(server.client_specs)
+    sequential.keys.generate(secret_seed=42, encryption_seed=24, threads=1)
+
+    # keys are generated on 1 thread by default, and they stay the same as before
+    assert default.keys.serialize() == sequential.keys.serialize()
+
+    two_threads = fhe.Client(server.client_specs)
+    two_threads.keys.generate(secret_seed=42, encryption_seed=24, threads=2)
+
+    reports = []
+    concurrent = fhe.Client(server.client_specs)
+    concurrent.keys.generate(
+        secret_seed=42,
+        encryption_seed=24,
+        threads=4,
+        progress=lambda generated, total: reports.append((generated, total)),
+    )
+
+    # keys generated concurrently don't depend on the number of threads
+    assert two_threads.keys.serialize() == concurrent.keys.serialize()
+
+    total = reports[-1][1]
+    assert reports == [(generated, total) for generated in range(1, total + 1)]
+
 
 def test_keys_serialize_deserialize(helpers):
     """
@@ -157,6 +207,46 @@ def test_keys_serialize_deserialize(helpers):
     assert client2.decrypt(evaluation) == 25
 
 
+def test_evaluation_keys_serialize_deserialize(helpers):
+    """
+    Test serializing and deserializing evaluation keys from files and buffers.
+    """
+
+    @fhe.compiler({"x": "encrypted"})
+    def f(x):
+        return x**2
+
+    inputset = range(10)
+
+    circuit = f.compile(inputset, helpers.configuration())
+    circuit.keygen()
+
+    sample = circuit.encrypt(5)
+    serialized_evaluation_keys = circuit.client.evaluation_keys.serialize()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        evaluation_keys_path = Path(tmp_dir) / "evaluation_keys"
+        circuit.client.evaluation_keys.serialize_to_file(evaluation_keys_path)
+
+        with open(evaluation_keys_path, "rb") as file:
+            assert file.read() == serialized_evaluation_keys
+
+        for buffer in [
+            evaluation_keys_path,
+            serialized_evaluation_keys,
+            # buffers which are not aligned are read correctly as well
+            memoryview(b"\x00" + serialized_evaluation_keys)[1:],
+        ]:
+            evaluation_keys = fhe.EvaluationKeys.deserialize(buffer)  # type: ignore
+            evaluation = circuit.server.run(sample, evaluation_keys=evaluation_keys)
+            assert circuit.decrypt(evaluation) == 25
+
+    # buffers which are not contiguous are rejected instead of being read out of their bounds
+    strided = memoryview(bytes(serialized_evaluation_keys) * 2)[::2]
+    with pytest.raises(ValueError, match="Expected a contiguous buffer"):
+        fhe.EvaluationKeys.deserialize(strided)  # type: ignore
+
+
 def test_keys_serialize_before_generation(helpers):
     """
     Test serialization of keys before their generation.
@@ -2,9 +2,10 @@
 Tests of everything related to modules.
 """
 
+import asyncio
 import inspect
 import tempfile
-from concurrent.futures import Future
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Awaitable
 
@@ -636,6 +637,20 @@ def test_simulate_encrypt_run_decrypt(helpers):
     assert module.dec.simulation_runtime.initialized
     assert isinstance(encrypted_result, int)
 
+    # simulation doesn't block the event loop, as it runs in the executor
+    class CountingExecutor(ThreadPoolExecutor):
+        submitted = 0
+
+        def submit(self, fn, /, *args, **kwargs):
+            self.submitted += 1
+            return super().submit(fn, *args, **kwargs)
+
+    with CountingExecutor(1) as executor:
+        result = asyncio.run(module.dec.run_coro(encrypted_result, executor=executor))
+        assert executor.submitted == 1
+
+    assert module.dec.decrypt(result) == 9
+
 
 def test_non_composable_due_to_increasing_noise():
     """
@@ -1037,3 +1052,59 @@ def test_run_auto_schedule():
 
     result = module.inc.decrypt(b)
     assert result == sample_x
+
+
+def test_run_auto_schedule_with_full_queue():
+    """
+    Test chaining evaluations with `auto_schedule_run=True` while the queue of evaluations is full.
+    """
+
+    conf = fhe.Configuration(
+        auto_schedule_run=True,
+        auto_schedule_max_workers=1,
+        auto_schedule_max_queue_depth=1,
+    )
+    module = IncDec.Module.compile(IncDec.to_compile, conf)
+
+    sample_x = 2
+    encrypted_x = module.inc.encrypt(sample_x)
+
+    # chained evaluations are submitted when their arguments are ready,
+    # which waits for the queue to have room without blocking the other chains
+    chains = [module.dec.run(module.inc.run(encrypted_x)) for _ in range(4)]
+    for chain in chains:
+        assert module.inc.decrypt(chain) == sample_x
+
+
+def test_run_coro():
+    """
+    Test `run_coro` with coroutines and futures as arguments, and with a timeout.
+    """
+
+    module = IncDec.Module.compile(IncDec.to_compile)
+
+    sample_x = 2
+    encrypted_x = module.inc.encrypt(sample_x)
+
+    async def chain():
+        a = module.inc.run_coro(encrypted_x)
+        b = module.inc.run_async(encrypted_x)
+        c = await module.dec.run_coro(a)
+        d = await module.dec.run_coro(b, timeout=60)
+        return c, d
+
+    c, d = asyncio.run(chain())
+    assert isinstance(c, type(encrypted_x))
+    assert isinstance(d, type(encrypted_x))
+
+    assert module.inc.decrypt(c) == sample_x
+    assert module.inc.decrypt(d) == sample_x
+
+    async def never():
+        await asyncio.Event().wait()
+
+    async def timeout():
+        await module.inc.run_coro(never(), timeout=0.1)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(timeout())
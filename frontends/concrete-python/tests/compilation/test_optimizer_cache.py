@@ -0,0 +1,75 @@
+"""
+Tests of `OptimizerCache` class.
+"""
+
+from concrete import fhe
+from concrete.fhe.compilation.configuration import ParameterSelectionStrategy
+from concrete.fhe.compilation.optimizer_cache import OptimizerCache
+
+
+def test_optimizer_cache_normalize():
+    """
+    Test removing the contents of lookup tables from mlir.
+    """
+
+    mlir = """
+
+module {
+  func.func @f(%arg0: tensor<2x!FHE.eint<2>>) -> tensor<2x!FHE.eint<6>> {
+    %cst = arith.constant dense<[0, 1, 4, 9]> : tensor<4xi64>
+    %cst_0 = arith.constant dense<[1, 2]> : tensor<2xi3>
+    %0 = "FHELinalg.apply_lookup_table"(%arg0, %cst) : (tensor<2x!FHE.eint<2>>, tensor<4xi64>) -> tensor<2x!FHE.eint<6>>
+    %1 = "FHELinalg.mul_eint_int"(%0, %cst_0) : (tensor<2x!FHE.eint<6>>, tensor<2xi3>) -> tensor<2x!FHE.eint<6>>
+    return %1 : tensor<2x!FHE.eint<6>>
+  }
+}
+
+    """  # noqa: E501
+
+    expected = """
+
+module {
+  func.func @f(%arg0: tensor<2x!FHE.eint<2>>) -> tensor<2x!FHE.eint<6>> {
+    %cst = arith.constant dense<...> : tensor<4xi64>
+    %cst_0 = arith.constant dense<[1, 2]> : tensor<2xi3>
+    %0 = "FHELinalg.apply_lookup_table"(%arg0, %cst) : (tensor<2x!FHE.eint<2>>, tensor<4xi64>) -> tensor<2x!FHE.eint<6>>
+    %1 = "FHELinalg.mul_eint_int"(%0, %cst_0) : (tensor<2x!FHE.eint<6>>, tensor<2xi3>) -> tensor<2x!FHE.eint<6>>
+    return %1 : tensor<2x!FHE.eint<6>>
+  }
+}
+
+    """  # noqa: E501
+
+    assert OptimizerCache.normalize(mlir) == expected.strip()
+    assert OptimizerCache.normalize(expected) == expected.strip()
+
+
+def test_optimizer_cache_hit(helpers, tmp_path):
+    """
+    Test compiling functions which only differ in their lookup tables with the optimizer cache.
+    """
+
+    configuration = helpers.configuration().fork(
+        optimizer_cache_location=tmp_path,
+        parameter_selection_strategy=ParameterSelectionStrategy.MULTI,
+    )
+
+    def f(x):
+        return (x * 3) % 7
+
+    def g(x):
+        return (x * 3) % 5
+
+    OptimizerCache.reset_statistics()
+
+    fhe.Compiler(f, {"x": "encrypted"}).compile(range(10), configuration)
+    assert OptimizerCache.statistics()["hits"] == 0
+    assert len(list(tmp_path.iterdir())) == 1
+
+    circuit = fhe.Compiler(g, {"x": "encrypted"}).compile(range(10), configuration)
+    assert OptimizerCache.statistics()["hits"] == 1
+    assert OptimizerCache.statistics()["rejections"] == 0
+    assert len(list(tmp_path.iterdir())) == 1
+
+    for sample in [0, 5, 9]:
+        assert circuit.encrypt_run_decrypt(sample) == g(sample)
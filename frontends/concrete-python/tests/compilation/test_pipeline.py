@@ -0,0 +1,134 @@
+"""
+Tests of `Pipeline` class.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from concrete import fhe
+
+
+@fhe.module()
+class Module:
+    @fhe.function({"x": "encrypted"})
+    def inc(x):
+        return (x + 1) % 16
+
+    @fhe.function({"x": "encrypted", "y": "encrypted"})
+    def add_sub(x, y):
+        return (x + y) % 16, (x - y) % 16
+
+    @fhe.function({"x": "clear"})
+    def constant(x):
+        return fhe.zero() + x
+
+    composition = fhe.Wired(
+        {
+            fhe.Wire(fhe.AllOutputs(inc), fhe.AllInputs(add_sub)),
+            fhe.Wire(fhe.AllOutputs(add_sub), fhe.Input(inc, 0)),
+            fhe.Wire(fhe.AllOutputs(constant), fhe.Input(add_sub, 1)),
+        }
+    )
+
+
+def compile_module(helpers):
+    """
+    Compile the module of the tests.
+    """
+
+    inputset = list(range(16))
+    return Module.compile(
+        {
+            "inc": inputset,
+            "add_sub": [(x, y) for x in inputset for y in inputset],
+            "constant": inputset,
+        },
+        helpers.configuration(),
+    )
+
+
+@pytest.mark.parametrize("concurrent", [False, True])
+def test_pipeline(concurrent, helpers):
+    """
+    Test evaluating a pipeline, in order and concurrently.
+    """
+
+    module = compile_module(helpers)
+
+    pipeline = module.pipeline()
+
+    x = pipeline.input()
+    y = pipeline.input()
+
+    a = pipeline.call("inc", x)
+    b = pipeline.call("inc", y)
+    c = pipeline.call("add_sub", a, b)
+    d = pipeline.call("add_sub", c[0], pipeline.call("constant", 3))
+    e = pipeline.call("inc", d[1])
+
+    pipeline.output(c, e)
+
+    executor = ThreadPoolExecutor(max_workers=2) if concurrent else None
+    for sample_x, sample_y in [(3, 4), (10, 2)]:
+        results = pipeline.run(
+            module.inc.encrypt(sample_x),
+            module.inc.encrypt(sample_y),
+            executor=executor,
+        )
+        assert len(results) == 3
+
+        added, subtracted = module.add_sub.decrypt(results[0], results[1])
+        last = module.inc.decrypt(results[2])
+
+        expected_added = ((sample_x + 1) + (sample_y + 1)) % 16
+        assert added == expected_added
+        assert subtracted == ((sample_x + 1) - (sample_y + 1)) % 16
+        assert last == ((expected_added - 3) % 16 + 1) % 16
+
+
+def test_pipeline_bad_wiring(helpers):
+    """
+    Test adding invocations which are not allowed by the composition rules of the module.
+    """
+
+    module = compile_module(helpers)
+
+    pipeline = module.pipeline()
+
+    x = pipeline.input()
+    a = pipeline.call("inc", x)
+    b = pipeline.call("add_sub", a, a)
+
+    with pytest.raises(ValueError) as excinfo:
+        pipeline.call("inc", a)
+
+    helpers.check_str(
+        "Expected output 0 of 'inc' to be composable with input 0 of 'inc'",
+        str(excinfo.value),
+    )
+
+    with pytest.raises(ValueError) as excinfo:
+        pipeline.call("inc", b)
+
+    helpers.check_str(
+        "Expected argument 0 to be a single output "
+        "but 'add_sub' has 2 outputs (use `node[i]` to select one)",
+        str(excinfo.value),
+    )
+
+    with pytest.raises(ValueError) as excinfo:
+        pipeline.call("add_sub", a)
+
+    helpers.check_str(
+        "Expected 2 arguments for 'add_sub' but got 1",
+        str(excinfo.value),
+    )
+
+    with pytest.raises(ValueError) as excinfo:
+        pipeline.run(module.inc.encrypt(1))
+
+    helpers.check_str(
+        "Expected the pipeline to have at least one output",
+        str(excinfo.value),
+    )
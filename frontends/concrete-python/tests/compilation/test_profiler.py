@@ -0,0 +1,98 @@
+"""
+Tests of `CompilationProfiler` class.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from concrete.fhe.compilation.profiler import CompilationProfiler
+
+
+def test_profiler_summary():
+    """
+    Test `summary` method of `CompilationProfiler` class.
+    """
+
+    profiler = CompilationProfiler()
+
+    for function in ["f", "g"]:
+        with profiler.stage("tracing", function):
+            pass
+
+    with profiler.stage("processing"):
+        with profiler.stage("processing.AssignBitWidths"):
+            pass
+        for function in ["f", "g"]:
+            with profiler.stage("processing.ProcessRounding", function):
+                pass
+
+    with pytest.raises(RuntimeError), profiler.stage("compilation"):
+        raise RuntimeError
+
+    summary = profiler.summary()
+
+    assert list(summary["stages"]) == [
+        "tracing",
+        "processing",
+        "processing.AssignBitWidths",
+        "processing.ProcessRounding",
+        "compilation",
+    ]
+    assert {name: list(stages) for name, stages in summary["functions"].items()} == {
+        "f": ["tracing", "processing.ProcessRounding"],
+        "g": ["tracing", "processing.ProcessRounding"],
+    }
+    assert set(summary["stages"]["compilation"]) == {
+        "duration_ms",
+        "peak_memory_mb",
+        "peak_memory_increase_mb",
+    }
+
+    assert summary["stages"]["tracing"]["duration_ms"] == pytest.approx(
+        summary["functions"]["f"]["tracing"]["duration_ms"]
+        + summary["functions"]["g"]["tracing"]["duration_ms"]
+    )
+    assert summary["duration_ms"] == pytest.approx(
+        summary["stages"]["tracing"]["duration_ms"]
+        + summary["stages"]["processing"]["duration_ms"]
+        + summary["stages"]["compilation"]["duration_ms"]
+    )
+    assert summary["peak_memory_mb"] > 0
+
+
+def test_profiler_chrome_trace():
+    """
+    Test `export_chrome_trace` method of `CompilationProfiler` class.
+    """
+
+    profiler = CompilationProfiler()
+
+    with profiler.stage("processing"), profiler.stage("processing.CheckIntegerOnly", "f"):
+        pass
+    with profiler.stage("mlir-generation", "f"):
+        pass
+
+    with tempfile.TemporaryDirectory() as path:
+        trace_path = Path(path) / "trace.json"
+        profiler.export_chrome_trace(trace_path)
+
+        with open(trace_path, encoding="utf-8") as file:
+            trace = json.load(file)
+
+    events = trace["traceEvents"]
+    assert [event["name"] for event in events] == [
+        "processing",
+        "processing.CheckIntegerOnly",
+        "mlir-generation",
+    ]
+    assert all(event["ph"] == "X" and event["cat"] == "compilation" for event in events)
+
+    parent, child, _ = events
+    assert parent["ts"] <= child["ts"]
+    assert child["ts"] + child["dur"] <= parent["ts"] + parent["dur"]
+
+    assert "function" not in parent["args"]
+    assert child["args"]["function"] == "f"
@@ -0,0 +1,142 @@
+"""
+Tests of `Scheduler` class.
+"""
+
+import threading
+import time
+
+import pytest
+
+from concrete import fhe
+from concrete.fhe.compilation import Scheduler
+
+
+def test_scheduler_priorities_and_turns():
+    """
+    Test order of evaluations with priorities and functions taking turns.
+    """
+
+    scheduler = Scheduler(max_workers=1, priorities={"urgent": 1})
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def block():
+        started.set()
+        release.wait()
+
+    order = []
+
+    scheduler.submit_for("f", block)
+    started.wait()
+
+    futures = [scheduler.submit_for("f", order.append, f"f{i}") for i in range(3)]
+    futures += [scheduler.submit_for("g", order.append, f"g{i}") for i in range(2)]
+    futures += [scheduler.submit_for("urgent", order.append, "urgent")]
+
+    assert scheduler.statistics()["queue_depth"] == 6
+
+    release.set()
+    for future in futures:
+        future.result()
+
+    assert order == ["urgent", "f0", "g0", "f1", "g1", "f2"]
+
+    statistics = scheduler.statistics()
+    assert statistics["submitted"] == 7
+    assert statistics["completed"] == 7
+    assert statistics["running"] == 0
+    assert statistics["queue_depth"] == 0
+    assert statistics["max_queue_depth"] == 6
+    assert statistics["max_wait_time"] > 0
+    assert statistics["total_wait_time"] >= statistics["max_wait_time"]
+
+    scheduler.shutdown()
+
+
+def test_scheduler_full_queue():
+    """
+    Test rejecting and blocking when the queue is full.
+    """
+
+    release = threading.Event()
+
+    rejecting = Scheduler(max_workers=1, max_queue_depth=1, reject_when_full=True)
+    rejecting.submit(release.wait)
+    while rejecting.statistics()["running"] != 1:
+        time.sleep(0.001)
+    rejecting.submit(release.wait)
+
+    with pytest.raises(RuntimeError) as excinfo:
+        rejecting.submit(release.wait)
+
+    assert str(excinfo.value) == (
+        "Cannot schedule the evaluation as 1 evaluations are already waiting"
+    )
+    assert rejecting.statistics()["rejected"] == 1
+
+    blocking = Scheduler(max_workers=1, max_queue_depth=1)
+    blocking.submit(release.wait)
+    while blocking.statistics()["running"] != 1:
+        time.sleep(0.001)
+    blocking.submit(release.wait)
+
+    submitted = threading.Event()
+
+    def submit():
+        blocking.submit(release.wait)
+        submitted.set()
+
+    thread = threading.Thread(target=submit)
+    thread.start()
+
+    assert not submitted.wait(0.1)
+    release.set()
+    assert submitted.wait(10)
+
+    thread.join()
+    rejecting.shutdown()
+    blocking.shutdown()
+
+    assert blocking.statistics()["completed"] == 3
+
+    with pytest.raises(RuntimeError) as excinfo:
+        blocking.submit(release.wait)
+
+    assert str(excinfo.value) == "Cannot schedule new evaluations after shutdown"
+
+
+def test_scheduler_of_module(helpers):
+    """
+    Test scheduling evaluations of a module with `auto_schedule_run=True`.
+    """
+
+    @fhe.module()
+    class Module:
+        @fhe.function({"x": "encrypted"})
+        def inc(x):
+            return fhe.refresh(x + 1)
+
+        @fhe.function({"x": "encrypted"})
+        def dec(x):
+            return fhe.refresh(x - 1)
+
+    configuration = helpers.configuration().fork(
+        auto_schedule_run=True,
+        auto_schedule_max_workers=2,
+        auto_schedule_max_queue_depth=4,
+        auto_schedule_priorities={"dec": 1},
+    )
+
+    inputset = list(range(1, 15))
+    module = Module.compile({"inc": inputset, "dec": inputset}, configuration)
+
+    assert module.scheduler is not None
+    assert module.scheduler.max_workers == 2
+
+    results = [module.dec.run(module.inc.run(module.inc.encrypt(x))) for x in range(1, 9)]
+    assert [module.inc.decrypt(result) for result in results] == list(range(1, 9))
+
+    statistics = module.scheduler.statistics()
+    assert statistics["submitted"] == 16
+    assert statistics["max_queue_depth"] <= 4
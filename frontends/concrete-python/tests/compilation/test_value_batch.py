@@ -0,0 +1,143 @@
+"""
+Tests of `ValueBatch` class.
+"""
+
+import io
+
+import numpy as np
+import pytest
+
+from concrete import fhe
+from concrete.fhe.compilation.value_batch import MAGIC, PREAMBLE, VERSION
+
+
+def test_value_batch(helpers, tmp_path):
+    """
+    Test sending batches of encrypted arguments in one buffer.
+    """
+
+    @fhe.compiler({"x": "encrypted", "y": "encrypted"})
+    def f(x, y):
+        return x + y
+
+    inputset = [(np.random.randint(0, 10, size=(3,)), np.random.randint(0, 10)) for _ in range(10)]
+    circuit = f.compile(inputset, helpers.configuration())
+
+    samples = [([1, 2, 3], 4), ([5, 6, 7], 0), ([0, 0, 0], 9)]
+    batch = [circuit.encrypt(x, y) for x, y in samples]
+
+    serialized = fhe.ValueBatch.serialize(batch, function_name="f")
+
+    path = tmp_path / "batch"
+    with open(path, "wb") as file:
+        assert fhe.ValueBatch.write(file, batch, function_name="f") == len(serialized)
+
+    for deserialized in [fhe.ValueBatch.from_buffer(serialized), fhe.ValueBatch.load(path)]:
+        assert deserialized.function_name == "f"
+        assert len(deserialized) == len(samples)
+
+        # samples can be accessed in any order
+        for index in [2, 0, 1]:
+            result = circuit.run(*deserialized[index])
+            assert np.array_equal(
+                circuit.decrypt(result), np.array(samples[index][0]) + samples[index][1]
+            )
+
+    streamed = list(fhe.ValueBatch.stream(io.BytesIO(serialized)))
+    assert len(streamed) == len(samples)
+    for (x, y), arguments in zip(samples, streamed):
+        assert np.array_equal(circuit.decrypt(circuit.run(*arguments)), np.array(x) + y)
+
+    # a single tuple of values is wrapped as a batch of one sample, and missing values are kept
+    x_only = circuit.encrypt([1, 2, 3], None)
+    single = fhe.ValueBatch.from_buffer(fhe.ValueBatch.serialize([x_only]))
+    assert single.function_name is None
+    assert len(single) == 1
+    assert single[0][1] is None
+
+    # values are samples of functions with a single argument
+    x_values = [x for x, _ in batch]
+    unary = fhe.ValueBatch.from_buffer(fhe.ValueBatch.serialize(x_values))
+    assert len(unary) == len(samples)
+    assert all(len(sample) == 1 for sample in unary)
+
+    with pytest.raises(ValueError) as excinfo:
+        fhe.ValueBatch.from_buffer(bytes(64))
+
+    helpers.check_str("Expected a serialized batch of values", str(excinfo.value))
+
+    with pytest.raises(ValueError) as excinfo:
+        list(fhe.ValueBatch.stream(io.BytesIO(serialized[:-1])))
+
+    helpers.check_str(
+        "Expected a serialized batch of values but it ended unexpectedly",
+        str(excinfo.value),
+    )
+
+
+def test_value_batch_invalid_header(helpers):
+    """
+    Test reading batches with an invalid header.
+    """
+
+    def header(samples, entries):
+        arities = np.array(samples, dtype=np.uint64)
+        entries_array = np.array(entries, dtype=np.uint64).reshape(-1, 4)
+        return (
+            PREAMBLE.pack(MAGIC, VERSION, 0, len(arities), len(entries_array))
+            + arities.tobytes()
+            + entries_array.tobytes()
+        )
+
+    with pytest.raises(ValueError) as excinfo:
+        fhe.ValueBatch.from_buffer(MAGIC)
+
+    helpers.check_str(
+        "Expected a serialized batch of values but the header is incomplete",
+        str(excinfo.value),
+    )
+
+    empty = fhe.ValueBatch.from_buffer(header([0, 2], []))
+    assert [tuple(sample) for sample in empty] == [(), (None, None)]
+
+    header_size = len(header([1], [[0, 0, 0, 0]]))
+    invalid_headers = [
+        # sample out of range
+        header([1], [[1, 0, header_size, 1]]),
+        # position out of range
+        header([1], [[0, 1, header_size, 1]]),
+        # value within the header
+        header([1], [[0, 0, 0, 1]]),
+        # overlapping values
+        header([2], [[0, 0, header_size + 8, 16], [0, 1, header_size + 16, 1]]),
+        # unsorted positions
+        header([2], [[0, 1, header_size + 8, 1], [0, 0, header_size + 16, 1]]),
+        # overflowing size
+        header([1], [[0, 0, header_size, np.iinfo(np.uint64).max]]),
+    ]
+    for invalid_header in invalid_headers:
+        with pytest.raises(ValueError) as excinfo:
+            fhe.ValueBatch.from_buffer(invalid_header + bytes(64))
+
+        helpers.check_str(
+            "Expected a serialized batch of values but the header is invalid",
+            str(excinfo.value),
+        )
+
+    with pytest.raises(ValueError) as excinfo:
+        fhe.ValueBatch.from_buffer(header([1], [[0, 0, header_size, 64]]))
+
+    helpers.check_str(
+        "Expected a serialized batch of values but it ended unexpectedly",
+        str(excinfo.value),
+    )
+
+    # sizes of the header come from the stream, so they are not trusted before they are read
+    huge = PREAMBLE.pack(MAGIC, VERSION, 0, 2**60, 2**60)
+    with pytest.raises(ValueError) as excinfo:
+        list(fhe.ValueBatch.stream(io.BytesIO(huge + bytes(64))))
+
+    helpers.check_str(
+        "Expected a serialized batch of values but it ended unexpectedly",
+        str(excinfo.value),
+    )
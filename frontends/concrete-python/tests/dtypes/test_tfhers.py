@@ -53,6 +53,47 @@ def test_tfhers_encode_ndarray():
     assert encoded.shape == shape + (8,)
 
 
+@pytest.mark.parametrize(
+    "partial_dtype,value,expected_encoding",
+    [
+        pytest.param(tfhers.uint8_2_2, 0b10_01_11_00, [0b00, 0b11, 0b01, 0b10]),
+        pytest.param(tfhers.int8_2_2, 0b01_01_11_00, [0b00, 0b11, 0b01, 0b01]),
+        pytest.param(tfhers.int8_2_2, -1, [0b11, 0b11, 0b11, 0b11]),
+        pytest.param(tfhers.int8_2_2, -128, [0b00, 0b00, 0b00, 0b10]),
+        pytest.param(tfhers.int16_2_2, -2, [0b10] + [0b11] * 7),
+    ],
+)
+def test_tfhers_encode_decode_scalar(partial_dtype, value, expected_encoding):
+    """Test scalar encoding and decoding"""
+    dtype = parameterize_partial_dtype(partial_dtype)
+
+    encoded = dtype.encode(value)
+    assert np.array_equal(encoded, expected_encoding)
+
+    decoded = dtype.decode(encoded)
+    assert isinstance(decoded, int)
+    assert decoded == value
+
+
+@pytest.mark.parametrize(
+    "partial_dtype",
+    [tfhers.int8_2_2, tfhers.uint8_2_2, tfhers.int16_2_2, tfhers.uint16_2_2],
+)
+def test_tfhers_encode_decode_signed_and_unsigned_ndarray(partial_dtype):
+    """Test ndarray encoding and decoding of the whole range of the type"""
+    dtype = parameterize_partial_dtype(partial_dtype)
+    value = np.arange(dtype.min(), dtype.max() + 1).reshape((-1, 4))
+
+    encoded = dtype.encode(value)
+    assert encoded.shape == value.shape + (dtype.bit_width // dtype.msg_width,)
+    assert np.all((encoded >= 0) & (encoded < 2**dtype.msg_width))
+
+    for index in np.ndindex(value.shape):
+        assert np.array_equal(encoded[index], dtype.encode(int(value[index])))
+
+    assert np.array_equal(dtype.decode(encoded), value)
+
+
 def test_tfhers_bad_decode():
     """Test decoding of bad values"""
     dtype = parameterize_partial_dtype(tfhers.uint8_2_2)
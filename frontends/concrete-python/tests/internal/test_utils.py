@@ -2,9 +2,12 @@
 Tests of utilities related to the entire project.
 """
 
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from concrete.fhe.internal.utils import assert_that, unreachable
+from concrete.fhe.internal.utils import assert_that, lazy_import, unreachable
 
 
 def test_assert_that():
@@ -27,3 +30,32 @@ def test_unreachable():
         unreachable()
 
     assert str(excinfo.value) == "Entered unreachable code"
+
+
+def test_lazy_import(tmp_path, monkeypatch):
+    """
+    Test `lazy_import` function loads the module once when it's used from multiple threads.
+    """
+
+    (tmp_path / "lazily_imported.py").write_text(
+        "import time\n" "LOADS = [None]\n" "time.sleep(0.1)\n" "VALUE = 42\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "lazily_imported", raising=False)
+
+    module = lazy_import("lazily_imported")
+    assert "lazily_imported" not in sys.modules
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        values = list(executor.map(lambda _: module.VALUE, range(8)))
+
+    assert values == [42] * 8
+    assert sys.modules["lazily_imported"].LOADS == [None]
+    assert lazy_import("lazily_imported") is sys.modules["lazily_imported"]
+
+    monkeypatch.delitem(sys.modules, "lazily_imported")
+
+    with pytest.raises(ModuleNotFoundError) as excinfo:
+        lazy_import("not_a_module_that_exists")
+
+    assert str(excinfo.value) == "No module named 'not_a_module_that_exists'"
@@ -0,0 +1,118 @@
+"""
+Tests of `BitWidthSolver` class.
+"""
+
+import random
+
+import pytest
+
+from concrete.fhe.mlir.bit_width_solver import BitWidthSolver
+
+
+def test_bit_width_solver_equalities_and_lower_bounds():
+    """
+    Test solving a system of equalities and lower bounds without z3.
+    """
+
+    solver = BitWidthSolver()
+
+    maximum = solver.variable("f.max", minimize=False)
+    a, b, c, d, e = (solver.variable(f"f.%{i}") for i in range(5))
+
+    solver.add(a >= 3)
+    solver.add(b >= 7)
+    solver.add(c >= 2)
+    solver.add(d > 4)
+    solver.add(e >= b)
+    solver.add(d == b)
+    solver.add(b == c)
+    solver.add(5 <= a)
+    for variable in [a, b, c, d, e]:
+        solver.add(maximum >= variable)
+
+    assert solver.variable("f.%0") is a
+    assert [str(constraint) for constraint in solver.constraints[:8]] == [
+        "f.%0 >= 3",
+        "f.%1 >= 7",
+        "f.%2 >= 2",
+        "f.%3 > 4",
+        "f.%4 >= f.%1",
+        "f.%3 == f.%1",
+        "f.%1 == f.%2",
+        "f.%0 >= 5",
+    ]
+
+    assert solver.solve() == {
+        "f.max": 7,
+        "f.%0": 5,
+        "f.%1": 7,
+        "f.%2": 7,
+        "f.%3": 7,
+        "f.%4": 7,
+    }
+
+
+def test_bit_width_solver_propagation_through_classes():
+    """
+    Test propagating lower bounds between classes of equal bit-widths, in any order.
+    """
+
+    solver = BitWidthSolver()
+    x = [solver.variable(f"x{i}") for i in range(6)]
+
+    solver.add(x[0] >= x[5])
+    solver.add(x[1] == x[0])
+    solver.add(x[2] > x[1])
+    solver.add(x[2] <= x[4])
+    solver.add(x[3] == x[4])
+    solver.add(x[5] >= 4)
+    solver.add(x[3] >= x[1])
+
+    assert solver.solve() == {
+        "x0": 4,
+        "x1": 4,
+        "x2": 5,
+        "x3": 5,
+        "x4": 5,
+        "x5": 4,
+    }
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_bit_width_solver_matches_z3(seed):
+    """
+    Test solving random systems without z3 gives the same bit-widths as solving them with z3.
+    """
+
+    generator = random.Random(seed)
+
+    solver = BitWidthSolver()
+    x = [solver.variable(f"x{i}") for i in range(30)]
+
+    for variable in x:
+        solver.add(variable >= generator.randint(1, 16))
+
+    for _ in range(40):
+        first, second = generator.sample(x, 2)
+        if generator.random() < 0.5:
+            solver.add(first == second)
+        else:
+            solver.add(first >= second)
+
+    assert solver.solve() == solver.solve_with_z3()
+
+
+def test_bit_width_solver_falls_back_to_z3():
+    """
+    Test solving a system with an upper bound, which is only supported by z3.
+    """
+
+    solver = BitWidthSolver()
+    a = solver.variable("a")
+    b = solver.variable("b")
+
+    solver.add(a >= 3)
+    solver.add(b >= a)
+    solver.add(b <= 5)
+
+    assert solver.solve() == {"a": 3, "b": 3}
@@ -4,6 +4,7 @@ Tests of `Graph` class.
 
 import os
 import re
+import threading
 
 import numpy as np
 import pytest
@@ -498,3 +499,172 @@ def test_graph_inputs_outputs_count(
 
     assert graph.inputs_count == expected_inputs_count
     assert graph.outputs_count == expected_outputs_count
+
+
+@pytest.mark.parametrize(
+    "function,inputset",
+    [
+        pytest.param(
+            lambda x: np.sin(x * 2 + 1).astype(np.int64) * 3,
+            range(64),
+            id="subgraph",
+        ),
+        pytest.param(
+            lambda x: x + np.array([1, 2, 3]),
+            range(16),
+            id="broadcasting",
+        ),
+        pytest.param(
+            lambda x: (x @ np.array([[1, 2], [3, 4]])) + 1,
+            [np.random.randint(0, 8, size=(3, 2)) for _ in range(100)],
+            id="matmul",
+        ),
+        pytest.param(
+            lambda x: np.sum(x) - x,
+            [np.random.randint(0, 8, size=(3,), dtype=np.uint8) for _ in range(100)],
+            id="sum-uint8",
+        ),
+        pytest.param(
+            lambda x: x + 200,
+            [np.uint8(i) for i in range(100)],
+            id="scalar-uint8",
+        ),
+        pytest.param(
+            lambda x: x + 1,
+            [True, False, 3, np.int8(4), 5],
+            id="mixed-types",
+        ),
+    ],
+)
+def test_graph_measure_bounds_batched(function, inputset, helpers):
+    """
+    Test `measure_bounds` method of `Graph` class with batches of samples.
+    """
+
+    configuration = helpers.configuration()
+
+    compiler = fhe.Compiler(function, {"x": "encrypted"})
+    graph = compiler.trace(inputset, configuration)
+
+    expected = graph.measure_bounds(inputset, batch_size=1)
+    actual = graph.measure_bounds(inputset, batch_size=16)
+
+    assert actual.keys() == expected.keys()
+    for node, bounds in expected.items():
+        for bound, value in bounds.items():
+            assert type(actual[node][bound]) is type(value)
+            assert actual[node][bound] == value
+
+
+def test_graph_measure_bounds_batched_failure(helpers):
+    """
+    Test `measure_bounds` method of `Graph` class with batches of samples and a failing sample.
+    """
+
+    configuration = helpers.configuration()
+
+    compiler = fhe.Compiler(lambda x: np.sqrt(x).astype(np.int64), {"x": "encrypted"})
+    graph = compiler.trace(range(10), configuration)
+
+    with pytest.raises(RuntimeError) as excinfo:
+        graph.measure_bounds([1, 2, 3, -1, 5], batch_size=4)
+
+    assert str(excinfo.value) == "Bound measurement using inputset[3] failed"
+
+
+def test_graph_execution_plan(helpers):
+    """
+    Test `execution_plan` property of `Graph` class.
+    """
+
+    configuration = helpers.configuration()
+
+    compiler = fhe.Compiler(lambda x: (x + 1) * 2, {"x": "encrypted"})
+    graph = compiler.trace(range(10), configuration)
+
+    plan = graph.execution_plan
+    assert graph.execution_plan is plan
+    assert graph(3) == 8
+
+    add = graph.query_nodes(operation_filter="add")[0]
+    multiply = graph.query_nodes(operation_filter="multiply")[0]
+
+    # rewire the graph to compute (x + 1) * (x + 1)
+    constant = next(pred for pred in graph.ordered_preds_of(multiply) if pred is not add)
+    graph.graph.remove_node(constant)
+    graph.graph.add_edge(add, multiply, input_idx=1)
+
+    assert graph.execution_plan is not plan
+    assert graph(3) == 16
+
+
+def test_graph_evaluate_does_not_share_mutated_values(helpers):
+    """
+    Test `evaluate` method of `Graph` class with nodes modifying their arguments in place.
+    """
+
+    def function(x):
+        y = x + 1
+        z = np.sum(y)
+        y[0] = 0
+        return y, z
+
+    configuration = helpers.configuration()
+
+    compiler = fhe.Compiler(function, {"x": "encrypted"})
+    graph = compiler.trace([np.array([1, 2, 3])], configuration)
+
+    sample = np.array([1, 2, 3])
+    evaluation = graph.evaluate(sample)
+
+    add = graph.query_nodes(operation_filter="add")[0]
+    assert np.array_equal(evaluation[add], [2, 3, 4])
+    assert np.array_equal(sample, [1, 2, 3])
+
+    y, z = graph(sample)
+    assert np.array_equal(y, [0, 3, 4])
+    assert z == 9
+
+
+def test_graph_measure_bounds_in_multiple_processes(helpers):
+    """
+    Test `measure_bounds` method of `Graph` class with multiple worker processes.
+    """
+
+    configuration = helpers.configuration()
+
+    compiler = fhe.Compiler(lambda x: np.sqrt(x * 2 + 1).astype(np.int64) - x, {"x": "encrypted"})
+    inputset = [np.random.randint(0, 2**6, size=(3,)) for _ in range(100)]
+    graph = compiler.trace(inputset, configuration)
+
+    expected = graph.measure_bounds(inputset)
+    actual = graph.measure_bounds(inputset, batch_size=4, workers=2)
+
+    assert list(actual.keys()) == list(expected.keys())
+    for node, bounds in expected.items():
+        for bound, value in bounds.items():
+            assert type(actual[node][bound]) is type(value)
+            assert actual[node][bound] == value
+
+    with pytest.raises(RuntimeError) as excinfo:
+        graph.measure_bounds([*inputset[:50], np.array([1, -1, 1])], batch_size=4, workers=2)
+
+    assert str(excinfo.value) == "Bound measurement using inputset[50] failed"
+
+    # processes are not forked while other threads are running, as it could deadlock
+    stop = threading.Event()
+    thread = threading.Thread(target=stop.wait)
+    thread.start()
+    try:
+        with pytest.warns(RuntimeWarning, match="instead of 2 worker processes"):
+            actual = graph.measure_bounds(inputset, batch_size=4, workers=2)
+    finally:
+        stop.set()
+        thread.join()
+
+    assert actual == expected
+
+    with pytest.raises(ValueError) as excinfo:
+        graph.measure_bounds(inputset, batch_size=0)
+
+    assert str(excinfo.value) == "Expected batch_size to be positive but it's 0"
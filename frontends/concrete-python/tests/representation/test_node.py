@@ -510,3 +510,92 @@ def test_node_label(node, expected_result):
     """
 
     assert node.label() == expected_result
+
+
+@pytest.mark.parametrize(
+    "node,args,stacked,is_supported",
+    [
+        pytest.param(
+            Node.generic(
+                name="add",
+                inputs=[
+                    EncryptedTensor(UnsignedInteger(4), shape=(2,)),
+                    ClearTensor(UnsignedInteger(2), shape=(3, 2)),
+                ],
+                output=EncryptedTensor(UnsignedInteger(5), shape=(3, 2)),
+                operation=np.add,
+            ),
+            [np.array([[1, 2], [3, 4], [5, 6], [7, 8]]), np.array([[0, 1], [2, 3], [1, 1]])],
+            [True, False],
+            True,
+            id="ufunc",
+        ),
+        pytest.param(
+            Node.generic(
+                name="f",
+                inputs=[EncryptedTensor(UnsignedInteger(4), shape=(2,))],
+                output=EncryptedTensor(UnsignedInteger(4), shape=(2,)),
+                operation=lambda x: (x * 3) % 7,
+            ),
+            [np.array([[1, 2], [3, 4], [5, 6], [7, 8]])],
+            [True],
+            False,
+            id="univariate",
+        ),
+        pytest.param(
+            Node.generic(
+                name="f",
+                inputs=[EncryptedTensor(UnsignedInteger(4), shape=(2,))],
+                output=EncryptedTensor(UnsignedInteger(4), shape=(2,)),
+                operation=lambda x: np.sort(x, axis=0),
+            ),
+            # sorting along the stacked axis gives the correct first and last samples
+            [np.array([[1, 2], [5, 3], [4, 6], [7, 8]])],
+            [True],
+            False,
+            id="univariate-which-is-correct-on-first-and-last-samples",
+        ),
+        pytest.param(
+            Node.generic(
+                name="f",
+                inputs=[EncryptedTensor(UnsignedInteger(4), shape=(2,))],
+                output=EncryptedTensor(UnsignedInteger(4), shape=(2,)),
+                operation=lambda x: x - x.min(),
+            ),
+            [np.array([[1, 2], [3, 4], [5, 6], [7, 8]])],
+            [True],
+            False,
+            id="univariate-which-is-not-elementwise",
+        ),
+        pytest.param(
+            Node.generic(
+                name="sum",
+                inputs=[EncryptedTensor(UnsignedInteger(4), shape=(2,))],
+                output=EncryptedScalar(UnsignedInteger(5)),
+                operation=np.sum,
+            ),
+            [np.array([[1, 2], [3, 4], [5, 6], [7, 8]])],
+            [True],
+            False,
+            id="sum",
+        ),
+    ],
+)
+def test_node_evaluate_stacked(node, args, stacked, is_supported):
+    """
+    Test `evaluate_stacked` method of `Node` class.
+    """
+
+    size = len(args[stacked.index(True)])
+    result = node.evaluate_stacked(size, args, stacked)
+
+    if not is_supported:
+        assert result is None
+        return
+
+    assert result is not None
+    assert result.shape == (size, *node.output.shape)
+
+    for index in range(size):
+        sample = [arg[index] if is_stacked else arg for arg, is_stacked in zip(args, stacked)]
+        assert np.array_equal(result[index], node(*sample))
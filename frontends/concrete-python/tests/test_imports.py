@@ -0,0 +1,83 @@
+"""
+Tests of imports of `concrete.fhe`.
+"""
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize("module", ["torch", "z3", "scipy", "networkx"])
+def test_import_does_not_load_heavy_dependencies(module):
+    """
+    Test importing `concrete.fhe` doesn't load dependencies which are only needed for compilation.
+    """
+
+    code = f"""
+import sys
+
+import concrete.fhe
+
+loaded = [name for name in sys.modules if name.split(".")[0] == "{module}"]
+assert not loaded, loaded
+    """
+
+    process = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert process.returncode == 0, process.stderr
+
+
+def test_client_import_does_not_load_frontend():
+    """
+    Test importing `concrete.fhe.client` doesn't load the parts of the frontend used to compile.
+    """
+
+    code = """
+import sys
+
+from concrete.fhe.client import Client, ClientSpecs, EvaluationKeys, Keys, Value
+
+frontend = [
+    "concrete.fhe.compilation.compiler",
+    "concrete.fhe.compilation.server",
+    "concrete.fhe.extensions",
+    "concrete.fhe.mlir",
+    "concrete.fhe.representation",
+    "concrete.fhe.tracing",
+    "concrete.lang",
+    "mlir.ir",
+]
+loaded = [name for name in frontend if name in sys.modules]
+assert not loaded, loaded
+    """
+
+    process = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert process.returncode == 0, process.stderr
+
+
+@pytest.mark.parametrize("package", ["concrete.fhe", "concrete.fhe.compilation"])
+def test_star_import(package):
+    """
+    Test star imports of packages with lazy exports import all of their exports.
+    """
+
+    namespace: dict = {}
+    exec(f"from {package} import *", namespace)  # noqa: S102  # pylint: disable=exec-used
+
+    exports = importlib.import_module(f"{package}.exports")
+    expected = {name for name in vars(exports) if not name.startswith("_")}
+
+    assert set(importlib.import_module(package).__all__) == expected
+    assert {name for name in namespace if not name.startswith("_")} == expected
+    assert all(namespace[name] is getattr(exports, name) for name in expected)